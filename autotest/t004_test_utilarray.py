@@ -41,6 +41,20 @@ def test_load_txt_free():
     np.testing.assert_equal(fa, a)
     assert fa.dtype == a.dtype
 
+    # reading stops at the line with the last item
+    a = np.array([3, 3, 3, 7, 8, 9], np.int32)
+    fp = StringIO(u'3*3 7\n8 9\nNEXT\n')
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, '(FREE)')
+    np.testing.assert_equal(fa, a)
+    assert fa.dtype == a.dtype
+    assert fp.readline() == 'NEXT\n'
+    fp = StringIO(u'1 2 3 4 5 6.0\n')
+    try:
+        Util2d.load_txt(a.shape, fp, a.dtype, '(FREE)')
+        raise AssertionError('ValueError not raised')
+    except ValueError as e:
+        assert "'6.0'" in str(e)
+
 
 def test_load_txt_fixed():
     a = np.arange(10, dtype=np.int32).reshape((2, 5))
@@ -72,6 +86,58 @@ def test_load_txt_fixed():
     np.testing.assert_equal(fa, a)
     assert fa.dtype == a.dtype
 
+    # blank fields are skipped and reading stops after the last item
+    a = np.array([1.5, 2.5, 3.5, 4.5, 5.5], np.float32)
+    fp = StringIO(dedent(u'''\
+            1.5           2.5
+            3.5    4.5    5.5    6.5
+        NEXT
+    '''))
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, '(3F7.2)')
+    np.testing.assert_equal(fa, a)
+    assert fa.dtype == a.dtype
+    assert fp.readline() == 'NEXT\n'
+
+    # invalid items raise the same error as float() or int()
+    fp = StringIO(u'  1.0  2.0  3.0\n 1.0D\n')
+    try:
+        Util2d.load_txt((4,), fp, np.float32, '(3F5.0)')
+        raise AssertionError('ValueError not raised')
+    except ValueError as e:
+        assert "'1.0D'" in str(e)
+    fp = StringIO(u'  1  2  3\n 4.\n')
+    try:
+        Util2d.load_txt((4,), fp, np.int32, '(3I3)')
+        raise AssertionError('ValueError not raised')
+    except ValueError as e:
+        assert "'4.'" in str(e)
+
+
+def test_array2string():
+    a = np.arange(1, 8, dtype=np.int32).reshape((1, 7))
+    s = Util2d.array2string(a.shape, a, '(3I2)')
+    assert s == ' 1 2 3\n 4 5 6\n 7\n'
+    s = Util2d.array2string(a.shape, a, '(7I2)')
+    assert s == ' 1 2 3 4 5 6 7\n'
+    s = Util2d.array2string((7,), a[0], python_format=[10, '{0:3d}'])
+    assert s == '  1  2  3  4  5  6  7\n'
+    # the first value of a row stays on the first line if there is one
+    # value per line
+    a = np.array([[1.5, 2.5, 3.5], [4.5, 5.5, 6.5]], dtype=np.float32)
+    s = Util2d.array2string(a.shape, a, '(1F4.1)')
+    assert s == ' 1.5 2.5\n 3.5\n 4.5 5.5\n 6.5\n'
+
+    # write_txt streams the same text to the file
+    fname = os.path.join(out_dir, 'array2string.dat')
+    Util2d.write_txt(a.shape, fname, a, '(2E10.3)')
+    with open(fname) as f:
+        assert f.read() == Util2d.array2string(a.shape, a, '(2E10.3)')
+    try:
+        Util2d.array2string(a.shape, a, '(3I4)')
+        raise AssertionError('Exception not raised')
+    except Exception as e:
+        assert 'at r,c [0,0]' in str(e)
+
 
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
@@ -753,6 +819,81 @@ def test_mflist():
 
 
 
+def test_mflist_write_transient():
+    ml = flopy.modflow.Modflow('mflist_write', model_ws=out_dir)
+    dis = flopy.modflow.ModflowDis(ml, nlay=2, nrow=10, ncol=10, nper=4)
+    ra = flopy.modflow.ModflowWel.get_empty(3)
+    ra['k'] = 1
+    ra['i'] = [0, 4, 9]
+    ra['j'] = 2
+    ra['flux'] = [0.1, 1. / 3., -1e-5]
+    rb = ra.copy()
+    rb['flux'] *= 2.
+    sp_data = {0: ra, 1: ra, 2: rb, 3: rb.copy()}
+    wel = flopy.modflow.ModflowWel(ml, stress_period_data=sp_data)
+    ml.write_input()
+
+    # identical stress periods are written as reuse flags
+    with open(os.path.join(out_dir, 'mflist_write.wel')) as f:
+        lines = f.readlines()
+    itmps = [int(line.split()[0]) for line in lines if 'stress period' in line]
+    assert itmps == [3, -1, 3, -1]
+    assert lines[3].split() == ['2', '1', '3', '0.1']
+    assert lines[4].split() == ['2', '5', '3', '0.33333334']
+
+    ml2 = flopy.modflow.Modflow.load('mflist_write.nam', model_ws=out_dir)
+    for kper, data in sp_data.items():
+        assert np.array_equal(ml2.wel.stress_period_data[kper], data)
+
+    # fixed format and external binary files give the same data
+    for free, binary in ((False, False), (True, True)):
+        ml = flopy.modflow.Modflow('mflist_write', model_ws=out_dir,
+                                   external_path='ref' if binary else None)
+        ml.array_free_format = free
+        dis = flopy.modflow.ModflowDis(ml, nlay=2, nrow=10, ncol=10, nper=4)
+        bas = flopy.modflow.ModflowBas(ml, ifrefm=free)
+        wel = flopy.modflow.ModflowWel(ml, stress_period_data=sp_data,
+                                       binary=binary)
+        ml.write_input()
+        ml2 = flopy.modflow.Modflow.load('mflist_write.nam',
+                                         model_ws=out_dir)
+        for kper, data in sp_data.items():
+            assert np.allclose(ml2.wel.stress_period_data[kper].tolist(),
+                               data.tolist())
+
+
+def test_mflist_write_transient_hash_collision():
+    # stress periods with the same hash are only reused if the data are
+    # also equal
+    from flopy.utils.util_list import MfList
+    ml = flopy.modflow.Modflow('mflist_hash', model_ws=out_dir)
+    dis = flopy.modflow.ModflowDis(ml, nlay=1, nrow=10, ncol=10, nper=3)
+    bas = flopy.modflow.ModflowBas(ml)
+    ra = flopy.modflow.ModflowWel.get_empty(2)
+    ra['i'] = [1, 2]
+    ra['j'] = 3
+    ra['flux'] = [-1., -2.]
+    rb = ra.copy()
+    rb['flux'] = [-3., -4.]
+    sp_data = {0: ra, 1: rb, 2: rb.copy()}
+    wel = flopy.modflow.ModflowWel(ml, stress_period_data=sp_data)
+
+    hash_data = MfList._MfList__hash_data
+    MfList._MfList__hash_data = staticmethod(lambda data: 'collision')
+    try:
+        ml.write_input()
+    finally:
+        MfList._MfList__hash_data = staticmethod(hash_data)
+
+    with open(os.path.join(out_dir, 'mflist_hash.wel')) as f:
+        lines = f.readlines()
+    itmps = [int(line.split()[0]) for line in lines if 'stress period' in line]
+    assert itmps == [2, 2, -1]
+    ml2 = flopy.modflow.Modflow.load('mflist_hash.nam', model_ws=out_dir)
+    for kper, data in sp_data.items():
+        assert np.array_equal(ml2.wel.stress_period_data[kper], data)
+
+
 def test_how():
     import numpy as np
     import flopy
@@ -1183,6 +1183,127 @@ def test_get_vertices():
     assert np.array_equal(a1, a2)
 
 
+def test_modelgrid_geometry():
+    from flopy.discretization import StructuredGrid, VertexGrid
+    delr = np.array([10., 20., 30.])
+    delc = np.array([5., 15.])
+    top = np.full((2, 3), 10.)
+    botm = np.array([np.full((2, 3), 4.), np.full((2, 3), 0.)])
+    mg = StructuredGrid(delc=delc, delr=delr, top=top, botm=botm,
+                        xoff=100., yoff=50., angrot=30.)
+
+    # cached arrays are read-only views, not copies
+    xc = mg.xcellcenters
+    assert not xc.flags.writeable
+    try:
+        xc[0, 0] = 0.
+        raise AssertionError('cached cell centers can be changed')
+    except ValueError:
+        pass
+    assert np.shares_memory(mg.xcellcenters, mg.xcellcenters)
+
+    areas = np.outer(delc, delr)
+    assert np.allclose(mg.areas, areas)
+    assert np.allclose(mg.thick, [np.full((2, 3), 6.), np.full((2, 3), 4.)])
+    assert np.allclose(mg.volumes, mg.thick * areas)
+    extents = mg.cell_extents
+    assert extents.shape == (2, 3, 4)
+    assert np.isclose(extents[..., 0].min(), mg.extent[0])
+    assert np.isclose(extents[..., 3].max(), mg.extent[3])
+
+    # face normals of the north face follow the grid rotation
+    normals = mg.face_normals
+    assert normals.shape == (2, 3, 4, 2)
+    angrot = mg.angrot_radians
+    assert np.allclose(normals[:, :, 0], [-np.sin(angrot), np.cos(angrot)])
+    assert np.allclose(normals[:, :, 1], [np.cos(angrot), np.sin(angrot)])
+
+    # the cache is updated after the coordinate info or botm changes
+    mg.set_coord_info(angrot=0.)
+    assert np.allclose(mg.face_normals[:, :, 0], [0., 1.])
+    assert np.allclose(mg.areas, areas)
+    botm[1] = -4.
+    mg.botm = botm
+    assert np.allclose(mg.thick[1], 8.)
+    assert np.allclose(mg.volumes[1], 8. * areas)
+
+    # vertex grid with a square and a triangle
+    vertices = [[0, 0., 0.], [1, 0., 1.], [2, 1., 1.], [3, 1., 0.],
+                [4, 0.5, 2.]]
+    cell2d = [[0, 0.5, 0.5, 4, 0, 1, 2, 3], [1, 0.5, 1.3, 3, 1, 4, 2]]
+    vg = VertexGrid(vertices=vertices, cell2d=cell2d,
+                    top=np.array([1., 1.]), botm=np.array([[0., -1.]]))
+    assert np.allclose(vg.areas, [1., 0.5])
+    assert np.allclose(vg.volumes, [[1., 1.]])
+    assert np.allclose(vg.cell_extents[1], [0., 1., 1., 2.])
+    normals = vg.face_normals
+    assert np.allclose(normals[0], [[-1., 0.], [0., 1.], [1., 0.],
+                                    [0., -1.]])
+    assert np.allclose(normals[1, 2], [0., -1.])
+    assert np.all(np.isnan(normals[1, 3]))
+
+
+def test_modelgrid_connectivity():
+    from flopy.discretization import StructuredGrid, VertexGrid
+    nlay, nrow, ncol = 3, 4, 5
+    delr = np.arange(1., ncol + 1)
+    delc = np.arange(2., nrow + 2)
+    top = np.full((nrow, ncol), 10.)
+    botm = np.array([np.full((nrow, ncol), z) for z in (7., 3., 0.)])
+    mg = StructuredGrid(delc=delc, delr=delr, top=top, botm=botm,
+                        xoff=3., yoff=4., angrot=25.)
+    connectivity = mg.connectivity
+
+    # compare with the six neighbors of every cell
+    ia = [0]
+    ja = []
+    for k in range(nlay):
+        for i in range(nrow):
+            for j in range(ncol):
+                for dk, di, dj in ((-1, 0, 0), (0, -1, 0), (0, 0, -1),
+                                   (0, 0, 1), (0, 1, 0), (1, 0, 0)):
+                    kk, ii, jj = k + dk, i + di, j + dj
+                    if 0 <= kk < nlay and 0 <= ii < nrow and 0 <= jj < ncol:
+                        ja.append(kk * nrow * ncol + ii * ncol + jj)
+                ia.append(len(ja))
+    assert np.array_equal(connectivity['ia'], ia)
+    assert np.array_equal(connectivity['ja'], ja)
+    assert np.array_equal(mg.neighbors(0), [1, 5, 20])
+    assert len(mg.neighbors()) == nlay * nrow * ncol
+
+    # connections of cell 0 to the next column, the next row and the cell
+    # below
+    assert np.array_equal(connectivity['ihc'][:3], [1, 1, 0])
+    assert np.allclose(connectivity['cl12'][:3], [0.5, 1., 1.5])
+    assert np.allclose(connectivity['hwva'][:3], [2., 1., 2.])
+    assert np.allclose(connectivity['area'][:3], [6., 3., 2.])
+    assert np.allclose(connectivity['angldegx'][:3], [0., 270., 0.])
+    angrot = mg.angrot_radians
+    assert np.allclose(connectivity['normal'][:3],
+                       [[np.cos(angrot), np.sin(angrot), 0.],
+                        [np.sin(angrot), -np.cos(angrot), 0.],
+                        [0., 0., -1.]])
+
+    # the same grid as a vertex grid
+    xv, yv = np.meshgrid(np.concatenate(([0.], np.cumsum(delr))),
+                         np.concatenate(([delc.sum()],
+                                         delc.sum() - np.cumsum(delc))))
+    xv, yv = xv.ravel(), yv.ravel()
+    vertices = [[iv, x, y] for iv, (x, y) in enumerate(zip(xv, yv))]
+    cell2d = []
+    for i in range(nrow):
+        for j in range(ncol):
+            iv1 = i * (ncol + 1) + j
+            iverts = [iv1, iv1 + 1, iv1 + ncol + 2, iv1 + ncol + 1]
+            cell2d.append([i * ncol + j, xv[iverts].mean(),
+                           yv[iverts].mean(), 4] + iverts)
+    vg = VertexGrid(vertices=vertices, cell2d=cell2d, top=top.ravel(),
+                    botm=botm.reshape(nlay, -1), xoff=3., yoff=4.,
+                    angrot=25.)
+    for key, value in vg.connectivity.items():
+        assert np.allclose(value, connectivity[key]), key
+
+
 def test_vertex_model_dot_plot():
     # load up the vertex example problem
     sim_name = "mfsim.nam"
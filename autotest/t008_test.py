@@ -65,6 +65,117 @@ def test_modflow_loadonly():
     return
 
 
+def test_modflow_load_nworkers():
+    # packages loaded on several threads are added to the model in name
+    # file order, so the model is the same as a model loaded serially
+    def model_lists(m):
+        return (m.get_package_list(), m.package_units, m.output_fnames,
+                m.output_units, m.output_binflag, m.external_fnames,
+                m.external_units, m.external_binflag, m.pop_key_list)
+
+    for namfile in namfiles:
+        m = flopy.modflow.Modflow.load(namfile, model_ws=pth,
+                                       version='mf2005', check=False)
+        m2 = flopy.modflow.Modflow.load(namfile, model_ws=pth,
+                                        version='mf2005', check=False,
+                                        nworkers=4)
+        assert m2.load_fail is False
+        assert model_lists(m) == model_lists(m2), \
+            'parallel load of {} differs from serial load'.format(namfile)
+    return
+
+
+def test_modflow_load_nworkers_fixed_format():
+    # the free format flag set by bas6 is used by the packages that are
+    # loaded on threads, the bas6 load is delayed so that a package loaded
+    # before bas6 would be read as free format
+    import shutil
+    import time
+    import numpy as np
+    fpth = os.path.join(tpth, 'twri_fixed')
+    if os.path.isdir(fpth):
+        shutil.rmtree(fpth)
+    os.makedirs(fpth)
+    for f in os.listdir(pth):
+        if f.startswith('twri.'):
+            shutil.copy(os.path.join(pth, f), fpth)
+    # the well row and column and the pumping rate touch in fixed format
+    fname = os.path.join(fpth, 'twri.wel')
+    with open(fname) as f:
+        lines = f.readlines()
+    lines[3] = '{:10d}{:10d}{:10d}{:10.3E}\n'.format(2, 4, 11, -5.)
+    with open(fname, 'w') as f:
+        f.writelines(lines)
+
+    bas_load = flopy.modflow.ModflowBas.load
+
+    def delayed_load(*args, **kwargs):
+        time.sleep(0.5)
+        return bas_load(*args, **kwargs)
+
+    m = flopy.modflow.Modflow.load('twri.nam', model_ws=fpth, check=False)
+    flopy.modflow.ModflowBas.load = staticmethod(delayed_load)
+    try:
+        m2 = flopy.modflow.Modflow.load('twri.nam', model_ws=fpth,
+                                        check=False, nworkers=4)
+    finally:
+        flopy.modflow.ModflowBas.load = staticmethod(bas_load)
+    assert m2.free_format_input is False
+    for mf in (m, m2):
+        wel = mf.wel.stress_period_data[0]
+        assert tuple(wel[1])[:4] == (1, 3, 10, -5.)
+    assert np.array_equal(m.wel.stress_period_data[0],
+                          m2.wel.stress_period_data[0])
+    return
+
+
+def test_modflow_load_nworkers_shared_unit():
+    # lpf and rch read their arrays from the same data file, the lpf load
+    # is delayed so that rch would read the lpf arrays if the data file was
+    # read concurrently
+    import time
+    import numpy as np
+    fpth = os.path.join(tpth, 'shared_unit')
+    if not os.path.isdir(fpth):
+        os.makedirs(fpth)
+    files = {'shared.nam': ['LIST 2 shared.list', 'DIS 11 shared.dis',
+                            'BAS6 13 shared.bas', 'LPF 15 shared.lpf',
+                            'RCH 19 shared.rch', 'DATA 50 shared.dat'],
+             'shared.dis': ['1 2 3 1 4 2', '0', 'CONSTANT 1.0',
+                            'CONSTANT 1.0', 'CONSTANT 10.0', 'CONSTANT 0.0',
+                            '1.0 1 1.0 SS'],
+             'shared.bas': ['FREE', 'CONSTANT 1', '-999.0', 'CONSTANT 5.0'],
+             'shared.lpf': ['53 -1.0E+30 0', '0', '0', '1.0', '0', '0',
+                            'EXTERNAL 50 1.0 (FREE) -1',
+                            'EXTERNAL 50 1.0 (FREE) -1'],
+             'shared.rch': ['3 0', '1', 'EXTERNAL 50 1.0 (FREE) -1'],
+             'shared.dat': ['1 2 3 4 5 6', '11 12 13 14 15 16',
+                            '0.1 0.2 0.3 0.4 0.5 0.6']}
+    for fname, lines in files.items():
+        with open(os.path.join(fpth, fname), 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    lpf_load = flopy.modflow.ModflowLpf.load
+
+    def delayed_load(*args, **kwargs):
+        time.sleep(0.5)
+        return lpf_load(*args, **kwargs)
+
+    m = flopy.modflow.Modflow.load('shared.nam', model_ws=fpth, check=False)
+    flopy.modflow.ModflowLpf.load = staticmethod(delayed_load)
+    try:
+        m2 = flopy.modflow.Modflow.load('shared.nam', model_ws=fpth,
+                                        check=False, nworkers=4)
+    finally:
+        flopy.modflow.ModflowLpf.load = staticmethod(lpf_load)
+    for mf in (m, m2):
+        assert np.array_equal(mf.lpf.hk.array.ravel(), np.arange(1., 7.))
+        assert np.array_equal(mf.lpf.vka.array.ravel(), np.arange(11., 17.))
+        assert np.allclose(mf.rch.rech.array.ravel(),
+                           np.arange(0.1, 0.65, 0.1))
+    return
+
+
 def test_nwt_load():
     for nwt_file in nwt_files:
         yield load_nwt, nwt_file
@@ -136,6 +247,9 @@ if __name__ == '__main__':
         load_model(namfile)
     for namfile in namfiles:
         load_only_bas6_model(namfile)
+    test_modflow_load_nworkers()
+    test_modflow_load_nworkers_fixed_format()
+    test_modflow_load_nworkers_shared_unit()
     for fnwt in nwt_nam:
         load_nwt_model(fnwt)
     for fnwt in nwt_files:
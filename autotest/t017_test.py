@@ -136,6 +136,223 @@ def test_cellbudgetfile_read():
     return
 
 
+def test_binaryfile_mmap():
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6',
+                            'test005_advgw_tidal', 'expected_output',
+                            'AdvGW_tidal_unch.hds')
+    h = flopy.utils.HeadFile(hds_path)
+    hm = flopy.utils.HeadFile(hds_path, mmap=True)
+    assert hm.nlay == 3, 'nlay != 3'
+    for kstpkper in hm.get_kstpkper()[:10]:
+        d0 = h.get_data(kstpkper=kstpkper)
+        d1 = hm.get_data(kstpkper=kstpkper)
+        assert np.array_equal(d0, d1), \
+            'memory mapped head read != head read from file'
+        assert not d1.flags.writeable, 'memory mapped head is writeable'
+    d0 = h.get_data(totim=h.times[-1], mflay=2)
+    d1 = hm.get_data(totim=hm.times[-1], mflay=2)
+    assert np.array_equal(d0, d1), \
+        'memory mapped layer read != layer read from file'
+    assert np.array_equal(h.get_alldata(), hm.get_alldata())
+    h.close()
+    hm.close()
+
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    vm = flopy.utils.CellBudgetFile(cbc_fname, mmap=True)
+    for record in v.get_unique_record_names():
+        t0 = v.get_data(text=record)
+        t1 = vm.get_data(text=record)
+        for r0, r1 in zip(t0, t1):
+            if isinstance(r0, list):
+                for a0, a1 in zip(r0, r1):
+                    assert np.array_equal(a0, a1)
+            else:
+                assert np.array_equal(r0, r1), \
+                    'memory mapped budget item {} != budget item read ' \
+                    'from file'.format(record)
+        t0 = v.get_data(text=record, full3D=True)
+        t1 = vm.get_data(text=record, full3D=True)
+        for r0, r1 in zip(t0, t1):
+            assert np.array_equal(r0, r1)
+    v.close()
+    vm.close()
+    return
+
+
+def test_binaryfile_get_ts():
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6',
+                            'test045_lake2tr', 'expected_output',
+                            'lakeex2a_unch.hds')
+    idx = [(0, 0, 0), (4, 26, 16), (2, 10, 3), (0, 13, 8), (2, 1, 15)]
+    for mmap in [False, True]:
+        h = flopy.utils.HeadFile(hds_path, mmap=mmap)
+        alldata = h.get_alldata(nodata=np.nan)
+        ts = h.get_ts(idx)
+        assert ts.shape == (len(h.times), len(idx) + 1)
+        assert np.array_equal(ts[:, 0], np.array(h.times))
+        for istat, (k, i, j) in enumerate(idx):
+            assert np.array_equal(ts[:, istat + 1], alldata[:, k, i, j]), \
+                'time series for cell {} != values from ' \
+                'get_alldata'.format((k, i, j))
+        ts1 = h.get_ts(idx[1])
+        assert np.array_equal(ts1, ts[:, [0, 2]])
+        h.close()
+
+    h = flopy.utils.FormattedHeadFile(
+        os.path.join('..', 'examples', 'data', 'mf2005_test',
+                     'test1tr.githds'))
+    idx = [(0, 7, 5), (0, 0, 0), (0, 14, 9), (0, 3, 2)]
+    ts = h.get_ts(idx)
+    for itim, totim in enumerate(h.get_times()):
+        data = h.get_data(totim=totim)
+        for istat, (k, i, j) in enumerate(idx):
+            assert ts[itim, istat + 1] == data[k, i, j]
+    h.close()
+    return
+
+
+def test_binaryfile_index_cache():
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    fpth = os.path.join(cpth, 'lakeex2a_unch.hds')
+    shutil.copy(os.path.join('..', 'examples', 'data', 'mf6',
+                             'test045_lake2tr', 'expected_output',
+                             'lakeex2a_unch.hds'), fpth)
+    cache_fpth = flopy.utils.binaryfile.get_index_cache_name(fpth)
+    if os.path.isfile(cache_fpth):
+        os.remove(cache_fpth)
+
+    h0 = flopy.utils.HeadFile(fpth)
+    h1 = flopy.utils.HeadFile(fpth, cache_index=True)
+    assert os.path.isfile(cache_fpth), 'index cache file was not written'
+    h2 = flopy.utils.HeadFile(fpth, cache_index=True)
+    for h in [h1, h2]:
+        assert np.array_equal(h0.recordarray, h.recordarray)
+        assert np.array_equal(h0.iposarray, h.iposarray)
+        assert h0.get_times() == h.get_times()
+        assert h0.get_kstpkper() == h.get_kstpkper()
+        assert (h0.nlay, h0.nrow, h0.ncol) == (h.nlay, h.nrow, h.ncol)
+        assert np.array_equal(h0.get_data(idx=10), h.get_data(idx=10))
+        h.close()
+
+    # the index cache is not used if the file has changed
+    with open(cache_fpth, 'rb') as f:
+        cache = np.load(f)
+        arrays = {name: cache[name] for name in cache.files}
+    arrays['iposarray'] = arrays['iposarray'] + 1
+    with open(cache_fpth, 'wb') as f:
+        np.savez(f, **arrays)
+    h = flopy.utils.HeadFile(fpth, cache_index=True)
+    assert not np.array_equal(h0.iposarray, h.iposarray), \
+        'index cache file was not used'
+    h.close()
+    os.utime(fpth, ns=(0, 0))
+    h = flopy.utils.HeadFile(fpth, cache_index=True)
+    assert np.array_equal(h0.iposarray, h.iposarray), \
+        'out of date index cache file was used'
+    h.close()
+    h0.close()
+
+    fpth = os.path.join(cpth, 'test1tr.gitcbc')
+    shutil.copy(os.path.join('..', 'examples', 'data', 'mf2005_test',
+                             'test1tr.gitcbc'), fpth)
+    cache_fpth = flopy.utils.binaryfile.get_index_cache_name(fpth)
+    if os.path.isfile(cache_fpth):
+        os.remove(cache_fpth)
+    v0 = flopy.utils.CellBudgetFile(fpth)
+    v1 = flopy.utils.CellBudgetFile(fpth, cache_index=True)
+    assert os.path.isfile(cache_fpth), 'index cache file was not written'
+    v2 = flopy.utils.CellBudgetFile(fpth, cache_index=True)
+    for v in [v1, v2]:
+        assert np.array_equal(v0.recordarray, v.recordarray)
+        assert np.array_equal(v0.iposheader, v.iposheader)
+        assert np.array_equal(v0.iposarray, v.iposarray)
+        assert v0.get_times() == v.get_times()
+        assert v0.get_kstpkper() == v.get_kstpkper()
+        assert v0.get_unique_record_names() == v.get_unique_record_names()
+        assert v0.imethlist == v.imethlist
+        assert v0.paknamlist == v.paknamlist
+        assert v0.recorddict == v.recorddict
+        t0 = v0.get_data(text='WELLS', full3D=True)
+        t1 = v.get_data(text='WELLS', full3D=True)
+        for a0, a1 in zip(t0, t1):
+            assert np.array_equal(a0, a1)
+        v.close()
+    v0.close()
+    return
+
+
+def test_binaryfile_refresh():
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    src = os.path.join('..', 'examples', 'data', 'mf6', 'test045_lake2tr',
+                       'expected_output', 'lakeex2a_unch.hds')
+    h0 = flopy.utils.HeadFile(src)
+    with open(src, 'rb') as f:
+        b = f.read()
+
+    # write the first time step and part of the second time step
+    fpth = os.path.join(cpth, 'lakeex2a_tail.hds')
+    ipos = h0.iposarray[7] + 100
+    with open(fpth, 'wb') as f:
+        f.write(b[:ipos])
+    h = flopy.utils.HeadFile(fpth, mmap=True)
+    assert h.get_times() == h0.get_times()[:2]
+    assert h.recordarray.shape[0] == 7, 'truncated record was indexed'
+    assert h.refresh() == 0
+
+    # the model writes the rest of the file
+    with open(fpth, 'ab') as f:
+        f.write(b[ipos:])
+    assert h.refresh() == h0.recordarray.shape[0] - 7
+    assert np.array_equal(h.recordarray, h0.recordarray)
+    assert np.array_equal(h.iposarray, h0.iposarray)
+    assert h.get_times() == h0.get_times()
+    assert np.array_equal(h.get_data(idx=10), h0.get_data(idx=10))
+
+    n = 0
+    for kstpkper, totim, data in h.follow(interval=0.01, timeout=0.):
+        assert kstpkper == h0.get_kstpkper()[n]
+        assert totim == h0.get_times()[n]
+        assert np.array_equal(data, h0.get_data(totim=totim))
+        n += 1
+    assert n == len(h0.get_times())
+    h.close()
+    h0.close()
+
+    src = os.path.join('..', 'examples', 'data', 'mf2005_test',
+                       'test1tr.gitcbc')
+    v0 = flopy.utils.CellBudgetFile(src)
+    with open(src, 'rb') as f:
+        b = f.read()
+    fpth = os.path.join(cpth, 'test1tr_tail.gitcbc')
+    for ipos in [v0.iposheader[20] + 10, v0.iposarray[20] + 8]:
+        with open(fpth, 'wb') as f:
+            f.write(b[:ipos])
+        v = flopy.utils.CellBudgetFile(fpth)
+        assert v.get_nrecords() == 20, 'truncated record was indexed'
+        with open(fpth, 'ab') as f:
+            f.write(b[ipos:])
+        assert v.refresh() == v0.get_nrecords() - 20
+        assert np.array_equal(v.recordarray, v0.recordarray)
+        assert np.array_equal(v.iposarray, v0.iposarray)
+        assert v.get_kstpkper() == v0.get_kstpkper()
+        assert v.get_unique_record_names() == v0.get_unique_record_names()
+        n = 0
+        for kstpkper, totim, data in v.follow(text='WELLS', interval=0.01,
+                                              timeout=0.):
+            assert kstpkper == v0.get_kstpkper()[n]
+            d0 = v0.get_data(kstpkper=kstpkper, text='WELLS')
+            assert np.array_equal(data[0], d0[0])
+            n += 1
+        assert n == len(v0.get_kstpkper())
+        v.close()
+    v0.close()
+    return
+
+
 def test_cellbudgetfile_position():
 
     fpth = os.path.join('..', 'examples', 'data', 'zonbud_examples',
@@ -299,6 +516,404 @@ def test_cellbudgetfile_readrecord_waux():
     return
 
 
+def test_cellbudgetfile_create3D():
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    nlay, nrow, ncol = v.nlay, v.nrow, v.ncol
+
+    # list data with duplicate nodes
+    data = np.array([(5, 1.), (17, -2.5), (5, 0.25), (150, 3.), (17, 1.)],
+                    dtype=[('node', np.int32), ('q', np.float32)])
+    a = v.create3D(data, nlay, nrow, ncol)
+    assert isinstance(a, np.ma.MaskedArray)
+    assert a.shape == (nlay, nrow, ncol)
+    expected = {5: 1.25, 17: -1.5, 150: 3.}
+    for node in range(1, nlay * nrow * ncol + 1):
+        k, r = divmod(node - 1, nrow * ncol)
+        i, j = divmod(r, ncol)
+        if node in expected:
+            assert not a.mask[k, i, j]
+            assert a[k, i, j] == expected[node]
+        else:
+            assert a.mask[k, i, j]
+
+    # reuse an output array
+    out = np.ma.zeros((nlay, nrow, ncol), dtype=np.float32)
+    for idx in v.get_indices(text='WELLS')[:3]:
+        t0 = v.get_record(idx, full3D=True)
+        t1 = v.get_record(idx, full3D=True, out=out)
+        assert t1 is out
+        assert np.array_equal(t0.mask, t1.mask)
+        assert np.array_equal(t0.filled(0.), t1.filled(0.))
+    with assert_raises(ValueError):
+        v.get_record(idx, full3D=True, out=np.ma.zeros((1, 1, 1)))
+    v.close()
+    return
+
+
+def test_binaryfile_reduce():
+    fpth = os.path.join('..', 'examples', 'data', 'mf6', 'test045_lake2tr',
+                        'expected_output', 'lakeex2a_unch.hds')
+    h = flopy.utils.HeadFile(fpth)
+    a = h.get_alldata()
+    a1 = a[0].nbytes
+
+    # small chunks force several passes over the file
+    for func, nanfunc in (('max', np.nanmax), ('min', np.nanmin),
+                          ('sum', np.nansum), ('mean', np.nanmean)):
+        r = h.reduce(func, chunk_bytes=a1)
+        assert r.shape == a.shape[1:]
+        assert np.allclose(r, nanfunc(a, axis=0), equal_nan=True), func
+    r = h.reduce('percentile', q=[10, 90], mflay=1, chunk_bytes=a1)
+    assert r.shape == (2,) + a.shape[2:]
+    assert np.allclose(r, np.nanpercentile(a[:, 1], [10, 90], axis=0),
+                       equal_nan=True)
+    with assert_raises(ValueError):
+        h.reduce('median')
+    with assert_raises(ValueError):
+        h.reduce('percentile')
+    with assert_raises(ValueError):
+        h.reduce('max', axis='layer')
+
+    times, chunks = [], []
+    for t, c in h.iter_records(chunk_bytes=3 * a1):
+        assert c.shape[0] <= 3
+        times.append(t)
+        chunks.append(c)
+    assert len(chunks) == int(np.ceil(a.shape[0] / 3.))
+    assert np.allclose(np.concatenate(times), h.get_times())
+    assert np.allclose(np.concatenate(chunks), a, equal_nan=True)
+    h.close()
+
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    recs = np.array([r.filled(np.nan) for r in
+                     v.get_data(text='WELLS', full3D=True)])
+    assert np.allclose(v.reduce('WELLS', 'sum'), np.nansum(recs, axis=0))
+    assert np.allclose(v.reduce('WELLS', 'percentile', q=50, chunk_bytes=64),
+                       np.nanpercentile(recs, 50, axis=0), equal_nan=True)
+    kstpkper = []
+    for kk, c in v.iter_records('WELLS', chunk_bytes=1):
+        assert c.shape == (1, v.nlay, v.nrow, v.ncol)
+        kstpkper += kk
+    assert kstpkper == v.get_kstpkper()
+    v.close()
+    return
+
+
+def test_binaryfile_read_ensemble():
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    src = os.path.join('..', 'examples', 'data', 'mf6', 'test045_lake2tr',
+                       'expected_output', 'lakeex2a_unch.hds')
+    fnames = []
+    for i in range(4):
+        fname = os.path.join(cpth, 'ensemble_{}.hds'.format(i))
+        shutil.copyfile(src, fname)
+        fnames.append(fname)
+
+    idx = [(0, 1, 2), (4, 26, 16), (2, 10, 3)]
+    h = flopy.utils.HeadFile(src)
+    ts = h.get_ts(idx)[:, 1:]
+    for pool in ('thread', 'process'):
+        data, timing = flopy.utils.binaryfile.read_ensemble(
+            fnames, idx, nworkers=2, pool=pool)
+        assert data.shape == (len(fnames),) + ts.shape
+        assert timing.shape == (len(fnames),)
+        for d in data:
+            assert np.allclose(d, ts)
+
+    kstpkper = h.get_kstpkper()[::4]
+    data, timing = flopy.utils.binaryfile.read_ensemble(
+        fnames, idx[0], kstpkper=kstpkper, nworkers=1)
+    assert data.shape == (len(fnames), len(kstpkper), 1)
+    assert np.allclose(data[2, :, 0],
+                       [h.get_data(kstpkper=kk)[idx[0]] for kk in kstpkper])
+    h.close()
+
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    idx = [(0, 0, 0), (0, 5, 5)]
+    data, timing = flopy.utils.binaryfile.read_ensemble(
+        [cbc_fname, cbc_fname], idx, text='STORAGE')
+    assert np.allclose(data[1], v.get_ts(idx, text='STORAGE')[:, 1:])
+    with assert_raises(ValueError):
+        flopy.utils.binaryfile.read_ensemble(
+            [cbc_fname], idx, reader=flopy.utils.CellBudgetFile)
+    v.close()
+    return
+
+
+def test_cellbudgetfile_get_ts():
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    idx = [(k, i, j) for k in range(v.nlay) for i in range(0, v.nrow, 3)
+           for j in range(0, v.ncol, 2)]
+    # repeated cells are returned for each station
+    idx += idx[:3]
+    for text in ('STORAGE', 'FLOW RIGHT FACE', 'WELLS', 'STREAM LEAKAGE'):
+        ts = v.get_ts(idx, text=text)
+        assert ts.shape == (len(v.get_kstpkper()), len(idx) + 1)
+        for itim, kk in enumerate(v.get_kstpkper()):
+            a = v.get_data(kstpkper=kk, text=text, full3D=True)[0]
+            for istat, (k, i, j) in enumerate(idx):
+                # stations without a flow are 0.0
+                if np.ma.is_masked(a[k, i, j]):
+                    assert ts[itim, istat + 1] == 0.
+                else:
+                    assert ts[itim, istat + 1] == a[k, i, j]
+    v.close()
+
+    # imeth 6 list records written by MODFLOW 6
+    cbc_fname = os.path.join('..', 'examples', 'data', 'mf6-freyberg',
+                             'freyberg.cbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname, precision='double')
+    wel = v.get_data(text='WEL')[0]
+    idx = [np.unravel_index(node - 1, (v.nlay, v.nrow, v.ncol))
+           for node in wel['node']]
+    # stations that are not in the list record are 0.0
+    idx += [(0, 0, 0), (0, 0, 0)]
+    ts = v.get_ts(idx, text='WEL')
+    assert np.array_equal(ts[0, 1:-2], wel['q'])
+    assert np.array_equal(ts[0, -2:], [0., 0.])
+    v.close()
+    return
+
+
+def test_lazybinaryarray():
+    from flopy.mf6.utils.binaryfile_utils import LazyBinaryArray
+    fpth = os.path.join('..', 'examples', 'data', 'mf6', 'test045_lake2tr',
+                        'expected_output', 'lakeex2a_unch.hds')
+    h = flopy.utils.HeadFile(fpth)
+    a = h.get_alldata()
+    v = LazyBinaryArray.from_layerfile(h)
+    assert v.shape == a.shape
+    assert len(v) == a.shape[0]
+    assert np.allclose(np.asarray(v), a, equal_nan=True)
+    for index in ((slice(None), 0, 1, slice(None)), -1, ([2, 2, 5], 0),
+                  (slice(2, 8, 3), slice(None), [1, 2], [3, 4]),
+                  (0, slice(None), [1, 2], [3, 4]), (Ellipsis, 2),
+                  np.arange(a.shape[0]) % 2 == 0):
+        assert np.allclose(v[index], a[index], equal_nan=True), index
+
+    # only the selected records are read
+    reads = []
+
+    def get_record(idx):
+        reads.append(idx)
+        return a[idx]
+
+    v = LazyBinaryArray(get_record, a.shape[0])
+    del reads[:]
+    v[-1, 0, 1]
+    assert reads == [a.shape[0] - 1]
+    del reads[:]
+    v[[3, 1, 3]]
+    assert reads == [1, 3]
+    h.close()
+
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    c = flopy.utils.CellBudgetFile(cbc_fname)
+    b = np.array(c.get_data(text='WELLS', full3D=True))
+    v = LazyBinaryArray.from_budget(c, 'WELLS', full3D=True)
+    assert v.shape == b.shape
+    assert np.array_equal(v[:, 0, 2], b[:, 0, 2])
+    c.close()
+    return
+
+
+def test_lazybinaryarray_mfdata():
+    # the simulation output behaves like the numpy array of all records
+    sim_ws = os.path.join('..', 'examples', 'data', 'mf6-freyberg')
+    sim = flopy.mf6.MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    heads = sim.simulation_data.mfdata[('gwf_1', 'HDS', 'HEAD')]
+    h = flopy.utils.HeadFile(os.path.join(sim_ws, 'freyberg.hds'),
+                             precision='double')
+    a = h.get_alldata()
+    a[a == -9999] = np.nan
+    h.close()
+    assert np.allclose(np.nanmax(heads), np.nanmax(a))
+    assert heads.shape == a.shape
+    assert np.array_equal(heads.max(), a.max(), equal_nan=True)
+    assert np.array_equal(heads.mean(), a.mean(), equal_nan=True)
+    assert heads.reshape(a.shape[0], -1).shape == (a.shape[0], a[0].size)
+    assert heads.T.shape == a.T.shape
+    for result, expected in ((heads * 2, a * 2), (heads - 1, a - 1),
+                             (1 - heads, 1 - a), (heads + heads, a + a),
+                             (-heads, -a), (np.sqrt(heads), np.sqrt(a)),
+                             (heads > 20., a > 20.)):
+        assert isinstance(result, np.ndarray)
+        assert np.array_equal(result, expected, equal_nan=True)
+
+    flows = sim.simulation_data.mfdata[('gwf_1', 'CBC', 'FLOW-JA-FACE')]
+    assert np.array_equal((flows * 2)[-1], flows[-1] * 2)
+    assert flows.sum() == np.asarray(flows).sum()
+    return
+
+
+def test_lazybinaryarray_rerun():
+    # the simulation output is read again after the model is rerun
+    src = os.path.join('..', 'examples', 'data', 'mf6-freyberg')
+    sim_ws = os.path.join(cpth, 'freyberg_rerun')
+    if os.path.isdir(sim_ws):
+        shutil.rmtree(sim_ws)
+    shutil.copytree(src, sim_ws)
+    sim = flopy.mf6.MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    fpth = os.path.join(sim_ws, 'freyberg.hds')
+    h = flopy.utils.HeadFile(fpth, precision='double')
+    a = h.get_alldata()
+    h.close()
+    a[a == -9999] = np.nan
+    with sim.simulation_data.mfdata[('gwf_1', 'HDS', 'HEAD')] as heads:
+        assert np.array_equal(heads[-1], a[-1], equal_nan=True)
+
+        # rewrite the head file like a second run with two time steps
+        header = np.dtype([('kstp', '<i4'), ('kper', '<i4'),
+                           ('pertim', '<f8'), ('totim', '<f8'),
+                           ('text', 'S16'), ('ncol', '<i4'),
+                           ('nrow', '<i4'), ('ilay', '<i4')])
+        nrow, ncol = a.shape[-2:]
+        with open(fpth, 'wb') as f:
+            for kstp in (1, 2):
+                np.array([(kstp, 1, 10. * kstp, 10. * kstp,
+                           b'            HEAD', ncol, nrow, 1)],
+                         dtype=header).tofile(f)
+                np.full((nrow, ncol), float(kstp)).tofile(f)
+
+        assert heads.shape == (2,) + a.shape[1:]
+        assert np.all(heads[0] == 1.)
+        assert np.all(heads[-1] == 2.)
+    assert heads._bindata is None
+    return
+
+
+def test_cellbudgetfile_get_residuals():
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    cbc_fname = os.path.join(
+        '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    fname = os.path.join(cpth, 'residuals.npy')
+    res = v.get_residuals(filename=fname, nworkers=2)
+    times = v.get_times()
+    assert res.shape == (len(times),)
+    assert np.allclose(res.totim, times)
+    saved = np.load(fname, mmap_mode='r')
+    assert saved.shape == (len(times), v.nlay, v.nrow, v.ncol)
+    for it, totim in enumerate(times):
+        residual = v.get_residual(totim)
+        assert np.array_equal(saved[it], residual)
+        k, i, j = res.k[it], res.i[it], res.j[it]
+        assert res.max_residual[it] == residual[k, i, j]
+        assert np.abs(residual[k, i, j]) == np.abs(residual).max()
+        scaled = v.get_residual(totim, scaled=True)
+        k, i, j = res.k_scaled[it], res.i_scaled[it], res.j_scaled[it]
+        assert np.isclose(res.max_scaled[it], scaled[k, i, j])
+    del saved
+
+    # serial and threaded results are the same
+    assert np.array_equal(v.get_residuals(), res)
+    v.close()
+    return
+
+
+def test_cellbudgetfile_residuals_imeth4():
+    # 2D (imeth 4) records only hold the flows of layer 1
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    nlay, nrow, ncol = 2, 3, 4
+    h1dt = np.dtype([('kstp', 'i4'), ('kper', 'i4'), ('text', 'a16'),
+                     ('ncol', 'i4'), ('nrow', 'i4'), ('nlay', 'i4')])
+    h2dt = np.dtype([('imeth', 'i4'), ('delt', 'f4'), ('pertim', 'f4'),
+                     ('totim', 'f4')])
+    recharge = np.arange(1., nrow * ncol + 1.,
+                         dtype=np.float32).reshape(nrow, ncol)
+    storage = np.zeros((nlay, nrow, ncol), dtype=np.float32)
+    storage[0] = -recharge
+    fname = os.path.join(cpth, 'imeth4.cbc')
+    with open(fname, 'wb') as f:
+        for text, imeth, flow in (('         STORAGE', 1, storage),
+                                  ('        RECHARGE', 4, recharge)):
+            np.array((1, 1, text, ncol, nrow, -nlay), dtype=h1dt).tofile(f)
+            np.array((imeth, 1., 1., 1.), dtype=h2dt).tofile(f)
+            flow.tofile(f)
+
+    v = flopy.utils.CellBudgetFile(fname, precision='single')
+    assert v.get_record(1).shape == (nrow, ncol)
+    for scaled in (False, True):
+        residual = v.get_residual(1., scaled=scaled)
+        assert residual.shape == (nlay, nrow, ncol)
+        assert np.allclose(residual, 0.)
+    res = v.get_residuals()
+    assert np.allclose(res.max_residual, 0.)
+    assert np.allclose(res.max_scaled, 0.)
+
+    # without the storage flows the residual is the recharge in layer 1
+    residual = np.zeros((nlay, nrow, ncol))
+    inflow = np.zeros((nlay, nrow, ncol))
+    v._add_residual_record(1, residual, inflow)
+    assert np.allclose(residual[0], recharge)
+    assert np.allclose(inflow[0], recharge)
+    assert np.allclose(residual[1], 0.)
+    assert np.allclose(inflow[1], 0.)
+    v.close()
+    return
+
+
+def test_cellbudgetfile_residuals_inflow():
+    # the inflow of a cell includes the face flows from its neighbours and
+    # 2D (imeth 4) records are added to layer 1
+    if not os.path.isdir(cpth):
+        os.makedirs(cpth)
+    nlay, nrow, ncol = 2, 1, 3
+    h1dt = np.dtype([('kstp', 'i4'), ('kper', 'i4'), ('text', 'a16'),
+                     ('ncol', 'i4'), ('nrow', 'i4'), ('nlay', 'i4')])
+    h2dt = np.dtype([('imeth', 'i4'), ('delt', 'f4'), ('pertim', 'f4'),
+                     ('totim', 'f4')])
+    fname = os.path.join(cpth, 'inflow.cbc')
+    expected = []
+    with open(fname, 'wb') as f:
+        for kstp in (1, 2):
+            q = 2. * kstp
+            frf = np.zeros((nlay, nrow, ncol), dtype=np.float32)
+            frf[0, 0, 0] = q
+            wells = np.zeros((nlay, nrow, ncol), dtype=np.float32)
+            wells[0, 0, 1] = -q / 2.
+            recharge = np.zeros((nrow, ncol), dtype=np.float32)
+            recharge[0, 0] = 1.
+            for text, imeth, flow in (('FLOW RIGHT FACE ', 1, frf),
+                                      ('           WELLS', 1, wells),
+                                      ('        RECHARGE', 4, recharge)):
+                np.array((kstp, 1, text, ncol, nrow, -nlay),
+                         dtype=h1dt).tofile(f)
+                np.array((imeth, 1., kstp, kstp), dtype=h2dt).tofile(f)
+                flow.tofile(f)
+            scaled = np.zeros((nlay, nrow, ncol))
+            scaled[0, 0, 0] = (1. - q) / 1.
+            scaled[0, 0, 1] = (q / 2.) / q
+            expected.append(scaled)
+
+    v = flopy.utils.CellBudgetFile(fname, precision='single')
+    res = v.get_residuals(scaled=True, filename=fname + '.npy')
+    saved = np.load(fname + '.npy')
+    for it, totim in enumerate(v.get_times()):
+        scaled = v.get_residual(totim, scaled=True)
+        assert np.allclose(scaled, expected[it])
+        assert np.allclose(saved[it], scaled)
+        k, i, j = res.k_scaled[it], res.i_scaled[it], res.j_scaled[it]
+        assert np.isclose(res.max_scaled[it], scaled[k, i, j])
+        residual = v.get_residual(totim)
+        k, i, j = res.k[it], res.i[it], res.j[it]
+        assert np.isclose(res.max_residual[it], residual[k, i, j])
+    v.close()
+    return
+
+
 def test_binaryfile_writeread():
 
     pth = os.path.join("..", "examples", "data", "nwt_test")
@@ -364,6 +979,20 @@ if __name__ == '__main__':
     test_binaryfile_writeread()
     test_formattedfile_read()
     test_binaryfile_read()
+    test_binaryfile_mmap()
+    test_binaryfile_get_ts()
+    test_binaryfile_index_cache()
+    test_binaryfile_refresh()
     test_cellbudgetfile_read()
     test_cellbudgetfile_readrecord()
     test_cellbudgetfile_readrecord_waux()
+    test_cellbudgetfile_create3D()
+    test_binaryfile_reduce()
+    test_binaryfile_read_ensemble()
+    test_cellbudgetfile_get_ts()
+    test_lazybinaryarray()
+    test_lazybinaryarray_mfdata()
+    test_lazybinaryarray_rerun()
+    test_cellbudgetfile_residuals_imeth4()
+    test_cellbudgetfile_residuals_inflow()
+    test_cellbudgetfile_get_residuals()
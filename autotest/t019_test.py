@@ -212,8 +212,50 @@ def test_mf6obsfile_read():
     return
 
 
+def test_mf6obsfile_refresh():
+    obsnames = ['h1', 'h2']
+    data = np.array([(1., 10., 20.), (2., 11., 21.), (3., 12., 22.)],
+                    dtype=[('totim', 'f8'), ('H1', 'f8'), ('H2', 'f8')])
+
+    # ascii observation file with an unterminated last line
+    pth = os.path.join(mpth, 'tail.obs.csv')
+    lines = ['time,H1,H2\n'] + \
+            ['{},{},{}\n'.format(*row) for row in data]
+    with open(pth, 'w') as f:
+        f.write(''.join(lines[:3]) + lines[3][:4])
+    h = flopy.utils.Mf6Obs(pth, isBinary=False)
+    assert h.get_ntimes() == 2
+    with open(pth, 'a') as f:
+        f.write(lines[3][4:])
+    assert h.refresh() == 1
+    assert h.get_times() == [1., 2., 3.]
+    assert np.array_equal(h.get_data()['H2'], data['H2'])
+    h.file.close()
+
+    # binary observation file with a partially written last record
+    pth = os.path.join(mpth, 'tail.obs.bin')
+    header = 'cont double   {:>3d}'.format(16).ljust(100).encode()
+    header += np.array([len(obsnames)], dtype=np.int32).tobytes()
+    for name in obsnames:
+        header += name.upper().ljust(16).encode()
+    b = header + data.tobytes()
+    ipos = len(header) + data.itemsize + 12
+    with open(pth, 'wb') as f:
+        f.write(b[:ipos])
+    h = flopy.utils.Mf6Obs(pth, isBinary=True)
+    assert h.get_ntimes() == 1
+    with open(pth, 'ab') as f:
+        f.write(b[ipos:])
+    times = [totim for totim, r in h.follow(interval=0.01, timeout=0.)]
+    assert times == [1., 2., 3.]
+    assert np.array_equal(h.get_data()['H1'], data['H1'])
+    h.file.close()
+    return
+
+
 if __name__ == '__main__':
     test_mf6obsfile_read()
+    test_mf6obsfile_refresh()
     test_hydmodfile_create()
     test_hydmodfile_load()
     test_hydmodfile_read()
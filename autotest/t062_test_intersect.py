@@ -142,5 +142,61 @@ def test_intersection():
             assert all(np.isnan([row, col, cell2d_disv]))
 
 
+def test_intersection_arrays():
+    ml_dis = dis_model()
+    ml_disv = disv_model()
+
+    # random points inside and outside of the grid, in local coordinates,
+    # and points on the interior cell edges
+    np.random.seed(62)
+    x = np.random.uniform(-1000., ncol * delr + 1000., 500)
+    y = np.random.uniform(-1000., nrow * delc + 1000., 500)
+    x = np.concatenate((x, np.arange(1, ncol) * delr))
+    y = np.concatenate((y, np.full(ncol - 1, 4000.)))
+
+    for local in [True, False]:
+        if local:
+            xp, yp = x, y
+        else:
+            xp, yp = ml_dis.modelgrid.get_coords(x, y)
+        row, col = ml_dis.modelgrid.intersect(xp, yp, local, forgive=True)
+        cell2d_disv = ml_disv.modelgrid.intersect(xp, yp, local,
+                                                  forgive=True)
+        assert row.shape == col.shape == cell2d_disv.shape == x.shape
+        # points on the edges are only exactly on the edges locally
+        n = x.shape[0] if local else 500
+        assert np.allclose(row[:n] * ncol + col[:n], cell2d_disv[:n],
+                           equal_nan=True)
+        outside = (x < 0) | (x > ncol * delr) | (y < 0) | (y > nrow * delc)
+        assert np.array_equal(np.isnan(cell2d_disv), outside)
+
+        # the same cells as one point at a time
+        for i in range(0, x.shape[0], 7):
+            r, c = ml_dis.modelgrid.intersect(xp[i], yp[i], local,
+                                              forgive=True)
+            icell2d = ml_disv.modelgrid.intersect(xp[i], yp[i], local,
+                                                  forgive=True)
+            assert np.allclose([r, c, icell2d],
+                               [row[i], col[i], cell2d_disv[i]],
+                               equal_nan=True)
+
+    # the shape of the input is kept
+    xp = x[:20].reshape(4, 5)
+    yp = y[:20].reshape(4, 5)
+    assert ml_disv.modelgrid.intersect(xp, yp, True,
+                                       forgive=True).shape == (4, 5)
+
+    # points outside of the grid are an error if not forgiven
+    inside = ~np.isnan(cell2d_disv)
+    ml_disv.modelgrid.intersect(x[inside], y[inside], True)
+    for modelgrid in [ml_dis.modelgrid, ml_disv.modelgrid]:
+        try:
+            modelgrid.intersect(x, y, True)
+            raise AssertionError('points outside of the grid not detected')
+        except Exception as e:
+            assert 'outside of the model area' in e.args[0]
+
+
 if __name__ == '__main__':
-    test_intersection()
\ No newline at end of file
+    test_intersection()
+    test_intersection_arrays()
\ No newline at end of file
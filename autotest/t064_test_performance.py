@@ -2,7 +2,9 @@
 Tests to prevent performance regressions
 """
 import os
+import sys
 import shutil
+import subprocess
 import time
 import numpy as np
 import flopy.modflow as fm
@@ -92,3 +94,66 @@ class TestModflowPerformance():
     def teardown_class(cls):
         # cleanup
         shutil.rmtree(cls.model_ws)
+
+
+def run_python(code, env=None):
+    """run code in a new interpreter and return its output."""
+    run_env = dict(os.environ)
+    run_env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    if env is not None:
+        run_env.update(env)
+    return subprocess.check_output([sys.executable, '-c', code],
+                                   env=run_env).decode().split()
+
+
+def test_import_time():
+    """test the time to import flopy in a new interpreter"""
+    code = 'import sys, time\n' \
+           't0 = time.time()\n' \
+           'import flopy\n' \
+           't1 = time.time() - t0\n' \
+           'print(t1)\n' \
+           'print(len([name for name in flopy._subpackages\n' \
+           '           if "flopy." + name in sys.modules]))\n'
+    t1, nloaded = run_python(code)
+    t1 = float(t1)
+    target = 0.5
+    assert t1 < target, "import flopy took {:.2f}s, should take {:.1f}s".format(t1, target)
+    print('importing flopy took {:.3f}s'.format(t1))
+    if sys.version_info[0:2] >= (3, 7):
+        # subpackages are only imported when they are accessed
+        assert int(nloaded) == 0, 'subpackages imported with flopy'
+
+
+def test_mf6_structure_time():
+    """test the time to build the mf6 structure with and without cache"""
+    cache_dir = os.path.join('temp', 't064_cache')
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+    code = 'import time\n' \
+           'from flopy.mf6.data.mfstructure import MFStructure\n' \
+           't0 = time.time()\n' \
+           'MFStructure()\n' \
+           'print(time.time() - t0)\n'
+    # the cache is only written when it is enabled
+    home = os.path.join(cache_dir, 'home')
+    os.makedirs(home)
+    run_python(code, {'FLOPY_CACHE_DIR': '', 'HOME': home})
+    assert os.listdir(home) == []
+    env = {'FLOPY_CACHE_DIR': os.path.abspath(cache_dir)}
+    t_build = float(run_python(code, env)[-1])
+    cache_file = os.path.join(cache_dir, 'mf6_structure.pkl')
+    assert os.path.isfile(cache_file)
+    if os.name == 'posix':
+        # the cache can only be read by its owner
+        assert os.stat(cache_file).st_mode & 0o777 == 0o600
+        # a cache that other users can modify is rebuilt
+        os.chmod(cache_file, 0o666)
+        run_python(code, env)
+        assert os.stat(cache_file).st_mode & 0o777 == 0o600
+    t_cache = float(run_python(code, env)[-1])
+    target = 1.
+    assert t_cache < target, "loading the mf6 structure took {:.2f}s, should take {:.1f}s".format(t_cache, target)
+    print('building the mf6 structure took {:.3f}s, '
+          'loading it from cache took {:.3f}s'.format(t_build, t_cache))
+    shutil.rmtree(cache_dir)
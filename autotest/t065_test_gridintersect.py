@@ -1028,6 +1028,178 @@ def test_polygon_offset_rot_structured_grid_shapely():
     # assert len(result) == 3.
     return result
 
+# %% test intersecting many shapes at once
+
+
+def test_rect_grid_shapes_polygons():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    from shapely.affinity import rotate, translate
+    gr = get_rect_grid()
+    ix = GridIntersect(gr, method="structured")
+    polygons = [Polygon([(5., 5.), (25., 5.), (25., 15.), (5., 15.)]),
+                Polygon([(50., 50.), (60., 50.), (60., 60.)]),
+                Polygon([(2., 8.), (12., 8.), (12., 18.), (2., 18.)]),
+                MultiPolygon([Polygon([(6., 6.), (7., 6.), (7., 7.)]),
+                              Polygon([(9., 14.), (9., 19.), (14., 19.)])])]
+    result = ix.intersect_shapes(polygons, chunksize=2)
+    assert result.dtype.names == ("shape_id", "cellids", "vertices",
+                                  "areas", "ixshapes")
+    assert 1 not in result.shape_id
+    for i, polygon in enumerate(polygons):
+        expected = ix.intersect_polygon(polygon)
+        shape_result = result[result.shape_id == i]
+        assert list(shape_result.cellids) == \
+            sorted(expected.cellids.tolist())
+        assert np.isclose(shape_result.areas.sum(), expected.areas.sum())
+
+    # the same shapes and grid rotated and offset
+    gr = get_rect_grid(angrot=30., xyoffset=5.)
+    ix = GridIntersect(gr, method="structured")
+    polygons = [translate(rotate(polygon, 30., origin=(0., 0.)), 5., 5.)
+                for polygon in polygons]
+    result_rot = ix.intersect_shapes(polygons, chunksize=2)
+    assert result_rot.shape_id.tolist() == result.shape_id.tolist()
+    assert result_rot.cellids.tolist() == result.cellids.tolist()
+    assert np.allclose(result_rot.areas, result.areas)
+    return result
+
+
+def test_rect_grid_shapes_linestrings():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_rect_grid()
+    ix = GridIntersect(gr, method="structured")
+    linestrings = [LineString([(5., 5.), (15., 5.)]),
+                   LineString([(25., 25.), (35., 25.)]),
+                   LineString([(5., 10.), (15., 10.)]),
+                   LineString([(5., 15.), (5., 5.), (15., 5.)])]
+    result = ix.intersect_shapes(linestrings)
+    assert result.dtype.names == ("shape_id", "cellids", "vertices",
+                                  "lengths", "ixshapes")
+    assert result.shape_id.tolist() == [0, 0, 2, 2, 3, 3, 3]
+    assert result.cellids.tolist() == [(1, 0), (1, 1), (0, 0), (0, 1),
+                                       (0, 0), (1, 0), (1, 1)]
+    assert np.allclose(result.lengths, [5., 5., 5., 5., 5., 10., 5.])
+    return result
+
+
+def test_rect_grid_shapes_points():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_rect_grid()
+    ix = GridIntersect(gr, method="structured")
+    points = [Point(1., 1.), Point(25., 25.), Point(10., 10.),
+              MultiPoint([Point(1., 1.), Point(2., 2.), Point(15., 15.)])]
+    result = ix.intersect_shapes(points)
+    assert result.dtype.names == ("shape_id", "cellids", "vertices",
+                                  "ixshapes")
+    assert result.shape_id.tolist() == [0, 2, 3, 3]
+    assert result.cellids.tolist() == [(1, 0), (0, 0), (0, 1), (1, 0)]
+    assert result.ixshapes[3].geom_type == "MultiPoint"
+    return result
+
+
+def test_tri_grid_shapes_polygons():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_tri_grid(triangle_exe=triangle_exe)
+    if gr == -1:
+        return
+    ix = GridIntersect(gr)
+    polygons = [Polygon([(5., 5.), (15., 5.), (15., 15.), (5., 15.)]),
+                Polygon([(0., 0.), (20., 0.), (20., 20.), (0., 20.)])]
+    result = ix.intersect_shapes(polygons, processes=2, chunksize=1)
+    for i, polygon in enumerate(polygons):
+        expected = ix.intersect_polygon(polygon)
+        shape_result = result[result.shape_id == i]
+        assert list(shape_result.cellids) == sorted(expected.cellids)
+        assert np.isclose(shape_result.areas.sum(), polygon.area)
+    return result
+
+
+# %% test rasterizing polygons on structured grids
+
+
+def test_rect_grid_rasterize_polygon():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    from shapely.affinity import rotate, translate
+    gr = get_rect_grid()
+    ix = GridIntersect(gr, method="structured")
+    p = Polygon([(5., 5.), (5., 15.), (25., 15.), (25., -5.),
+                 (5., -5.)], holes=[[(9., -1), (9, 11), (21, 11), (21, -1)]])
+    areas = ix.rasterize_polygon(p)
+    assert np.allclose(areas, [[24., 40.], [40., 0.]])
+    fractions = ix.rasterize_polygon(p, fractions=True)
+    assert np.allclose(fractions, areas / 100.)
+
+    # rotated and offset grid
+    gr = get_rect_grid(angrot=30., xyoffset=5.)
+    ix = GridIntersect(gr, method="structured")
+    p = translate(rotate(p, 30., origin=(0., 0.)), 5., 5.)
+    assert np.allclose(ix.rasterize_polygon(p), areas)
+    return areas
+
+
+def test_rect_grid_rasterize_polygon_benchmark():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    import time
+    nrow, ncol = 100, 150
+    gr = fgrid.StructuredGrid(np.linspace(1., 3., nrow),
+                              np.linspace(1., 2., ncol), xoff=100.,
+                              yoff=50., angrot=20.)
+    ix = GridIntersect(gr, method="structured")
+    center = Point(200., 250.)
+    p = center.buffer(120., 64).difference(center.buffer(40., 16))
+
+    t0 = time.time()
+    areas = ix.rasterize_polygon(p)
+    t_raster = time.time() - t0
+
+    # intersect every cell with shapely
+    t0 = time.time()
+    expected = np.zeros((nrow, ncol))
+    for i in range(nrow):
+        for j in range(ncol):
+            cell = Polygon(gr.get_cell_vertices(i, j))
+            if p.intersects(cell):
+                expected[i, j] = p.intersection(cell).area
+    t_shapely = time.time() - t0
+    print("rasterize: {:.3f}s, shapely: {:.3f}s".format(t_raster,
+                                                        t_shapely))
+    assert np.allclose(areas, expected)
+
+    t0 = time.time()
+    result = ix.intersect_polygon(p)
+    print("intersect_polygon: {:.3f}s".format(time.time() - t0))
+    i, j = np.array(result.cellids.tolist()).T
+    assert np.allclose(result.areas, expected[i, j])
+    assert np.allclose([ixshape.area for ixshape in result.ixshapes],
+                       result.areas)
+    assert np.count_nonzero(expected > 1e-8) == len(result)
+    return result
+
+
 def test_rasters():
     from flopy.utils import Raster
     import os
@@ -133,5 +133,68 @@ def test_ulstrd():
     return
 
 
+def test_ulstrd_block():
+    # compare the block list reader to a row by row read, including
+    # short rows, extra tokens, blank lines, and fixed format input
+    from io import StringIO
+    from flopy.utils.flopy_io import ulstrd
+
+    m = flopy.modflow.Modflow(model_ws=tpth)
+    nlist = 50
+    ra0 = flopy.modflow.ModflowGhb.get_empty(nlist)
+    ra0['k'] = 1
+    ra0['i'] = np.arange(nlist) % 7 + 1
+    ra0['j'] = np.arange(nlist) % 11 + 1
+    ra0['bhead'] = np.linspace(-1.5, 1.e3, nlist)
+    ra0['cond'] = np.linspace(0.1, 1.e-6, nlist)
+    lines = ['{} {} {} {!r} {!r}\n'.format(k, i, j, float(s), float(c))
+             for k, i, j, s, c in ra0]
+
+    # free format, sfac applied to cond
+    m.free_format_input = True
+    f = StringIO('sfac 2.\n' + ''.join(lines) + 'next\n')
+    ra = ulstrd(f, nlist, flopy.modflow.ModflowGhb.get_empty(nlist), m,
+                ['cond'], None)
+    assert f.readline() == 'next\n'
+    assert np.array_equal(ra[['k', 'i', 'j', 'bhead']],
+                          ra0[['k', 'i', 'j', 'bhead']])
+    assert np.array_equal(ra['cond'], ra0['cond'] * np.float32(2.))
+
+    # extra tokens are ignored, short and blank rows are padded with zeros
+    lines2 = list(lines)
+    lines2[0] = lines2[0].rstrip() + ' 9 extra\n'
+    lines2[1] = '1 2 3\n'
+    lines2[2] = '\n'
+    ra = ulstrd(StringIO(''.join(lines2)), nlist,
+                flopy.modflow.ModflowGhb.get_empty(nlist), m, [], None)
+    assert np.array_equal(ra[0], ra0[0])
+    assert tuple(ra[1]) == (1, 2, 3, 0., 0.)
+    assert tuple(ra[2]) == (0, 0, 0, 0., 0.)
+    assert np.array_equal(ra[3:], ra0[3:])
+
+    # a bad value raises the same error as a row by row read
+    lines2 = list(lines)
+    lines2[-1] = '1 1 1 1.0D+00 1.\n'
+    try:
+        ulstrd(StringIO(''.join(lines2)), nlist,
+               flopy.modflow.ModflowGhb.get_empty(nlist), m, [], None)
+        raise AssertionError('ValueError not raised')
+    except ValueError:
+        pass
+
+    # fixed format with a blank field
+    m.free_format_input = False
+    lines = ['{:10d}{:10d}{:10d}{:10.4f}{}\n'.format(
+        k, i, j, s, '' if n % 3 else '{:10.4f}'.format(c))
+        for n, (k, i, j, s, c) in enumerate(ra0)]
+    ra = ulstrd(StringIO(''.join(lines)), nlist,
+                flopy.modflow.ModflowGhb.get_empty(nlist), m, [], None)
+    assert np.array_equal(ra[['k', 'i', 'j']], ra0[['k', 'i', 'j']])
+    assert np.allclose(ra['bhead'], ra0['bhead'], atol=1e-4)
+    assert np.all(ra['cond'][np.arange(nlist) % 3 != 0] == 0.)
+    return
+
+
 if __name__ == '__main__':
     test_ulstrd()
+    test_ulstrd_block()
@@ -0,0 +1,141 @@
+"""
+Tests writing and loading MODFLOW 6 simulations with external binary files
+and compares the performance to external ASCII files
+"""
+import os
+import shutil
+import time
+import numpy as np
+import flopy
+import flopy.utils.binaryfile as bf
+
+
+class TestMf6BinaryExternal():
+    """Round trip a realistically sized MODFLOW 6 simulation through
+    external ASCII and binary files and time the write and load of each.
+    """
+    @classmethod
+    def setup_class(cls):
+        """Make the arrays and stress period data for the simulation."""
+        cls.nlay = 3
+        cls.nrow = 100
+        cls.ncol = 100
+        cls.nper = 5
+        cls.model_ws = os.path.join('temp', 't070')
+        cls.times = {}
+
+        shape3d = (cls.nlay, cls.nrow, cls.ncol)
+        np.random.seed(7)
+        cls.botm = np.array([np.full((cls.nrow, cls.ncol), -10.0 * (k + 1))
+                             for k in range(cls.nlay)])
+        cls.k = np.random.random(shape3d) * 10.
+        cls.strt = np.random.random(shape3d)
+        cls.idomain = np.ones(shape3d, dtype=int)
+        cls.idomain[:, 0, 0] = 0
+        cls.rech = {kper: np.random.random((cls.nrow, cls.ncol)) * 1e-3
+                    for kper in range(cls.nper)}
+        cls.wel_spd = {}
+        for kper in range(cls.nper):
+            cls.wel_spd[kper] = [((1, i, j), -float(i + j + kper))
+                                 for i in range(cls.nrow)
+                                 for j in range(1, cls.ncol, 2)]
+
+    @classmethod
+    def build_simulation(cls, sim_ws):
+        sim = flopy.mf6.MFSimulation(sim_ws=sim_ws, verbosity_level=0)
+        flopy.mf6.ModflowTdis(sim, nper=cls.nper,
+                              perioddata=[(1.0, 1, 1.0)] * cls.nper)
+        flopy.mf6.ModflowIms(sim)
+        gwf = flopy.mf6.ModflowGwf(sim, modelname='t070')
+        flopy.mf6.ModflowGwfdis(gwf, nlay=cls.nlay, nrow=cls.nrow,
+                                ncol=cls.ncol, top=0.0, botm=cls.botm,
+                                idomain=cls.idomain)
+        flopy.mf6.ModflowGwfnpf(gwf, k=cls.k, icelltype=[1, 0, 0])
+        flopy.mf6.ModflowGwfic(gwf, strt=cls.strt)
+        flopy.mf6.ModflowGwfwel(gwf, stress_period_data=cls.wel_spd)
+        flopy.mf6.ModflowGwfchd(gwf, boundnames=True,
+                                stress_period_data={0: [((0, 1, 1), 1.0,
+                                                         'chd_1')]})
+        flopy.mf6.ModflowGwfrcha(gwf, recharge=cls.rech)
+        flopy.mf6.ModflowGwfoc(gwf, head_filerecord='t070.hds',
+                               saverecord=[('HEAD', 'ALL')])
+        return sim
+
+    def write_load(self, binary):
+        name = 'binary' if binary else 'ascii'
+        sim_ws = os.path.join(self.model_ws, name)
+        if os.path.isdir(sim_ws):
+            shutil.rmtree(sim_ws)
+        sim = self.build_simulation(sim_ws)
+
+        t0 = time.time()
+        sim.set_all_data_external(binary=binary)
+        sim.write_simulation(silent=True)
+        t_write = time.time() - t0
+
+        t0 = time.time()
+        sim2 = flopy.mf6.MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+        gwf = sim2.get_model('t070')
+        k = gwf.npf.k.array
+        rech = gwf.rcha.recharge.get_data()
+        wel = {kper: gwf.wel.stress_period_data.get_data(kper)
+               for kper in range(self.nper)}
+        t_load = time.time() - t0
+        self.times[name] = (t_write, t_load)
+        print('{} external files: write {:.2f}s, load {:.2f}s'.format(
+            name, t_write, t_load))
+
+        # check the round trip
+        assert np.allclose(k, self.k)
+        assert np.allclose(gwf.dis.botm.array, self.botm)
+        assert np.allclose(gwf.ic.strt.array, self.strt)
+        assert np.array_equal(gwf.dis.idomain.array, self.idomain)
+        for kper in range(self.nper):
+            assert np.allclose(np.squeeze(rech[kper]), self.rech[kper])
+            spd = self.wel_spd[kper]
+            assert wel[kper]['cellid'].tolist() == [row[0] for row in spd]
+            assert np.allclose(wel[kper]['q'], [row[1] for row in spd])
+        chd = gwf.chd.stress_period_data.get_data(0)
+        assert chd['boundname'][0] == 'chd_1'
+        return sim_ws
+
+    def test_0_ascii(self):
+        """test write and load time of external ascii files"""
+        sim_ws = self.write_load(False)
+        assert os.path.isfile(os.path.join(sim_ws, 't070.npf_k_layer1.txt'))
+
+    def test_1_binary(self):
+        """test write and load time of external binary files"""
+        sim_ws = self.write_load(True)
+        fname = os.path.join(sim_ws, 't070.npf_k_layer2.bin')
+        assert os.path.isfile(fname)
+        # one header for the layer followed by the data
+        dtype = bf.BinaryHeader.set_dtype(bintype='vardis',
+                                          precision='double')
+        header = np.fromfile(fname, dtype=dtype, count=1)[0]
+        assert header['ncol'] == self.ncol
+        assert header['nrow'] == self.nrow
+        assert header['ilay'] == 2
+        assert os.path.getsize(fname) == dtype.itemsize + \
+            self.nrow * self.ncol * 8
+        fname = os.path.join(sim_ws, 't070.wel_stress_period_data_1.bin')
+        assert os.path.isfile(fname)
+        if 'ascii' in self.times:
+            t_ascii = sum(self.times['ascii'])
+            t_binary = sum(self.times['binary'])
+            print('binary/ascii write and load time ratio: {:.2f}'.format(
+                t_binary / t_ascii))
+
+    @classmethod
+    def teardown_class(cls):
+        # cleanup
+        if os.path.isdir(cls.model_ws):
+            shutil.rmtree(cls.model_ws)
+
+
+if __name__ == '__main__':
+    t = TestMf6BinaryExternal()
+    t.setup_class()
+    t.test_0_ascii()
+    t.test_1_binary()
+    t.teardown_class()
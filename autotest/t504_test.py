@@ -1,4 +1,4 @@
-import os, copy
+import os, copy, shutil
 
 import numpy as np
 
@@ -128,6 +128,171 @@ def test001a_tharmonic():
     return
 
 
+def test001a_tharmonic_only_modified():
+    # init paths
+    test_ex_name = 'test001a_Tharmonic'
+    model_name = 'flow15'
+
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, '{}_only_modified'.format(test_ex_name))
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    # load simulation and write it to a new location with threads
+    sim = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                            verbosity_level=0)
+    sim.simulation_data.mfpath.set_sim_path(run_folder)
+    model = sim.get_model(model_name)
+    assert model.npf.write_needed()
+    sim.write_simulation(silent=True, nworkers=2)
+    assert not model.npf.modified
+    assert not model.npf.write_needed()
+
+    # mark the ic file so that a rewrite can be detected
+    ic_file = model.ic.get_file_path()
+    with open(ic_file, 'a') as f:
+        f.write('# not rewritten\n')
+
+    # change hk and write only the modified packages
+    hk_array = model.npf.k.get_data()
+    hk_array[0, 0, 1] = 20.0
+    model.npf.k.set_data(hk_array)
+    assert model.npf.modified
+    assert not model.ic.modified
+    sim.write_simulation(silent=True, only_modified=True, nworkers=2)
+    with open(ic_file) as f:
+        assert '# not rewritten' in f.read()
+    sim2 = MFSimulation.load(model_name, 'mf6', exe_name, run_folder,
+                             verbosity_level=0)
+    hk = sim2.get_model(model_name).npf.k.get_data()
+    assert hk[0, 0, 1] == 20.0
+
+    # a missing package file is always rewritten
+    os.remove(ic_file)
+    assert model.ic.write_needed()
+    model.write(only_modified=True)
+    assert os.path.isfile(ic_file)
+
+    return
+
+
+def test006_2models_mvr_nworkers():
+    # the packages of a model are written one at a time, the models are
+    # written concurrently and the files are the same as a serial write
+    test_ex_name = 'test006_2models_mvr'
+    sim_name = 'test006_2models_mvr'
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    folders = []
+    for nworkers in (None, 4):
+        run_folder = os.path.join(cpth, '{}_nworkers_{}'.format(
+            test_ex_name, nworkers))
+        if os.path.isdir(run_folder):
+            shutil.rmtree(run_folder)
+        sim = MFSimulation.load(sim_name, 'mf6', exe_name, pth,
+                                verbosity_level=0)
+        sim.simulation_data.mfpath.set_sim_path(run_folder)
+        sim.write_simulation(silent=True, nworkers=nworkers)
+        folders.append(run_folder)
+
+    files = sorted(os.listdir(folders[0]))
+    assert files == sorted(os.listdir(folders[1]))
+    assert len(files) > 10
+    for fname in files:
+        with open(os.path.join(folders[0], fname), 'rb') as f:
+            serial = f.read()
+        with open(os.path.join(folders[1], fname), 'rb') as f:
+            threaded = f.read()
+        assert serial == threaded, \
+            '{} differs between serial and threaded write'.format(fname)
+    return
+
+
+def test001a_tharmonic_lazy_io():
+    # init paths
+    test_ex_name = 'test001a_Tharmonic'
+    model_name = 'flow15'
+
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, '{}_lazy_io'.format(test_ex_name))
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    # only the options and dimensions blocks are read
+    sim = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                            verbosity_level=0, lazy_io=True)
+    model = sim.get_model(model_name)
+    assert model.npf.is_deferred()
+    assert model.ic.is_deferred()
+
+    # deferred blocks are read when their data is used
+    sim_eager = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                                  verbosity_level=0)
+    model_eager = sim_eager.get_model(model_name)
+    assert np.array_equal(model.ic.strt.array, model_eager.ic.strt.array)
+    assert not model.ic.is_deferred()
+    assert not model.ic.modified
+
+    # change hk without reading it first
+    model.npf.k.set_data(20.0)
+    assert not model.npf.is_deferred()
+    assert model.npf.modified
+
+    # unchanged package files are passed through unchanged
+    sim.simulation_data.mfpath.set_sim_path(run_folder)
+    sim.write_simulation(silent=True)
+    for package in [model.dis, model.ic]:
+        file_name = os.path.basename(package.get_file_path())
+        with open(os.path.join(pth, file_name)) as f:
+            original = f.read()
+        with open(package.get_file_path()) as f:
+            assert f.read() == original
+
+    sim2 = MFSimulation.load(model_name, 'mf6', exe_name, run_folder,
+                             verbosity_level=0)
+    model2 = sim2.get_model(model_name)
+    assert np.all(model2.npf.k.array == 20.0)
+    assert np.array_equal(model2.dis.botm.array, model_eager.dis.botm.array)
+
+    return
+
+
+def test001a_tharmonic_list_block():
+    # init paths
+    test_ex_name = 'test001a_Tharmonic'
+    model_name = 'flow15'
+
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, '{}_list_block'.format(test_ex_name))
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    # list blocks with a plain layout are loaded all at once
+    sim = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                            verbosity_level=0)
+    model = sim.get_model(model_name)
+    chd_data = model.get_package('chd').stress_period_data.get_data(0)
+    assert chd_data['cellid'].tolist() == [(0, 0, 0), (0, 0, 9)]
+    assert chd_data['head'].tolist() == [10.0, 0.0]
+
+    # list blocks with comments are loaded one line at a time
+    for file_name in os.listdir(pth):
+        if os.path.isfile(os.path.join(pth, file_name)):
+            shutil.copy(os.path.join(pth, file_name), run_folder)
+    chd_file = os.path.join(run_folder, 'flow15_constant.chd')
+    with open(chd_file) as f:
+        chd_text = f.read()
+    chd_text = chd_text.replace('0.0000000\n', '0.0000000  # outlet\n')
+    with open(chd_file, 'w') as f:
+        f.write(chd_text)
+    sim2 = MFSimulation.load(model_name, 'mf6', exe_name, run_folder,
+                             verbosity_level=0)
+    model2 = sim2.get_model(model_name)
+    chd_data2 = model2.get_package('chd').stress_period_data.get_data(0)
+    assert np.array_equal(chd_data, chd_data2)
+
+    return
+
+
 def test003_gwfs_disv():
     # init paths
     test_ex_name = 'test003_gwfs_disv'
@@ -939,6 +1104,10 @@ def test027_timeseriestest():
 
 if __name__ == '__main__':
     test001a_tharmonic()
+    test001a_tharmonic_only_modified()
+    test006_2models_mvr_nworkers()
+    test001a_tharmonic_lazy_io()
+    test001a_tharmonic_list_block()
     test001e_uzf_3lay()
     test003_gwfs_disv()
     test005_advgw_tidal()
@@ -0,0 +1,323 @@
+# BAS6 package for  MODFLOW-NWT, generated by Flopy.
+
+INTERNAL               1     (FREE) -1 #ibound_layer_0                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_1                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_2                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_3                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_4                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_5                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_6                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_7                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_8                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_9                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_10               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_11               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_12               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_13               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_14               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_15               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_16               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_17               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_18               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_19               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_20               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_21               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_22               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_23               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_24               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_25               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_26               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_27               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_28               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_29               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_30               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_31               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_32               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_33               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_34               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_35               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_36               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_37               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_38               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_39               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_40               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_41               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_42               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_43               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_44               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_45               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_46               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_47               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_48               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_49               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_50               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_51               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_52               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_53               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_54               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_55               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_56               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_57               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_58               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_59               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_60               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_61               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_62               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_63               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_64               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_65               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_66               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_67               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_68               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_69               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_70               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_71               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_72               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_73               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_74               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_75               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_76               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_77               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_78               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_79               
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+     999.0
+INTERNAL               1     (FREE) -1 #strt_layer_0                  
+   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03   1.975000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_1                  
+   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03   1.950000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_2                  
+   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03   1.925000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_3                  
+   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03   1.900000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_4                  
+   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03   1.875000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_5                  
+   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03   1.850000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_6                  
+   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03   1.825000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_7                  
+   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03   1.800000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_8                  
+   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03   1.775000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_9                  
+   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03   1.750000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_10                 
+   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03   1.725000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_11                 
+   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03   1.700000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_12                 
+   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03   1.675000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_13                 
+   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03   1.650000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_14                 
+   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03   1.625000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_15                 
+   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03   1.600000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_16                 
+   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03   1.575000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_17                 
+   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03   1.550000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_18                 
+   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03   1.525000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_19                 
+   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03   1.500000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_20                 
+   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03   1.475000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_21                 
+   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03   1.450000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_22                 
+   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03   1.425000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_23                 
+   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03   1.400000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_24                 
+   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03   1.375000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_25                 
+   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03   1.350000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_26                 
+   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03   1.325000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_27                 
+   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03   1.300000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_28                 
+   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03   1.275000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_29                 
+   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03   1.250000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_30                 
+   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03   1.225000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_31                 
+   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03   1.200000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_32                 
+   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03   1.175000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_33                 
+   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03   1.150000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_34                 
+   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03   1.125000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_35                 
+   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03   1.100000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_36                 
+   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03   1.075000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_37                 
+   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03   1.050000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_38                 
+   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03   1.025000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_39                 
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+INTERNAL               1     (FREE) -1 #strt_layer_40                 
+   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02   9.750000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_41                 
+   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02   9.500000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_42                 
+   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02   9.250000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_43                 
+   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02   9.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_44                 
+   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02   8.750000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_45                 
+   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02   8.500000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_46                 
+   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02   8.250000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_47                 
+   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02   8.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_48                 
+   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02   7.750000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_49                 
+   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02   7.500000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_50                 
+   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02   7.250000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_51                 
+   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02   7.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_52                 
+   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02   6.750000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_53                 
+   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02   6.500000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_54                 
+   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02   6.250000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_55                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_56                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_57                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_58                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_59                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_60                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_61                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_62                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_63                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_64                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_65                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_66                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_67                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_68                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_69                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_70                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_71                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_72                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_73                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_74                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_75                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_76                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_77                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_78                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
+INTERNAL               1     (FREE) -1 #strt_layer_79                 
+   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02   6.000000E+02
@@ -0,0 +1,309 @@
+         3         1         (101E15.6)        -1 #al_layer_0
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1         (101E15.6)        -1 #al_layer_1
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1         (101E15.6)        -1 #al_layer_2
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         0      0.01                           -1 #trpt
+         0     0.001                           -1 #trpv
+         0         0                           -1 #dmcoef1
@@ -0,0 +1,11 @@
+# BAS6 package for  MODFLOW-NWT, generated by Flopy.
+FREE
+INTERNAL               1     (FREE) -1 #ibound_layer_0                
+        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1        -1
+    -888.0
+INTERNAL               1     (FREE) -1 #strt_layer_0                  
+   9.950000E+01   9.949990E+01   9.949980E+01   9.949970E+01   9.949960E+01   9.949950E+01   9.949940E+01   9.949930E+01   9.949920E+01   9.949910E+01   9.949900E+01   9.949890E+01   9.949880E+01   9.949870E+01   9.949860E+01   9.949850E+01   9.949840E+01   9.949830E+01   9.949820E+01   9.949810E+01   9.949800E+01   9.949790E+01   9.949780E+01   9.949770E+01   9.949760E+01   9.949750E+01   9.949740E+01   9.949730E+01   9.949720E+01   9.949710E+01   9.949700E+01   9.949690E+01   9.949680E+01   9.949670E+01   9.949660E+01   9.949650E+01   9.949640E+01   9.949630E+01   9.949620E+01   9.949610E+01   9.949600E+01   9.949590E+01   9.949580E+01   9.949570E+01   9.949560E+01   9.949550E+01   9.949540E+01   9.949530E+01   9.949520E+01   9.949510E+01   9.949500E+01   9.949490E+01   9.949480E+01   9.949470E+01   9.949460E+01   9.949450E+01   9.949440E+01   9.949430E+01   9.949420E+01   9.949410E+01   9.949400E+01   9.949390E+01   9.949380E+01   9.949370E+01   9.949360E+01   9.949350E+01   9.949340E+01   9.949330E+01   9.949320E+01   9.949310E+01   9.949300E+01   9.949290E+01   9.949280E+01   9.949270E+01   9.949260E+01   9.949250E+01   9.949240E+01   9.949230E+01   9.949220E+01   9.949210E+01   9.949200E+01   9.949190E+01   9.949180E+01   9.949170E+01   9.949160E+01   9.949150E+01   9.949140E+01   9.949130E+01   9.949120E+01   9.949110E+01   9.949100E+01   9.949090E+01   9.949080E+01   9.949070E+01   9.949060E+01   9.949050E+01   9.949040E+01   9.949030E+01   9.949020E+01   9.949010E+01   9.949000E+01   9.948990E+01   9.948980E+01   9.948970E+01   9.948960E+01   9.948950E+01   9.948940E+01   9.948930E+01   9.948920E+01   9.948910E+01   9.948900E+01   9.948890E+01   9.948880E+01   9.948870E+01   9.948860E+01   9.948850E+01   9.948840E+01   9.948830E+01   9.948820E+01   9.948810E+01   9.948800E+01   9.948790E+01   9.948780E+01   9.948770E+01   9.948760E+01   9.948750E+01   9.948740E+01   9.948730E+01   9.948720E+01   9.948710E+01   9.948700E+01   9.948690E+01   9.948680E+01   9.948670E+01   9.948660E+01   9.948650E+01   9.948640E+01   9.948630E+01   9.948620E+01   9.948610E+01   9.948600E+01   9.948590E+01   9.948580E+01   9.948570E+01   9.948560E+01   9.948550E+01   9.948540E+01   9.948530E+01   9.948520E+01   9.948510E+01   9.948500E+01   9.948490E+01   9.948480E+01   9.948470E+01   9.948460E+01   9.948450E+01   9.948440E+01   9.948430E+01   9.948420E+01   9.948410E+01   9.948400E+01   9.948390E+01   9.948380E+01   9.948370E+01   9.948360E+01   9.948350E+01   9.948340E+01   9.948330E+01   9.948320E+01   9.948310E+01   9.948300E+01   9.948290E+01   9.948280E+01   9.948270E+01   9.948260E+01   9.948250E+01   9.948240E+01   9.948230E+01   9.948220E+01   9.948210E+01   9.948200E+01   9.948190E+01   9.948180E+01   9.948170E+01   9.948160E+01   9.948150E+01   9.948140E+01   9.948130E+01   9.948120E+01   9.948110E+01   9.948100E+01   9.948090E+01   9.948080E+01   9.948070E+01   9.948060E+01   9.948050E+01   9.948040E+01   9.948030E+01   9.948020E+01   9.948010E+01   9.948000E+01   9.947990E+01   9.947980E+01   9.947970E+01   9.947960E+01   9.947950E+01   9.947940E+01   9.947930E+01   9.947920E+01   9.947910E+01   9.947900E+01   9.947890E+01   9.947880E+01   9.947870E+01   9.947860E+01   9.947850E+01   9.947840E+01   9.947830E+01   9.947820E+01   9.947810E+01   9.947800E+01   9.947790E+01   9.947780E+01   9.947770E+01   9.947760E+01   9.947750E+01   9.947740E+01   9.947730E+01   9.947720E+01   9.947710E+01   9.947700E+01   9.947690E+01   9.947680E+01   9.947670E+01   9.947660E+01   9.947650E+01   9.947640E+01   9.947630E+01   9.947620E+01   9.947610E+01   9.947600E+01   9.947590E+01   9.947580E+01   9.947570E+01   9.947560E+01   9.947550E+01   9.947540E+01   9.947530E+01   9.947520E+01   9.947510E+01   9.947500E+01   9.947490E+01   9.947480E+01   9.947470E+01   9.947460E+01   9.947450E+01   9.947440E+01   9.947430E+01   9.947420E+01   9.947410E+01   9.947400E+01   9.947390E+01   9.947380E+01   9.947370E+01   9.947360E+01   9.947350E+01   9.947340E+01   9.947330E+01   9.947320E+01   9.947310E+01   9.947300E+01   9.947290E+01   9.947280E+01   9.947270E+01   9.947260E+01   9.947250E+01   9.947240E+01   9.947230E+01   9.947220E+01   9.947210E+01   9.947200E+01   9.947190E+01   9.947180E+01   9.947170E+01   9.947160E+01   9.947150E+01   9.947140E+01   9.947130E+01   9.947120E+01   9.947110E+01   9.947100E+01   9.947090E+01   9.947080E+01   9.947070E+01   9.947060E+01   9.947050E+01   9.947040E+01   9.947030E+01   9.947020E+01   9.947010E+01   9.947000E+01   9.946990E+01   9.946980E+01   9.946970E+01   9.946960E+01   9.946950E+01   9.946940E+01   9.946930E+01   9.946920E+01   9.946910E+01   9.946900E+01   9.946890E+01   9.946880E+01   9.946870E+01   9.946860E+01   9.946850E+01   9.946840E+01   9.946830E+01   9.946820E+01   9.946810E+01   9.946800E+01   9.946790E+01   9.946780E+01   9.946770E+01   9.946760E+01   9.946750E+01   9.946740E+01   9.946730E+01   9.946720E+01   9.946710E+01   9.946700E+01   9.946690E+01   9.946680E+01   9.946670E+01   9.946660E+01   9.946650E+01   9.946640E+01   9.946630E+01   9.946620E+01   9.946610E+01   9.946600E+01   9.946590E+01   9.946580E+01   9.946570E+01   9.946560E+01   9.946550E+01   9.946540E+01   9.946530E+01   9.946520E+01   9.946510E+01   9.946500E+01   9.946490E+01   9.946480E+01   9.946470E+01   9.946460E+01   9.946450E+01   9.946440E+01   9.946430E+01   9.946420E+01   9.946410E+01   9.946400E+01   9.946390E+01   9.946380E+01   9.946370E+01   9.946360E+01   9.946350E+01   9.946340E+01   9.946330E+01   9.946320E+01   9.946310E+01   9.946300E+01   9.946290E+01   9.946280E+01   9.946270E+01   9.946260E+01   9.946250E+01   9.946240E+01   9.946230E+01   9.946220E+01   9.946210E+01   9.946200E+01   9.946190E+01   9.946180E+01   9.946170E+01   9.946160E+01   9.946150E+01   9.946140E+01   9.946130E+01   9.946120E+01   9.946110E+01   9.946100E+01   9.946090E+01   9.946080E+01   9.946070E+01   9.946060E+01   9.946050E+01   9.946040E+01   9.946030E+01   9.946020E+01   9.946010E+01   9.946000E+01   9.945990E+01   9.945980E+01   9.945970E+01   9.945960E+01   9.945950E+01   9.945940E+01   9.945930E+01   9.945920E+01   9.945910E+01   9.945900E+01   9.945890E+01   9.945880E+01   9.945870E+01   9.945860E+01   9.945850E+01   9.945840E+01   9.945830E+01   9.945820E+01   9.945810E+01   9.945800E+01   9.945790E+01   9.945780E+01   9.945770E+01   9.945760E+01   9.945750E+01   9.945740E+01   9.945730E+01   9.945720E+01   9.945710E+01   9.945700E+01   9.945690E+01   9.945680E+01   9.945670E+01   9.945660E+01   9.945650E+01   9.945640E+01   9.945630E+01   9.945620E+01   9.945610E+01   9.945600E+01   9.945590E+01   9.945580E+01   9.945570E+01   9.945560E+01   9.945550E+01   9.945540E+01   9.945530E+01   9.945520E+01   9.945510E+01   9.945500E+01   9.945490E+01   9.945480E+01   9.945470E+01   9.945460E+01   9.945450E+01   9.945440E+01   9.945430E+01   9.945420E+01   9.945410E+01   9.945400E+01   9.945390E+01   9.945380E+01   9.945370E+01   9.945360E+01   9.945350E+01   9.945340E+01   9.945330E+01   9.945320E+01   9.945310E+01   9.945300E+01   9.945290E+01   9.945280E+01   9.945270E+01   9.945260E+01   9.945250E+01   9.945240E+01   9.945230E+01   9.945220E+01   9.945210E+01   9.945200E+01   9.945190E+01   9.945180E+01   9.945170E+01   9.945160E+01   9.945150E+01   9.945140E+01   9.945130E+01   9.945120E+01   9.945110E+01   9.945100E+01   9.945090E+01   9.945080E+01   9.945070E+01   9.945060E+01   9.945050E+01   9.945040E+01   9.945030E+01   9.945020E+01   9.945010E+01   9.945000E+01   9.944990E+01   9.944980E+01   9.944970E+01   9.944960E+01   9.944950E+01   9.944940E+01   9.944930E+01   9.944920E+01   9.944910E+01   9.944900E+01   9.944890E+01   9.944880E+01   9.944870E+01   9.944860E+01   9.944850E+01   9.944840E+01   9.944830E+01   9.944820E+01   9.944810E+01   9.944800E+01   9.944790E+01   9.944780E+01   9.944770E+01   9.944760E+01   9.944750E+01   9.944740E+01   9.944730E+01   9.944720E+01   9.944710E+01   9.944700E+01   9.944690E+01   9.944680E+01   9.944670E+01   9.944660E+01   9.944650E+01   9.944640E+01   9.944630E+01   9.944620E+01   9.944610E+01   9.944600E+01   9.944590E+01   9.944580E+01   9.944570E+01   9.944560E+01   9.944550E+01   9.944540E+01   9.944530E+01   9.944520E+01   9.944510E+01   9.944500E+01   9.944490E+01   9.944480E+01   9.944470E+01   9.944460E+01   9.944450E+01   9.944440E+01   9.944430E+01   9.944420E+01   9.944410E+01   9.944400E+01   9.944390E+01   9.944380E+01   9.944370E+01   9.944360E+01   9.944350E+01   9.944340E+01   9.944330E+01   9.944320E+01   9.944310E+01   9.944300E+01   9.944290E+01   9.944280E+01   9.944270E+01   9.944260E+01   9.944250E+01   9.944240E+01   9.944230E+01   9.944220E+01   9.944210E+01   9.944200E+01   9.944190E+01   9.944180E+01   9.944170E+01   9.944160E+01   9.944150E+01   9.944140E+01   9.944130E+01   9.944120E+01   9.944110E+01   9.944100E+01   9.944090E+01   9.944080E+01   9.944070E+01   9.944060E+01   9.944050E+01   9.944040E+01   9.944030E+01   9.944020E+01   9.944010E+01   9.944000E+01   9.943990E+01   9.943980E+01   9.943970E+01   9.943960E+01   9.943950E+01   9.943940E+01   9.943930E+01   9.943920E+01   9.943910E+01   9.943900E+01   9.943890E+01   9.943880E+01   9.943870E+01   9.943860E+01   9.943850E+01   9.943840E+01   9.943830E+01   9.943820E+01   9.943810E+01   9.943800E+01   9.943790E+01   9.943780E+01   9.943770E+01   9.943760E+01   9.943750E+01   9.943740E+01   9.943730E+01   9.943720E+01   9.943710E+01   9.943700E+01   9.943690E+01   9.943680E+01   9.943670E+01   9.943660E+01   9.943650E+01   9.943640E+01   9.943630E+01   9.943620E+01   9.943610E+01   9.943600E+01   9.943590E+01   9.943580E+01   9.943570E+01   9.943560E+01   9.943550E+01   9.943540E+01   9.943530E+01   9.943520E+01   9.943510E+01
+   9.950000E+01   9.949990E+01   9.949980E+01   9.949970E+01   9.949960E+01   9.949950E+01   9.949940E+01   9.949930E+01   9.949920E+01   9.949910E+01   9.949900E+01   9.949890E+01   9.949880E+01   9.949870E+01   9.949860E+01   9.949850E+01   9.949840E+01   9.949830E+01   9.949820E+01   9.949810E+01   9.949800E+01   9.949790E+01   9.949780E+01   9.949770E+01   9.949760E+01   9.949750E+01   9.949740E+01   9.949730E+01   9.949720E+01   9.949710E+01   9.949700E+01   9.949690E+01   9.949680E+01   9.949670E+01   9.949660E+01   9.949650E+01   9.949640E+01   9.949630E+01   9.949620E+01   9.949610E+01   9.949600E+01   9.949590E+01   9.949580E+01   9.949570E+01   9.949560E+01   9.949550E+01   9.949540E+01   9.949530E+01   9.949520E+01   9.949510E+01   9.949500E+01   9.949490E+01   9.949480E+01   9.949470E+01   9.949460E+01   9.949450E+01   9.949440E+01   9.949430E+01   9.949420E+01   9.949410E+01   9.949400E+01   9.949390E+01   9.949380E+01   9.949370E+01   9.949360E+01   9.949350E+01   9.949340E+01   9.949330E+01   9.949320E+01   9.949310E+01   9.949300E+01   9.949290E+01   9.949280E+01   9.949270E+01   9.949260E+01   9.949250E+01   9.949240E+01   9.949230E+01   9.949220E+01   9.949210E+01   9.949200E+01   9.949190E+01   9.949180E+01   9.949170E+01   9.949160E+01   9.949150E+01   9.949140E+01   9.949130E+01   9.949120E+01   9.949110E+01   9.949100E+01   9.949090E+01   9.949080E+01   9.949070E+01   9.949060E+01   9.949050E+01   9.949040E+01   9.949030E+01   9.949020E+01   9.949010E+01   9.949000E+01   9.948990E+01   9.948980E+01   9.948970E+01   9.948960E+01   9.948950E+01   9.948940E+01   9.948930E+01   9.948920E+01   9.948910E+01   9.948900E+01   9.948890E+01   9.948880E+01   9.948870E+01   9.948860E+01   9.948850E+01   9.948840E+01   9.948830E+01   9.948820E+01   9.948810E+01   9.948800E+01   9.948790E+01   9.948780E+01   9.948770E+01   9.948760E+01   9.948750E+01   9.948740E+01   9.948730E+01   9.948720E+01   9.948710E+01   9.948700E+01   9.948690E+01   9.948680E+01   9.948670E+01   9.948660E+01   9.948650E+01   9.948640E+01   9.948630E+01   9.948620E+01   9.948610E+01   9.948600E+01   9.948590E+01   9.948580E+01   9.948570E+01   9.948560E+01   9.948550E+01   9.948540E+01   9.948530E+01   9.948520E+01   9.948510E+01   9.948500E+01   9.948490E+01   9.948480E+01   9.948470E+01   9.948460E+01   9.948450E+01   9.948440E+01   9.948430E+01   9.948420E+01   9.948410E+01   9.948400E+01   9.948390E+01   9.948380E+01   9.948370E+01   9.948360E+01   9.948350E+01   9.948340E+01   9.948330E+01   9.948320E+01   9.948310E+01   9.948300E+01   9.948290E+01   9.948280E+01   9.948270E+01   9.948260E+01   9.948250E+01   9.948240E+01   9.948230E+01   9.948220E+01   9.948210E+01   9.948200E+01   9.948190E+01   9.948180E+01   9.948170E+01   9.948160E+01   9.948150E+01   9.948140E+01   9.948130E+01   9.948120E+01   9.948110E+01   9.948100E+01   9.948090E+01   9.948080E+01   9.948070E+01   9.948060E+01   9.948050E+01   9.948040E+01   9.948030E+01   9.948020E+01   9.948010E+01   9.948000E+01   9.947990E+01   9.947980E+01   9.947970E+01   9.947960E+01   9.947950E+01   9.947940E+01   9.947930E+01   9.947920E+01   9.947910E+01   9.947900E+01   9.947890E+01   9.947880E+01   9.947870E+01   9.947860E+01   9.947850E+01   9.947840E+01   9.947830E+01   9.947820E+01   9.947810E+01   9.947800E+01   9.947790E+01   9.947780E+01   9.947770E+01   9.947760E+01   9.947750E+01   9.947740E+01   9.947730E+01   9.947720E+01   9.947710E+01   9.947700E+01   9.947690E+01   9.947680E+01   9.947670E+01   9.947660E+01   9.947650E+01   9.947640E+01   9.947630E+01   9.947620E+01   9.947610E+01   9.947600E+01   9.947590E+01   9.947580E+01   9.947570E+01   9.947560E+01   9.947550E+01   9.947540E+01   9.947530E+01   9.947520E+01   9.947510E+01   9.947500E+01   9.947490E+01   9.947480E+01   9.947470E+01   9.947460E+01   9.947450E+01   9.947440E+01   9.947430E+01   9.947420E+01   9.947410E+01   9.947400E+01   9.947390E+01   9.947380E+01   9.947370E+01   9.947360E+01   9.947350E+01   9.947340E+01   9.947330E+01   9.947320E+01   9.947310E+01   9.947300E+01   9.947290E+01   9.947280E+01   9.947270E+01   9.947260E+01   9.947250E+01   9.947240E+01   9.947230E+01   9.947220E+01   9.947210E+01   9.947200E+01   9.947190E+01   9.947180E+01   9.947170E+01   9.947160E+01   9.947150E+01   9.947140E+01   9.947130E+01   9.947120E+01   9.947110E+01   9.947100E+01   9.947090E+01   9.947080E+01   9.947070E+01   9.947060E+01   9.947050E+01   9.947040E+01   9.947030E+01   9.947020E+01   9.947010E+01   9.947000E+01   9.946990E+01   9.946980E+01   9.946970E+01   9.946960E+01   9.946950E+01   9.946940E+01   9.946930E+01   9.946920E+01   9.946910E+01   9.946900E+01   9.946890E+01   9.946880E+01   9.946870E+01   9.946860E+01   9.946850E+01   9.946840E+01   9.946830E+01   9.946820E+01   9.946810E+01   9.946800E+01   9.946790E+01   9.946780E+01   9.946770E+01   9.946760E+01   9.946750E+01   9.946740E+01   9.946730E+01   9.946720E+01   9.946710E+01   9.946700E+01   9.946690E+01   9.946680E+01   9.946670E+01   9.946660E+01   9.946650E+01   9.946640E+01   9.946630E+01   9.946620E+01   9.946610E+01   9.946600E+01   9.946590E+01   9.946580E+01   9.946570E+01   9.946560E+01   9.946550E+01   9.946540E+01   9.946530E+01   9.946520E+01   9.946510E+01   9.946500E+01   9.946490E+01   9.946480E+01   9.946470E+01   9.946460E+01   9.946450E+01   9.946440E+01   9.946430E+01   9.946420E+01   9.946410E+01   9.946400E+01   9.946390E+01   9.946380E+01   9.946370E+01   9.946360E+01   9.946350E+01   9.946340E+01   9.946330E+01   9.946320E+01   9.946310E+01   9.946300E+01   9.946290E+01   9.946280E+01   9.946270E+01   9.946260E+01   9.946250E+01   9.946240E+01   9.946230E+01   9.946220E+01   9.946210E+01   9.946200E+01   9.946190E+01   9.946180E+01   9.946170E+01   9.946160E+01   9.946150E+01   9.946140E+01   9.946130E+01   9.946120E+01   9.946110E+01   9.946100E+01   9.946090E+01   9.946080E+01   9.946070E+01   9.946060E+01   9.946050E+01   9.946040E+01   9.946030E+01   9.946020E+01   9.946010E+01   9.946000E+01   9.945990E+01   9.945980E+01   9.945970E+01   9.945960E+01   9.945950E+01   9.945940E+01   9.945930E+01   9.945920E+01   9.945910E+01   9.945900E+01   9.945890E+01   9.945880E+01   9.945870E+01   9.945860E+01   9.945850E+01   9.945840E+01   9.945830E+01   9.945820E+01   9.945810E+01   9.945800E+01   9.945790E+01   9.945780E+01   9.945770E+01   9.945760E+01   9.945750E+01   9.945740E+01   9.945730E+01   9.945720E+01   9.945710E+01   9.945700E+01   9.945690E+01   9.945680E+01   9.945670E+01   9.945660E+01   9.945650E+01   9.945640E+01   9.945630E+01   9.945620E+01   9.945610E+01   9.945600E+01   9.945590E+01   9.945580E+01   9.945570E+01   9.945560E+01   9.945550E+01   9.945540E+01   9.945530E+01   9.945520E+01   9.945510E+01   9.945500E+01   9.945490E+01   9.945480E+01   9.945470E+01   9.945460E+01   9.945450E+01   9.945440E+01   9.945430E+01   9.945420E+01   9.945410E+01   9.945400E+01   9.945390E+01   9.945380E+01   9.945370E+01   9.945360E+01   9.945350E+01   9.945340E+01   9.945330E+01   9.945320E+01   9.945310E+01   9.945300E+01   9.945290E+01   9.945280E+01   9.945270E+01   9.945260E+01   9.945250E+01   9.945240E+01   9.945230E+01   9.945220E+01   9.945210E+01   9.945200E+01   9.945190E+01   9.945180E+01   9.945170E+01   9.945160E+01   9.945150E+01   9.945140E+01   9.945130E+01   9.945120E+01   9.945110E+01   9.945100E+01   9.945090E+01   9.945080E+01   9.945070E+01   9.945060E+01   9.945050E+01   9.945040E+01   9.945030E+01   9.945020E+01   9.945010E+01   9.945000E+01   9.944990E+01   9.944980E+01   9.944970E+01   9.944960E+01   9.944950E+01   9.944940E+01   9.944930E+01   9.944920E+01   9.944910E+01   9.944900E+01   9.944890E+01   9.944880E+01   9.944870E+01   9.944860E+01   9.944850E+01   9.944840E+01   9.944830E+01   9.944820E+01   9.944810E+01   9.944800E+01   9.944790E+01   9.944780E+01   9.944770E+01   9.944760E+01   9.944750E+01   9.944740E+01   9.944730E+01   9.944720E+01   9.944710E+01   9.944700E+01   9.944690E+01   9.944680E+01   9.944670E+01   9.944660E+01   9.944650E+01   9.944640E+01   9.944630E+01   9.944620E+01   9.944610E+01   9.944600E+01   9.944590E+01   9.944580E+01   9.944570E+01   9.944560E+01   9.944550E+01   9.944540E+01   9.944530E+01   9.944520E+01   9.944510E+01   9.944500E+01   9.944490E+01   9.944480E+01   9.944470E+01   9.944460E+01   9.944450E+01   9.944440E+01   9.944430E+01   9.944420E+01   9.944410E+01   9.944400E+01   9.944390E+01   9.944380E+01   9.944370E+01   9.944360E+01   9.944350E+01   9.944340E+01   9.944330E+01   9.944320E+01   9.944310E+01   9.944300E+01   9.944290E+01   9.944280E+01   9.944270E+01   9.944260E+01   9.944250E+01   9.944240E+01   9.944230E+01   9.944220E+01   9.944210E+01   9.944200E+01   9.944190E+01   9.944180E+01   9.944170E+01   9.944160E+01   9.944150E+01   9.944140E+01   9.944130E+01   9.944120E+01   9.944110E+01   9.944100E+01   9.944090E+01   9.944080E+01   9.944070E+01   9.944060E+01   9.944050E+01   9.944040E+01   9.944030E+01   9.944020E+01   9.944010E+01   9.944000E+01   9.943990E+01   9.943980E+01   9.943970E+01   9.943960E+01   9.943950E+01   9.943940E+01   9.943930E+01   9.943920E+01   9.943910E+01   9.943900E+01   9.943890E+01   9.943880E+01   9.943870E+01   9.943860E+01   9.943850E+01   9.943840E+01   9.943830E+01   9.943820E+01   9.943810E+01   9.943800E+01   9.943790E+01   9.943780E+01   9.943770E+01   9.943760E+01   9.943750E+01   9.943740E+01   9.943730E+01   9.943720E+01   9.943710E+01   9.943700E+01   9.943690E+01   9.943680E+01   9.943670E+01   9.943660E+01   9.943650E+01   9.943640E+01   9.943630E+01   9.943620E+01   9.943610E+01   9.943600E+01   9.943590E+01   9.943580E+01   9.943570E+01   9.943560E+01   9.943550E+01   9.943540E+01   9.943530E+01   9.943520E+01   9.943510E+01
+   9.950000E+01   9.949990E+01   9.949980E+01   9.949970E+01   9.949960E+01   9.949950E+01   9.949940E+01   9.949930E+01   9.949920E+01   9.949910E+01   9.949900E+01   9.949890E+01   9.949880E+01   9.949870E+01   9.949860E+01   9.949850E+01   9.949840E+01   9.949830E+01   9.949820E+01   9.949810E+01   9.949800E+01   9.949790E+01   9.949780E+01   9.949770E+01   9.949760E+01   9.949750E+01   9.949740E+01   9.949730E+01   9.949720E+01   9.949710E+01   9.949700E+01   9.949690E+01   9.949680E+01   9.949670E+01   9.949660E+01   9.949650E+01   9.949640E+01   9.949630E+01   9.949620E+01   9.949610E+01   9.949600E+01   9.949590E+01   9.949580E+01   9.949570E+01   9.949560E+01   9.949550E+01   9.949540E+01   9.949530E+01   9.949520E+01   9.949510E+01   9.949500E+01   9.949490E+01   9.949480E+01   9.949470E+01   9.949460E+01   9.949450E+01   9.949440E+01   9.949430E+01   9.949420E+01   9.949410E+01   9.949400E+01   9.949390E+01   9.949380E+01   9.949370E+01   9.949360E+01   9.949350E+01   9.949340E+01   9.949330E+01   9.949320E+01   9.949310E+01   9.949300E+01   9.949290E+01   9.949280E+01   9.949270E+01   9.949260E+01   9.949250E+01   9.949240E+01   9.949230E+01   9.949220E+01   9.949210E+01   9.949200E+01   9.949190E+01   9.949180E+01   9.949170E+01   9.949160E+01   9.949150E+01   9.949140E+01   9.949130E+01   9.949120E+01   9.949110E+01   9.949100E+01   9.949090E+01   9.949080E+01   9.949070E+01   9.949060E+01   9.949050E+01   9.949040E+01   9.949030E+01   9.949020E+01   9.949010E+01   9.949000E+01   9.948990E+01   9.948980E+01   9.948970E+01   9.948960E+01   9.948950E+01   9.948940E+01   9.948930E+01   9.948920E+01   9.948910E+01   9.948900E+01   9.948890E+01   9.948880E+01   9.948870E+01   9.948860E+01   9.948850E+01   9.948840E+01   9.948830E+01   9.948820E+01   9.948810E+01   9.948800E+01   9.948790E+01   9.948780E+01   9.948770E+01   9.948760E+01   9.948750E+01   9.948740E+01   9.948730E+01   9.948720E+01   9.948710E+01   9.948700E+01   9.948690E+01   9.948680E+01   9.948670E+01   9.948660E+01   9.948650E+01   9.948640E+01   9.948630E+01   9.948620E+01   9.948610E+01   9.948600E+01   9.948590E+01   9.948580E+01   9.948570E+01   9.948560E+01   9.948550E+01   9.948540E+01   9.948530E+01   9.948520E+01   9.948510E+01   9.948500E+01   9.948490E+01   9.948480E+01   9.948470E+01   9.948460E+01   9.948450E+01   9.948440E+01   9.948430E+01   9.948420E+01   9.948410E+01   9.948400E+01   9.948390E+01   9.948380E+01   9.948370E+01   9.948360E+01   9.948350E+01   9.948340E+01   9.948330E+01   9.948320E+01   9.948310E+01   9.948300E+01   9.948290E+01   9.948280E+01   9.948270E+01   9.948260E+01   9.948250E+01   9.948240E+01   9.948230E+01   9.948220E+01   9.948210E+01   9.948200E+01   9.948190E+01   9.948180E+01   9.948170E+01   9.948160E+01   9.948150E+01   9.948140E+01   9.948130E+01   9.948120E+01   9.948110E+01   9.948100E+01   9.948090E+01   9.948080E+01   9.948070E+01   9.948060E+01   9.948050E+01   9.948040E+01   9.948030E+01   9.948020E+01   9.948010E+01   9.948000E+01   9.947990E+01   9.947980E+01   9.947970E+01   9.947960E+01   9.947950E+01   9.947940E+01   9.947930E+01   9.947920E+01   9.947910E+01   9.947900E+01   9.947890E+01   9.947880E+01   9.947870E+01   9.947860E+01   9.947850E+01   9.947840E+01   9.947830E+01   9.947820E+01   9.947810E+01   9.947800E+01   9.947790E+01   9.947780E+01   9.947770E+01   9.947760E+01   9.947750E+01   9.947740E+01   9.947730E+01   9.947720E+01   9.947710E+01   9.947700E+01   9.947690E+01   9.947680E+01   9.947670E+01   9.947660E+01   9.947650E+01   9.947640E+01   9.947630E+01   9.947620E+01   9.947610E+01   9.947600E+01   9.947590E+01   9.947580E+01   9.947570E+01   9.947560E+01   9.947550E+01   9.947540E+01   9.947530E+01   9.947520E+01   9.947510E+01   9.947500E+01   9.947490E+01   9.947480E+01   9.947470E+01   9.947460E+01   9.947450E+01   9.947440E+01   9.947430E+01   9.947420E+01   9.947410E+01   9.947400E+01   9.947390E+01   9.947380E+01   9.947370E+01   9.947360E+01   9.947350E+01   9.947340E+01   9.947330E+01   9.947320E+01   9.947310E+01   9.947300E+01   9.947290E+01   9.947280E+01   9.947270E+01   9.947260E+01   9.947250E+01   9.947240E+01   9.947230E+01   9.947220E+01   9.947210E+01   9.947200E+01   9.947190E+01   9.947180E+01   9.947170E+01   9.947160E+01   9.947150E+01   9.947140E+01   9.947130E+01   9.947120E+01   9.947110E+01   9.947100E+01   9.947090E+01   9.947080E+01   9.947070E+01   9.947060E+01   9.947050E+01   9.947040E+01   9.947030E+01   9.947020E+01   9.947010E+01   9.947000E+01   9.946990E+01   9.946980E+01   9.946970E+01   9.946960E+01   9.946950E+01   9.946940E+01   9.946930E+01   9.946920E+01   9.946910E+01   9.946900E+01   9.946890E+01   9.946880E+01   9.946870E+01   9.946860E+01   9.946850E+01   9.946840E+01   9.946830E+01   9.946820E+01   9.946810E+01   9.946800E+01   9.946790E+01   9.946780E+01   9.946770E+01   9.946760E+01   9.946750E+01   9.946740E+01   9.946730E+01   9.946720E+01   9.946710E+01   9.946700E+01   9.946690E+01   9.946680E+01   9.946670E+01   9.946660E+01   9.946650E+01   9.946640E+01   9.946630E+01   9.946620E+01   9.946610E+01   9.946600E+01   9.946590E+01   9.946580E+01   9.946570E+01   9.946560E+01   9.946550E+01   9.946540E+01   9.946530E+01   9.946520E+01   9.946510E+01   9.946500E+01   9.946490E+01   9.946480E+01   9.946470E+01   9.946460E+01   9.946450E+01   9.946440E+01   9.946430E+01   9.946420E+01   9.946410E+01   9.946400E+01   9.946390E+01   9.946380E+01   9.946370E+01   9.946360E+01   9.946350E+01   9.946340E+01   9.946330E+01   9.946320E+01   9.946310E+01   9.946300E+01   9.946290E+01   9.946280E+01   9.946270E+01   9.946260E+01   9.946250E+01   9.946240E+01   9.946230E+01   9.946220E+01   9.946210E+01   9.946200E+01   9.946190E+01   9.946180E+01   9.946170E+01   9.946160E+01   9.946150E+01   9.946140E+01   9.946130E+01   9.946120E+01   9.946110E+01   9.946100E+01   9.946090E+01   9.946080E+01   9.946070E+01   9.946060E+01   9.946050E+01   9.946040E+01   9.946030E+01   9.946020E+01   9.946010E+01   9.946000E+01   9.945990E+01   9.945980E+01   9.945970E+01   9.945960E+01   9.945950E+01   9.945940E+01   9.945930E+01   9.945920E+01   9.945910E+01   9.945900E+01   9.945890E+01   9.945880E+01   9.945870E+01   9.945860E+01   9.945850E+01   9.945840E+01   9.945830E+01   9.945820E+01   9.945810E+01   9.945800E+01   9.945790E+01   9.945780E+01   9.945770E+01   9.945760E+01   9.945750E+01   9.945740E+01   9.945730E+01   9.945720E+01   9.945710E+01   9.945700E+01   9.945690E+01   9.945680E+01   9.945670E+01   9.945660E+01   9.945650E+01   9.945640E+01   9.945630E+01   9.945620E+01   9.945610E+01   9.945600E+01   9.945590E+01   9.945580E+01   9.945570E+01   9.945560E+01   9.945550E+01   9.945540E+01   9.945530E+01   9.945520E+01   9.945510E+01   9.945500E+01   9.945490E+01   9.945480E+01   9.945470E+01   9.945460E+01   9.945450E+01   9.945440E+01   9.945430E+01   9.945420E+01   9.945410E+01   9.945400E+01   9.945390E+01   9.945380E+01   9.945370E+01   9.945360E+01   9.945350E+01   9.945340E+01   9.945330E+01   9.945320E+01   9.945310E+01   9.945300E+01   9.945290E+01   9.945280E+01   9.945270E+01   9.945260E+01   9.945250E+01   9.945240E+01   9.945230E+01   9.945220E+01   9.945210E+01   9.945200E+01   9.945190E+01   9.945180E+01   9.945170E+01   9.945160E+01   9.945150E+01   9.945140E+01   9.945130E+01   9.945120E+01   9.945110E+01   9.945100E+01   9.945090E+01   9.945080E+01   9.945070E+01   9.945060E+01   9.945050E+01   9.945040E+01   9.945030E+01   9.945020E+01   9.945010E+01   9.945000E+01   9.944990E+01   9.944980E+01   9.944970E+01   9.944960E+01   9.944950E+01   9.944940E+01   9.944930E+01   9.944920E+01   9.944910E+01   9.944900E+01   9.944890E+01   9.944880E+01   9.944870E+01   9.944860E+01   9.944850E+01   9.944840E+01   9.944830E+01   9.944820E+01   9.944810E+01   9.944800E+01   9.944790E+01   9.944780E+01   9.944770E+01   9.944760E+01   9.944750E+01   9.944740E+01   9.944730E+01   9.944720E+01   9.944710E+01   9.944700E+01   9.944690E+01   9.944680E+01   9.944670E+01   9.944660E+01   9.944650E+01   9.944640E+01   9.944630E+01   9.944620E+01   9.944610E+01   9.944600E+01   9.944590E+01   9.944580E+01   9.944570E+01   9.944560E+01   9.944550E+01   9.944540E+01   9.944530E+01   9.944520E+01   9.944510E+01   9.944500E+01   9.944490E+01   9.944480E+01   9.944470E+01   9.944460E+01   9.944450E+01   9.944440E+01   9.944430E+01   9.944420E+01   9.944410E+01   9.944400E+01   9.944390E+01   9.944380E+01   9.944370E+01   9.944360E+01   9.944350E+01   9.944340E+01   9.944330E+01   9.944320E+01   9.944310E+01   9.944300E+01   9.944290E+01   9.944280E+01   9.944270E+01   9.944260E+01   9.944250E+01   9.944240E+01   9.944230E+01   9.944220E+01   9.944210E+01   9.944200E+01   9.944190E+01   9.944180E+01   9.944170E+01   9.944160E+01   9.944150E+01   9.944140E+01   9.944130E+01   9.944120E+01   9.944110E+01   9.944100E+01   9.944090E+01   9.944080E+01   9.944070E+01   9.944060E+01   9.944050E+01   9.944040E+01   9.944030E+01   9.944020E+01   9.944010E+01   9.944000E+01   9.943990E+01   9.943980E+01   9.943970E+01   9.943960E+01   9.943950E+01   9.943940E+01   9.943930E+01   9.943920E+01   9.943910E+01   9.943900E+01   9.943890E+01   9.943880E+01   9.943870E+01   9.943860E+01   9.943850E+01   9.943840E+01   9.943830E+01   9.943820E+01   9.943810E+01   9.943800E+01   9.943790E+01   9.943780E+01   9.943770E+01   9.943760E+01   9.943750E+01   9.943740E+01   9.943730E+01   9.943720E+01   9.943710E+01   9.943700E+01   9.943690E+01   9.943680E+01   9.943670E+01   9.943660E+01   9.943650E+01   9.943640E+01   9.943630E+01   9.943620E+01   9.943610E+01   9.943600E+01   9.943590E+01   9.943580E+01   9.943570E+01   9.943560E+01   9.943550E+01   9.943540E+01   9.943530E+01   9.943520E+01   9.943510E+01
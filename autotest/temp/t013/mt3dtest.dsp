@@ -0,0 +1,4 @@
+         0      0.01                           -1 #al layer 1
+         0       0.1                           -1 #trpt
+         0      0.01                           -1 #trpv
+         0     1E-09                           -1 #dmcoef1
@@ -0,0 +1,14 @@
+ptf ~
+# LPF package for  MODFLOW-2005, generated by Flopy.
+         0    -1E+30         0  
+         0         0         0
+         0         0         0
+   1.000000E+00   1.000000E+00   1.000000E+00
+         0         0         0
+         0         0         0
+CONSTANT ~ HK_LAYER_1  ~    #hk Layer 1
+CONSTANT    1.000000E+00                           #vka1                          
+CONSTANT 10.0    #hk Layer 2
+CONSTANT    1.000000E+00                           #vka2                          
+CONSTANT 10.0    #hk Layer 3
+CONSTANT    1.000000E+00                           #vka3                          
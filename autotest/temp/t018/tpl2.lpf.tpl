@@ -0,0 +1,94 @@
+ptf ~
+# LPF package for  MODFLOW-2005, generated by Flopy.
+         0    -1E+30         0  
+         0         0         0
+         0         0         0
+   1.000000E+00   1.000000E+00   1.000000E+00
+         0         0         0
+         0         0         0
+INTERNAL ~ HK_LAYER_1-3  ~ (FREE) -1      #hk Layer 1
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+CONSTANT    1.000000E+00                           #vka1                          
+CONSTANT 10.0    #hk Layer 2
+CONSTANT    1.000000E+00                           #vka2                          
+INTERNAL ~ HK_LAYER_1-3  ~ (FREE) -1      #hk Layer 3
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+CONSTANT    1.000000E+00                           #vka3                          
@@ -0,0 +1,54 @@
+ptf ~
+# LPF package for  MODFLOW-2005, generated by Flopy.
+         0    -1E+30         0  
+         0         0         0
+         0         0         0
+   1.000000E+00   1.000000E+00   1.000000E+00
+         0         0         0
+         0         0         0
+INTERNAL 1.0 (FREE) -1      #hk Layer 1
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0            10.0
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~ ~    hk_2     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_3     ~
+ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_3     ~
+ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_3     ~
+ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_3     ~
+ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~
+            10.0            10.0            10.0            10.0            10.0            10.0            10.0 ~    hk_2     ~ ~    hk_2     ~ ~    hk_3     ~
+ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~ ~    hk_3     ~
+CONSTANT ~    vka_1    ~    #vka1
+CONSTANT ~    hk_4     ~    #hk Layer 2
+CONSTANT ~    vka_2    ~    #vka2
+CONSTANT 10.0    #hk Layer 3
+CONSTANT ~    vka_1    ~    #vka3
@@ -0,0 +1,91 @@
+# BAS6 package for  MODFLOW-2005, generated by Flopy.
+FREE
+INTERNAL               1    (15I10) -1 #ibound layer 1                
+         0         0         0         0         0         1         1         2         1         1         0         0         0         0         0
+         0         0         0         0         2         1         1         2         1         1         1         2         0         0         0
+         0         0         0         2         1         1         1         1         1         1         1         1         0         0         0
+         0         0         0         1         1         1         1         1         1         1         1         2         0         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         2         1         1         1         1         1         1         1         2         0         0         0
+         0         0         0         0         0         0         2         1         1         1         0         0         0         0         0
+         0         0         0         0         0         0         0        -1        -1         0         0         0         0         0         0
+INTERNAL               1    (15I10) -1 #ibound layer 2                
+         0         0         0         0         0         1         1         2         1         1         0         0         0         0         0
+         0         0         0         0         2         1         1         2         1         1         1         2         0         0         0
+         0         0         0         2         1         1         1         1         1         1         1         1         0         0         0
+         0         0         0         1         1         1         1         1         1         1         1         2         0         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         2         1         1         1         1         1         1         1         2         0         0         0
+         0         0         0         0         0         0         2         1         1         1         0         0         0         0         0
+         0         0         0         0         0         0         0        -1        -1         0         0         0         0         0         0
+INTERNAL               1    (15I10) -1 #ibound layer 3                
+         0         0         0         0         0         1         1         2         1         1         0         0         0         0         0
+         0         0         0         0         2         1         1         2         1         1         1         2         0         0         0
+         0         0         0         2         1         1         1         1         1         1         1         1         0         0         0
+         0         0         0         1         1         1         1         1         1         1         1         2         0         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         2         1         1         1         1         1         1         1         2         0         0         0
+         0         0         0         0         0         0         2         1         1         1         0         0         0         0         0
+         0         0         0         0         0         0         0        -1        -1         0         0         0         0         0         0
+INTERNAL               1    (15I10) -1 #ibound layer 4                
+         0         0         0         0         0         1         1         2         1         1         0         0         0         0         0
+         0         0         0         0         2         1         1         2         1         1         1         2         0         0         0
+         0         0         0         2         1         1         1         1         1         1         1         1         0         0         0
+         0         0         0         1         1         1         1         1         1         1         1         2         0         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         0         1         1         1         1         1         1         1         1         1         1         1         1         1         0
+         0         2         1         1         1         1         1         1         1         1         1         1         1         2         0
+         0         0         1         1         1         1         1         1         1         1         1         1         1         0         0
+         0         0         2         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         1         1         1         1         1         1         1         1         1         2         0         0
+         0         0         0         2         1         1         1         1         1         1         1         2         0         0         0
+         0         0         0         0         0         0         2         1         1         1         0         0         0         0         0
+         0         0         0         0         0         0         0        -1        -1         0         0         0         0         0         0
+   -999.99
+CONSTANT    1.000000E+02                           #strt layer 1                  
+CONSTANT    1.000000E+02                           #strt layer 2                  
+CONSTANT    1.000000E+02                           #strt layer 3                  
+CONSTANT    1.000000E+02                           #strt layer 4                  
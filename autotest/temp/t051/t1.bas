@@ -0,0 +1,18 @@
+# BAS6 package for  MODFLOW-2005, generated by Flopy.
+FREE
+INTERNAL               1     (3I10) -1 #ibound layer 1                
+         1         1        -1
+         1         0         1
+         1         1         1
+INTERNAL               1     (3I10) -1 #ibound layer 2                
+         1         1         1
+         1         1         1
+         1         1         1
+INTERNAL               1     (3I10) -1 #ibound layer 3                
+         1         1         1
+         1         1         1
+         1         1         1
+   -999.99
+CONSTANT    1.000000E+00                           #strt layer 1                  
+CONSTANT    1.000000E+00                           #strt layer 2                  
+CONSTANT    1.000000E+00                           #strt layer 3                  
@@ -0,0 +1,373 @@
+BEGIN attributes
+  NAMES  tides
+  METHODS  linear
+END attributes
+
+BEGIN timeseries
+       0.00000000      -2.50000000
+       0.05000000      -2.10000000
+       0.20600000       2.10000000
+       0.25600000       2.50000000
+       0.30600000       2.00000000
+       0.46200000      -2.40000000
+       0.51200000      -2.80000000
+       0.56200000      -2.40000000
+       0.71800000       2.40000000
+       0.76800000       2.80000000
+       0.81800000       2.40000000
+       0.97400000      -2.10000000
+       1.02400000      -2.50000000
+       1.07400000      -2.10000000
+       1.23000000       2.10000000
+       1.28000000       2.50000000
+       1.33000000       2.00000000
+       1.48600000      -2.40000000
+       1.53600000      -2.80000000
+       1.58600000      -2.40000000
+       1.74200000       2.40000000
+       1.79200000       2.80000000
+       1.84200000       2.40000000
+       1.99800000      -2.10000000
+       2.04800000      -2.50000000
+       2.09800000      -2.10000000
+       2.25400000       2.10000000
+       2.30400000       2.50000000
+       2.35400000       2.00000000
+       2.51000000      -2.40000000
+       2.56000000      -2.80000000
+       2.61000000      -2.40000000
+       2.76600000       2.40000000
+       2.81600000       2.80000000
+       2.86600000       2.40000000
+       3.02200000      -2.10000000
+       3.07200000      -2.50000000
+       3.12200000      -2.10000000
+       3.27800000       2.10000000
+       3.32800000       2.50000000
+       3.37800000       2.00000000
+       3.53400000      -2.40000000
+       3.58400000      -2.80000000
+       3.63400000      -2.40000000
+       3.79000000       2.40000000
+       3.84000000       2.80000000
+       3.89000000       2.40000000
+       4.04600000      -2.10000000
+       4.09600000      -2.50000000
+       4.14600000      -2.10000000
+       4.30200000       2.10000000
+       4.35200000       2.50000000
+       4.40200000       2.00000000
+       4.55800000      -2.40000000
+       4.60800000      -2.80000000
+       4.65800000      -2.40000000
+       4.81400000       2.40000000
+       4.86400000       2.80000000
+       4.91400000       2.40000000
+       5.07000000      -2.10000000
+       5.12000000      -2.50000000
+       5.17000000      -2.10000000
+       5.32600000       2.10000000
+       5.37600000       2.50000000
+       5.42600000       2.00000000
+       5.58200000      -2.40000000
+       5.63200000      -2.80000000
+       5.68200000      -2.40000000
+       5.83800000       2.40000000
+       5.88800000       2.80000000
+       5.93800000       2.40000000
+       6.09400000      -2.10000000
+       6.14400000      -2.50000000
+       6.19400000      -2.10000000
+       6.35000000       2.10000000
+       6.40000000       2.50000000
+       6.45000000       2.00000000
+       6.60600000      -2.40000000
+       6.65600000      -2.80000000
+       6.70600000      -2.40000000
+       6.86200000       2.40000000
+       6.91200000       2.80000000
+       6.96200000       2.40000000
+       7.11800000      -2.10000000
+       7.16800000      -2.50000000
+       7.21800000      -2.10000000
+       7.37400000       2.10000000
+       7.42400000       2.50000000
+       7.47400000       2.00000000
+       7.63000000      -2.40000000
+       7.68000000      -2.80000000
+       7.73000000      -2.40000000
+       7.88600000       2.40000000
+       7.93600000       2.80000000
+       7.98600000       2.40000000
+       8.14200000      -2.10000000
+       8.19200000      -2.50000000
+       8.24200000      -2.10000000
+       8.39800000       2.10000000
+       8.44800000       2.50000000
+       8.49800000       2.00000000
+       8.65400000      -2.40000000
+       8.70400000      -2.80000000
+       8.75400000      -2.40000000
+       8.91000000       2.40000000
+       8.96000000       2.80000000
+       9.01000000       2.40000000
+       9.16600000      -2.10000000
+       9.21600000      -2.50000000
+       9.26600000      -2.10000000
+       9.42200000       2.10000000
+       9.47200000       2.50000000
+       9.52200000       2.00000000
+       9.67800000      -2.40000000
+       9.72800000      -2.80000000
+       9.77800000      -2.40000000
+       9.93400000       2.40000000
+       9.98400000       2.80000000
+      10.03400000       2.40000000
+      10.19000000      -2.10000000
+      10.24000000      -2.50000000
+      10.29000000      -2.10000000
+      10.44600000       2.10000000
+      10.49600000       2.50000000
+      10.54600000       2.00000000
+      10.70200000      -2.40000000
+      10.75200000      -2.80000000
+      10.80200000      -2.40000000
+      10.95800000       2.40000000
+      11.00800000       2.80000000
+      11.05800000       2.40000000
+      11.21400000      -2.10000000
+      11.26400000      -2.50000000
+      11.31400000      -2.10000000
+      11.47000000       2.10000000
+      11.52000000       2.50000000
+      11.57000000       2.00000000
+      11.72600000      -2.40000000
+      11.77600000      -2.80000000
+      11.82600000      -2.40000000
+      11.98200000       2.40000000
+      12.03200000       2.80000000
+      12.08200000       2.40000000
+      12.23800000      -2.10000000
+      12.28800000      -2.50000000
+      12.33800000      -2.10000000
+      12.49400000       2.10000000
+      12.54400000       2.50000000
+      12.59400000       2.00000000
+      12.75000000      -2.40000000
+      12.80000000       2.80000000
+      12.85000000      -2.40000000
+      13.00600000       2.40000000
+      13.05600000       2.80000000
+      13.10600000       2.40000000
+      13.26200000      -2.10000000
+      13.31200000      -2.50000000
+      13.36200000      -2.10000000
+      13.51800000       2.10000000
+      13.56800000       2.50000000
+      13.61800000       2.00000000
+      13.77400000      -2.40000000
+      13.82400000      -2.80000000
+      13.87400000      -2.40000000
+      14.03000000       2.40000000
+      14.08000000       2.80000000
+      14.13000000       2.40000000
+      14.28600000      -2.10000000
+      14.33600000      -2.50000000
+      14.38600000      -2.10000000
+      14.54200000       2.10000000
+      14.59200000       2.50000000
+      14.64200000       2.00000000
+      14.79800000      -2.40000000
+      14.84800000      -2.80000000
+      14.89800000      -2.40000000
+      15.05400000       2.40000000
+      15.10400000       2.80000000
+      15.15400000       2.40000000
+      15.31000000      -2.10000000
+      15.36000000      -2.50000000
+      15.41000000      -2.10000000
+      15.56600000       2.10000000
+      15.61600000       2.50000000
+      15.66600000       2.00000000
+      15.82200000      -2.40000000
+      15.87200000      -2.80000000
+      15.92200000      -2.40000000
+      16.07800000       2.40000000
+      16.12800000       2.80000000
+      16.17800000       2.40000000
+      16.33400000      -2.10000000
+      16.38400000      -2.50000000
+      16.43400000      -2.10000000
+      16.59000000       2.10000000
+      16.64000000       2.50000000
+      16.69000000       2.00000000
+      16.84600000      -2.40000000
+      16.89600000      -2.80000000
+      16.94600000      -2.40000000
+      17.10200000       2.40000000
+      17.15200000       2.80000000
+      17.20200000       2.40000000
+      17.35800000      -2.10000000
+      17.40800000      -2.50000000
+      17.45800000      -2.10000000
+      17.61400000       2.10000000
+      17.66400000       2.50000000
+      17.71400000       2.00000000
+      17.87000000      -2.40000000
+      17.92000000      -2.80000000
+      17.97000000      -2.40000000
+      18.12600000       2.40000000
+      18.17600000       2.80000000
+      18.22600000       2.40000000
+      18.38200000      -2.10000000
+      18.43200000      -2.50000000
+      18.48200000      -2.10000000
+      18.63800000       2.10000000
+      18.68800000       2.50000000
+      18.73800000       2.00000000
+      18.89400000      -2.40000000
+      18.94400000      -2.80000000
+      18.99400000      -2.40000000
+      19.15000000       2.40000000
+      19.20000000       2.80000000
+      19.25000000       2.40000000
+      19.40600000      -2.10000000
+      19.45600000      -2.50000000
+      19.50600000      -2.10000000
+      19.66200000       2.10000000
+      19.71200000       2.50000000
+      19.76200000       2.00000000
+      19.91800000      -2.40000000
+      19.96800000      -2.80000000
+      20.01800000      -2.40000000
+      20.17400000       2.40000000
+      20.22400000       2.80000000
+      20.27400000       2.40000000
+      20.43000000      -2.10000000
+      20.48000000      -2.50000000
+      20.53000000      -2.10000000
+      20.68600000       2.10000000
+      20.73600000       2.50000000
+      20.78600000       2.00000000
+      20.94200000      -2.40000000
+      20.99200000      -2.80000000
+      21.04200000      -2.40000000
+      21.19800000       2.40000000
+      21.24800000       2.80000000
+      21.29800000       2.40000000
+      21.45400000      -2.10000000
+      21.50400000      -2.50000000
+      21.55400000      -2.10000000
+      21.71000000       2.10000000
+      21.76000000       2.50000000
+      21.81000000       2.00000000
+      21.96600000      -2.40000000
+      22.01600000      -2.80000000
+      22.06600000      -2.40000000
+      22.22200000       2.40000000
+      22.27200000       2.80000000
+      22.32200000       2.40000000
+      22.47800000      -2.10000000
+      22.52800000      -2.50000000
+      22.57800000      -2.10000000
+      22.73400000       2.10000000
+      22.78400000       2.50000000
+      22.83400000       2.00000000
+      22.99000000      -2.40000000
+      23.04000000      -2.80000000
+      23.09000000      -2.40000000
+      23.24600000       2.40000000
+      23.29600000       2.80000000
+      23.34600000       2.40000000
+      23.50200000      -2.10000000
+      23.55200000      -2.50000000
+      23.60200000      -2.10000000
+      23.75800000       2.10000000
+      23.80800000       2.50000000
+      23.85800000       2.00000000
+      24.01400000      -2.40000000
+      24.06400000      -2.80000000
+      24.11400000      -2.40000000
+      24.27000000       2.40000000
+      24.32000000       2.80000000
+      24.37000000       2.40000000
+      24.52600000      -2.10000000
+      24.57600000      -2.50000000
+      24.62600000      -2.10000000
+      24.78200000       2.10000000
+      24.83200000       2.50000000
+      24.88200000       2.00000000
+      25.03800000      -2.40000000
+      25.08800000      -2.80000000
+      25.13800000      -2.40000000
+      25.29400000       2.40000000
+      25.34400000       2.80000000
+      25.39400000       2.40000000
+      25.55000000      -2.10000000
+      25.60000000       2.50000000
+      25.65000000      -2.10000000
+      25.80600000       2.10000000
+      25.85600000       2.50000000
+      25.90600000       2.00000000
+      26.06200000      -2.40000000
+      26.11200000      -2.80000000
+      26.16200000      -2.40000000
+      26.31800000       2.40000000
+      26.36800000       2.80000000
+      26.41800000       2.40000000
+      26.57400000      -2.10000000
+      26.62400000      -2.50000000
+      26.67400000      -2.10000000
+      26.83000000       2.10000000
+      26.88000000       2.50000000
+      26.93000000       2.00000000
+      27.08600000      -2.40000000
+      27.13600000      -2.80000000
+      27.18600000      -2.40000000
+      27.34200000       2.40000000
+      27.39200000       2.80000000
+      27.44200000       2.40000000
+      27.59800000      -2.10000000
+      27.64800000      -2.50000000
+      27.69800000      -2.10000000
+      27.85400000       2.10000000
+      27.90400000       2.50000000
+      27.95400000       2.00000000
+      28.11000000      -2.40000000
+      28.16000000      -2.80000000
+      28.21000000      -2.40000000
+      28.36600000       2.40000000
+      28.41600000       2.80000000
+      28.46600000       2.40000000
+      28.62200000      -2.10000000
+      28.67200000      -2.50000000
+      28.72200000      -2.10000000
+      28.87800000       2.10000000
+      28.92800000       2.50000000
+      28.97800000       2.00000000
+      29.13400000      -2.40000000
+      29.18400000      -2.80000000
+      29.23400000      -2.40000000
+      29.39000000       2.40000000
+      29.44000000       2.80000000
+      29.49000000       2.40000000
+      29.64600000      -2.10000000
+      29.69600000      -2.50000000
+      29.74600000      -2.10000000
+      29.90200000       2.10000000
+      29.95200000       2.50000000
+      30.00200000       2.00000000
+      30.15800000      -2.40000000
+      30.20800000      -2.80000000
+      30.25800000      -2.40000000
+      30.41400000       2.40000000
+      30.46400000       2.80000000
+      30.51400000       2.40000000
+      30.67000000      -2.10000000
+      30.72000000      -2.50000000
+      30.77000000      -2.10000000
+      30.92600000       2.10000000
+      30.97600000       2.50000000
+      31.02600000       2.00000000
+END timeseries
+
@@ -27,19 +27,40 @@ __author__ = 'Mark Bakker, Vincent Post, Christian D. Langevin, ' + \
              'Eric D. Morway, Jason C. Bellino, Jeffrey Starn, ' + \
              'and Michael N. Fienen'
 
+import sys
+import importlib
+
 from .version import __version__
 
-# imports
-from . import modflow
-from . import mt3d
-from . import seawat
-from . import modpath
-from . import modflowlgr
-from . import utils
-from . import plot
-from . import export
-from . import pest
-from . import mf6
-from . import discretization
-
-from .mbase import run_model, which
+# subpackages and the module of each top level function.  they are imported
+# the first time they are accessed so that importing flopy stays fast
+_subpackages = ('modflow', 'mt3d', 'seawat', 'modpath', 'modflowlgr',
+                'utils', 'plot', 'export', 'pest', 'mf6', 'discretization')
+_functions = {'run_model': 'mbase', 'which': 'mbase'}
+
+__all__ = list(_subpackages) + list(_functions)
+
+
+def _import_attribute(name):
+    if name in _subpackages:
+        value = importlib.import_module('.' + name, __name__)
+    elif name in _functions:
+        module = importlib.import_module('.' + _functions[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module '{}' has no attribute "
+                             "'{}'".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+if sys.version_info[0:2] >= (3, 7):
+    def __getattr__(name):
+        return _import_attribute(name)
+
+    def __dir__():
+        return sorted(list(globals().keys()) + __all__)
+else:
+    # module level __getattr__ is not supported, import everything
+    for _name in __all__:
+        _import_attribute(_name)
@@ -4,7 +4,36 @@ import warnings
 from ..utils import geometry
 
 
+def _readonly(data):
+    """
+    Read-only views of the numpy arrays in cached data.  Lists, tuples and
+    dictionaries are rebuilt so that the cached containers can not be
+    changed, other objects are returned as they are.
+    """
+    if isinstance(data, np.ndarray):
+        view = data.view()
+        view.flags.writeable = False
+        return view
+    elif isinstance(data, (list, tuple)):
+        if len(data) > 0 and \
+                isinstance(data[0], (list, tuple, dict, np.ndarray)):
+            items = [_readonly(item) for item in data]
+        else:
+            items = list(data)
+        if isinstance(data, tuple):
+            items = tuple(items)
+        return items
+    elif isinstance(data, dict):
+        return {key: _readonly(value) for key, value in data.items()}
+    return data
+
+
 class CachedData(object):
+    """
+    Grid data that is computed once and kept until it is out of date.
+    data returns read-only views of the cached arrays, data_nocopy the
+    cached data itself.
+    """
     def __init__(self, data):
         self._data = data
         self.out_of_date = False
@@ -15,7 +44,7 @@ class CachedData(object):
 
     @property
     def data(self):
-        return copy.deepcopy(self._data)
+        return _readonly(self._data)
 
     def update_data(self, data):
         self._data = data
@@ -103,6 +132,25 @@ class Grid(object):
         information. otherwise the cell centers are based on a 0,0 location
         for the upper left corner of the model grid. returns a list of three
         ndarrays for the x, y, and z coordinates
+    thick : ndarray
+        returns the thickness of all model cells
+    areas : ndarray
+        returns the plan view area of the cells in a layer
+    volumes : ndarray
+        returns the volume of all model cells
+    cell_extents : ndarray
+        returns the extent (xmin, xmax, ymin, ymax) of the cells in a layer
+    face_normals : ndarray
+        returns the outward unit normal vectors of the faces of the cells
+        in a layer
+    connectivity : dict
+        returns the connections between the cells in compressed sparse row
+        (ia, ja) format with the face areas, the connection lengths and the
+        face normals of the connections
+
+    Cached grid data is returned as read-only numpy arrays.  The cache is
+    updated after set_coord_info is called or the top or botm of the grid
+    are set.
 
     Methods
     ----------
@@ -118,7 +166,11 @@ class Grid(object):
         (single layer) in C-style (row-major) order
         (same as np.ravel())
     intersect(x, y, local)
-        returns the row and column of the grid that the x, y point is in
+        returns the row and column of the grid that the x, y point is in.
+        x and y can be arrays of points, in which case arrays of cell
+        locations are returned
+    neighbors(node)
+        returns the node numbers of the cells connected to a cell
 
     See Also
     --------
@@ -248,10 +300,20 @@ class Grid(object):
     def top(self):
         return copy.deepcopy(self._top)
 
+    @top.setter
+    def top(self, top):
+        self._top = top
+        self._require_cache_updates()
+
     @property
     def botm(self):
         return copy.deepcopy(self._botm)
 
+    @botm.setter
+    def botm(self, botm):
+        self._botm = botm
+        self._require_cache_updates()
+
     @property
     def top_botm(self):
         new_top = np.expand_dims(self._top, 0)
@@ -323,6 +385,232 @@ class Grid(object):
             'must define xyzgrid in child '
             'class to use this base class')
 
+    @property
+    def thick(self):
+        """
+        Thickness of the cells, the top minus the bottom of each cell
+        """
+        cache_index = 'thick'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            top = np.asarray(self._top, dtype=float)
+            botm = np.asarray(self._botm, dtype=float)
+            if top.ndim == botm.ndim:
+                # a top and bottom for every cell
+                thick = top - botm
+            else:
+                thick = -np.diff(np.concatenate((top[np.newaxis], botm)),
+                                 axis=0)
+            self._cache_dict[cache_index] = CachedData(thick)
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def areas(self):
+        """
+        Plan view area of the cells in a layer
+        """
+        cache_index = 'areas'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            xring, yring = self._cell_rings()
+            x0 = xring[:, :1]
+            y0 = yring[:, :1]
+            # shoelace formula relative to the first vertex of each cell
+            areas = 0.5 * np.abs(np.sum(
+                (xring[:, :-1] - x0) * (yring[:, 1:] - y0) -
+                (xring[:, 1:] - x0) * (yring[:, :-1] - y0), axis=1))
+            self._cache_dict[cache_index] = \
+                CachedData(self._reshape_cells2d(areas))
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def volumes(self):
+        """
+        Volume of the cells, the cell area times the cell thickness
+        """
+        cache_index = 'volumes'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            self._copy_cache = False
+            volumes = self.thick * self.areas
+            self._copy_cache = True
+            self._cache_dict[cache_index] = CachedData(volumes)
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def cell_extents(self):
+        """
+        Extent (xmin, xmax, ymin, ymax) of the cells in a layer
+        """
+        cache_index = 'cell_extents'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            xring, yring = self._cell_rings()
+            extents = np.column_stack((xring.min(axis=1), xring.max(axis=1),
+                                       yring.min(axis=1), yring.max(axis=1)))
+            self._cache_dict[cache_index] = \
+                CachedData(self._reshape_cells2d(extents))
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def face_normals(self):
+        """
+        Outward unit normal vectors (nx, ny) of the faces of the cells in a
+        layer.  Face i of a cell is between vertex i and vertex i + 1 of the
+        cell.  Cells with less faces than the cell with the most faces are
+        padded with nan.
+        """
+        cache_index = 'face_normals'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            xring, yring = self._cell_rings()
+            dx = np.diff(xring, axis=1)
+            dy = np.diff(yring, axis=1)
+            length = np.hypot(dx, dy)
+            # the sign of the area is the orientation of the vertices
+            x0 = xring[:, :1]
+            y0 = yring[:, :1]
+            sign = np.sign(np.sum(
+                (xring[:, :-1] - x0) * (yring[:, 1:] - y0) -
+                (xring[:, 1:] - x0) * (yring[:, :-1] - y0), axis=1))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                normals = np.stack((dy, -dx), axis=-1) * \
+                    (sign[:, np.newaxis] / length)[:, :, np.newaxis]
+            normals[length == 0.] = np.nan
+            self._cache_dict[cache_index] = \
+                CachedData(self._reshape_cells2d(normals))
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
+
+    @property
+    def connectivity(self):
+        """
+        Connections between the cells of the grid in compressed sparse row
+        format.  The cells connected to cell n are ja[ia[n]:ia[n + 1]] in
+        increasing order, where n is the node number of the cell (layer by
+        layer, in row major order for structured grids).
+
+        Returns
+        -------
+        connectivity : dict
+            dictionary of arrays with the keys
+
+            ia : cell n connects to cells ja[ia[n]:ia[n + 1]]
+            ja : connected cells
+            ihc : 1 for horizontal and 0 for vertical connections
+            cl12 : distance from the center of cell n to the shared face
+            hwva : width of the shared face of horizontal connections and
+                horizontal cell area of vertical connections
+            area : area of the shared face
+            angldegx : angle (in degrees) between the x-axis of the model
+                and the normal of horizontal connections
+            normal : unit normal vector (nx, ny, nz) of the shared face
+                pointing from cell n to the connected cell
+
+        """
+        cache_index = 'connectivity'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            conn2d = self._connections2d()
+            self._copy_cache = False
+            areas = np.ravel(self.areas)
+            self._copy_cache = True
+            ncpl = areas.shape[0]
+            ztop, zbot = self._node_elevations()
+            if ztop is not None:
+                nnodes = ztop.shape[0]
+            else:
+                nnodes = ncpl * (self.nlay or 1)
+            if nnodes % ncpl != 0:
+                raise ValueError('number of cells ({}) is not a multiple of '
+                                 'the number of cells in a layer '
+                                 '({})'.format(nnodes, ncpl))
+            nlay = nnodes // ncpl
+            if ztop is None:
+                ztop = np.full(nnodes, np.nan)
+                zbot = np.full(nnodes, np.nan)
+
+            # horizontal connections in every layer
+            offset = (np.arange(nlay) * ncpl)[:, np.newaxis]
+            n = (offset + conn2d['n']).ravel()
+            m = (offset + conn2d['m']).ravel()
+            width = np.tile(conn2d['width'], nlay)
+            cl1 = np.tile(conn2d['cl1'], nlay)
+            cl2 = np.tile(conn2d['cl2'], nlay)
+            normal = np.tile(conn2d['normal'], (nlay, 1))
+            overlap = np.minimum(ztop[n], ztop[m]) - \
+                np.maximum(zbot[n], zbot[m])
+            if self._layered_nodes:
+                area = width * np.maximum(overlap, 0.)
+            else:
+                # cells of different layers with a common face in plan view
+                # are only connected if they overlap vertically
+                keep = overlap > 0.
+                n, m, width, cl1, cl2, normal = n[keep], m[keep], \
+                    width[keep], cl1[keep], cl2[keep], normal[keep]
+                area = width * overlap[keep]
+            normal = np.column_stack((normal, np.zeros(n.shape[0])))
+            angldegx = np.degrees(np.arctan2(normal[:, 1], normal[:, 0])) - \
+                self.angrot
+            ihc = np.ones(n.shape[0], dtype=int)
+
+            # vertical connections from the upper to the lower cell
+            if self._layered_nodes:
+                nv = np.arange(nnodes - ncpl)
+                mv = nv + ncpl
+            else:
+                nv, mv = self._vertical_connections(ztop, zbot)
+            thick = ztop - zbot
+            ncon = nv.shape[0]
+            vnormal = np.zeros((ncon, 3))
+            vnormal[:, 2] = -1.
+            n = np.concatenate((n, nv))
+            m = np.concatenate((m, mv))
+            ihc = np.concatenate((ihc, np.zeros(ncon, dtype=int)))
+            cl1 = np.concatenate((cl1, 0.5 * thick[nv]))
+            cl2 = np.concatenate((cl2, 0.5 * thick[mv]))
+            hwva = np.concatenate((width, areas[nv % ncpl]))
+            area = np.concatenate((area, areas[nv % ncpl]))
+            angldegx = np.concatenate((angldegx, np.zeros(ncon)))
+            normal = np.concatenate((normal, vnormal))
+
+            # both directions of every connection, sorted by cell
+            ja_n = np.concatenate((n, m))
+            ja_m = np.concatenate((m, n))
+            order = np.lexsort((ja_m, ja_n))
+            ihc = np.tile(ihc, 2)[order]
+            cl12 = np.concatenate((cl1, cl2))[order]
+            hwva = np.tile(hwva, 2)[order]
+            area = np.tile(area, 2)[order]
+            angldegx = np.concatenate((angldegx, angldegx + 180.))[order]
+            angldegx[ihc == 0] = 0.
+            normal = np.concatenate((normal, -normal))[order]
+            ia = np.searchsorted(ja_n[order], np.arange(nnodes + 1))
+            angldegx = np.mod(angldegx, 360.)
+            angldegx[np.isclose(angldegx, 360.)] = 0.
+            connectivity = {'ia': ia, 'ja': ja_m[order], 'ihc': ihc,
+                            'cl12': cl12, 'hwva': hwva, 'area': area,
+                            'angldegx': angldegx, 'normal': normal}
+            self._cache_dict[cache_index] = CachedData(connectivity)
+        if self._copy_cache:
+            return self._cache_dict[cache_index].data
+        else:
+            return self._cache_dict[cache_index].data_nocopy
+
     #@property
     #def indices(self):
     #    raise NotImplementedError(
@@ -369,6 +657,417 @@ class Grid(object):
         else:
             return x, y
 
+    def neighbors(self, node=None):
+        """
+        Get the cells connected to a cell
+
+        Parameters
+        ----------
+        node : int (optional)
+            node number of the cell, layer by layer (and in row major order
+            for structured grids).  If node is None, the connected cells of
+            all cells are returned.
+
+        Returns
+        -------
+        neighbors : ndarray or list of ndarray
+            node numbers of the connected cells
+
+        """
+        connectivity = self.connectivity
+        ia, ja = connectivity['ia'], connectivity['ja']
+        if node is None:
+            return np.split(ja, ia[1:-1])
+        return ja[ia[node]:ia[node + 1]]
+
+    @property
+    def _layered_nodes(self):
+        """
+        True if the cells of the grid are numbered layer by layer with the
+        same cells in every layer
+        """
+        return True
+
+    def _node_elevations(self):
+        """
+        Top and bottom elevation of every cell, or None if the grid has no
+        top or botm
+        """
+        if self._top is None or self._botm is None:
+            return None, None
+        top = np.ravel(np.asarray(self._top, dtype=float))
+        botm = np.ravel(np.asarray(self._botm, dtype=float))
+        if top.shape[0] != botm.shape[0]:
+            # the top of the cells below the first layer is the bottom of
+            # the cells above
+            top = np.concatenate((top, botm[:-top.shape[0]]))
+        return top, botm
+
+    def _connections2d(self):
+        """
+        Horizontal connections of the cells in a layer, found from the faces
+        shared by two cells.  Every connection is returned once, with the
+        lower cell number n and the higher cell number m.
+
+        Returns
+        -------
+        connections : dict
+            dictionary of the arrays n, m, width (length of the shared
+            face), cl1 and cl2 (distance from the center of cell n and m to
+            the face) and normal (unit normal vector of the face pointing
+            from cell n to cell m)
+        """
+        cache_index = 'connections2d'
+        if cache_index in self._cache_dict and \
+                not self._cache_dict[cache_index].out_of_date:
+            return self._cache_dict[cache_index].data_nocopy
+
+        xring, yring = self._cell_rings()
+        self._copy_cache = False
+        normals = self.face_normals
+        xcenters, ycenters = self.xcellcenters, self.ycellcenters
+        self._copy_cache = True
+        ncell, nface = xring.shape[0], xring.shape[1] - 1
+        normals = np.reshape(normals, (ncell * nface, 2))
+        xcenters = np.ravel(xcenters)
+        ycenters = np.ravel(ycenters)
+
+        x1, x2 = xring[:, :-1].ravel(), xring[:, 1:].ravel()
+        y1, y2 = yring[:, :-1].ravel(), yring[:, 1:].ravel()
+        faces = np.nonzero((x1 != x2) | (y1 != y2))[0]
+        x1, x2, y1, y2 = x1[faces], x2[faces], y1[faces], y2[faces]
+
+        # integer keys of the vertex coordinates and sort the faces by the
+        # keys of their vertices
+        xmin, ymin = xring.min(), yring.min()
+        tolerance = 1e-9 * max(np.ptp(xring), np.ptp(yring), 1.)
+        nky = int(np.round(np.ptp(yring) / tolerance)) + 1
+        v1 = np.round((x1 - xmin) / tolerance).astype(np.int64) * nky + \
+            np.round((y1 - ymin) / tolerance).astype(np.int64)
+        v2 = np.round((x2 - xmin) / tolerance).astype(np.int64) * nky + \
+            np.round((y2 - ymin) / tolerance).astype(np.int64)
+        vmin, vmax = np.minimum(v1, v2), np.maximum(v1, v2)
+        order = np.lexsort((vmax, vmin))
+        vmin, vmax, faces = vmin[order], vmax[order], faces[order]
+
+        # faces with the same vertices are shared
+        fn, fm = [], []
+        step = 1
+        while step < faces.shape[0]:
+            shared = np.nonzero((vmin[:-step] == vmin[step:]) &
+                                (vmax[:-step] == vmax[step:]))[0]
+            if shared.shape[0] == 0:
+                break
+            fn.append(faces[shared])
+            fm.append(faces[shared + step])
+            step += 1
+        fn = np.concatenate(fn) if fn else np.zeros(0, dtype=int)
+        fm = np.concatenate(fm) if fm else np.zeros(0, dtype=int)
+        swap = fn > fm
+        fn[swap], fm[swap] = fm[swap], fn[swap]
+        n, m = fn // nface, fm // nface
+        keep = np.unique(n * ncell + m, return_index=True)[1]
+        keep = keep[n[keep] != m[keep]]
+        fn, n, m = fn[keep], n[keep], m[keep]
+
+        x1, x2 = xring[:, :-1].ravel()[fn], xring[:, 1:].ravel()[fn]
+        y1, y2 = yring[:, :-1].ravel()[fn], yring[:, 1:].ravel()[fn]
+        width = np.hypot(x2 - x1, y2 - y1)
+        cl = []
+        for icell in (n, m):
+            cross = (x2 - x1) * (ycenters[icell] - y1) - \
+                (y2 - y1) * (xcenters[icell] - x1)
+            cl.append(np.abs(cross) / width)
+        connections = {'n': n, 'm': m, 'width': width, 'cl1': cl[0],
+                       'cl2': cl[1], 'normal': normals[fn]}
+        self._cache_dict[cache_index] = CachedData(connections)
+        return connections
+
+    def _vertical_connections(self, ztop, zbot):
+        """
+        Vertical connections of a grid that is not layered.  Cells with the
+        same vertices in plan view are connected when the bottom of the
+        upper cell is the top of the lower cell.
+        """
+        xring, yring = self._cell_rings()
+        tolerance = 1e-9 * max(np.ptp(xring), np.ptp(yring), 1.)
+        rings = np.round(np.hstack((xring, yring)) / tolerance)
+        ring = np.unique(rings, axis=0, return_inverse=True)[1].ravel()
+        order = np.lexsort((-ztop, ring))
+        n, m = order[:-1], order[1:]
+        ztol = 1e-9 * max(np.nanmax(np.abs(ztop)), 1.)
+        connected = (ring[n] == ring[m]) & (np.abs(zbot[n] - ztop[m]) <=
+                                            ztol)
+        return n[connected], m[connected]
+
+    def _reshape_cells2d(self, data):
+        """
+        Reshape data of the cells in a layer, with the cells along the
+        first axis, to the shape of a layer of the grid
+        """
+        return data
+
+    def _cell_rings(self):
+        """
+        Closed rings of the vertices of the cells in a layer.  The rings
+        are padded with their first vertex so that every cell has the same
+        number of (possibly degenerate) edges.
+
+        Returns
+        -------
+        xring, yring : ndarray
+            x and y coordinates of the rings in an array of shape
+            (number of cells, maximum number of vertices + 1)
+        """
+        cache_index = 'cell_rings'
+        if cache_index in self._cache_dict and \
+                not self._cache_dict[cache_index].out_of_date:
+            return self._cache_dict[cache_index].data_nocopy
+
+        self._copy_cache = False
+        xyzvertices = self.xyzvertices
+        self._copy_cache = True
+        xverts, yverts = xyzvertices[0], xyzvertices[1]
+        ncell = len(xverts)
+        nverts = np.array([len(verts) for verts in xverts])
+        maxnv = nverts.max()
+        first = np.concatenate(([0], np.cumsum(nverts)[:-1]))
+        cells = np.repeat(np.arange(ncell), nverts)
+        cols = np.arange(nverts.sum()) - np.repeat(first, nverts)
+        xflat = np.concatenate([np.asarray(v, dtype=float) for v in xverts])
+        yflat = np.concatenate([np.asarray(v, dtype=float) for v in yverts])
+        xring = np.repeat(xflat[first][:, np.newaxis], maxnv + 1, axis=1)
+        yring = np.repeat(yflat[first][:, np.newaxis], maxnv + 1, axis=1)
+        xring[cells, cols] = xflat
+        yring[cells, cols] = yflat
+        self._cache_dict[cache_index] = CachedData((xring, yring))
+        return xring, yring
+
+    def _cell_index(self):
+        """
+        Spatial index of the two-dimensional cells of a grid defined by
+        cell vertices.  The cell bounding boxes are registered in a uniform
+        grid of bins with about one bin per cell.
+        """
+        cache_index = 'cell_index'
+        if cache_index in self._cache_dict and \
+                not self._cache_dict[cache_index].out_of_date:
+            return self._cache_dict[cache_index].data_nocopy
+
+        xring, yring = self._cell_rings()
+        ncell = xring.shape[0]
+        bbox = np.array([xring.min(axis=1), xring.max(axis=1),
+                         yring.min(axis=1), yring.max(axis=1)])
+
+        # bins
+        xmin, xmax = bbox[0].min(), bbox[1].max()
+        ymin, ymax = bbox[2].min(), bbox[3].max()
+        width = max(xmax - xmin, np.finfo(float).tiny)
+        height = max(ymax - ymin, np.finfo(float).tiny)
+        nbx = int(max(1, min(ncell, np.ceil(np.sqrt(ncell * width /
+                                                    height)))))
+        nby = int(max(1, np.ceil(ncell / float(nbx))))
+        dx = width / nbx
+        dy = height / nby
+
+        # bins overlapped by each cell bounding box
+        ix0 = np.clip(((bbox[0] - xmin) // dx).astype(int), 0, nbx - 1)
+        ix1 = np.clip(((bbox[1] - xmin) // dx).astype(int), 0, nbx - 1)
+        iy0 = np.clip(((bbox[2] - ymin) // dy).astype(int), 0, nby - 1)
+        iy1 = np.clip(((bbox[3] - ymin) // dy).astype(int), 0, nby - 1)
+        nbinx = ix1 - ix0 + 1
+        counts = nbinx * (iy1 - iy0 + 1)
+        cell_bins = np.repeat(np.arange(ncell), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                counts)
+        nbinx = nbinx[cell_bins]
+        bins = (iy0[cell_bins] + k // nbinx) * nbx + ix0[cell_bins] + \
+            k % nbinx
+        # cells of each bin in increasing cell number
+        order = np.lexsort((cell_bins, bins))
+        bin_cells = cell_bins[order]
+        bin_ptr = np.searchsorted(bins[order], np.arange(nbx * nby + 1))
+
+        cell_index = {'xring': xring, 'yring': yring, 'bbox': bbox,
+                      'origin': (xmin, ymin), 'size': (dx, dy),
+                      'shape': (nbx, nby), 'bin_ptr': bin_ptr,
+                      'bin_cells': bin_cells}
+        self._cache_dict[cache_index] = CachedData(cell_index)
+        return cell_index
+
+    def _query_extents(self, extents, tolerance=1e-9):
+        """
+        Vectorized search of the two-dimensional cells with a bounding box
+        that overlaps one of the extents.
+
+        Parameters
+        ----------
+        extents : array_like
+            extents (xmin, xmax, ymin, ymax) to search, in the coordinates
+            of the cell vertices, of shape (number of extents, 4)
+        tolerance : float
+            distance between bounding boxes that is considered overlapping
+
+        Returns
+        -------
+        iextent, icell : ndarray
+            number of the extent and of the cell of every overlap, sorted
+            by extent and cell number
+
+        """
+        index = self._cell_index()
+        bbox = index['bbox']
+        x0, y0 = index['origin']
+        dx, dy = index['size']
+        nbx, nby = index['shape']
+        bin_ptr, bin_cells = index['bin_ptr'], index['bin_cells']
+        ncell = bbox.shape[1]
+
+        extents = np.asarray(extents, dtype=float).reshape(-1, 4)
+        nextent = extents.shape[0]
+        xmin, xmax = extents[:, 0] - tolerance, extents[:, 1] + tolerance
+        ymin, ymax = extents[:, 2] - tolerance, extents[:, 3] + tolerance
+        outside = (xmax < bbox[0].min()) | (xmin > bbox[1].max()) | \
+            (ymax < bbox[2].min()) | (ymin > bbox[3].max())
+        ix0 = np.clip(np.floor((xmin - x0) / dx), 0, nbx - 1).astype(int)
+        ix1 = np.clip(np.floor((xmax - x0) / dx), 0, nbx - 1).astype(int)
+        iy0 = np.clip(np.floor((ymin - y0) / dy), 0, nby - 1).astype(int)
+        iy1 = np.clip(np.floor((ymax - y0) / dy), 0, nby - 1).astype(int)
+        nbinx = ix1 - ix0 + 1
+        counts = np.where(outside, 0, nbinx * (iy1 - iy0 + 1))
+
+        # bins overlapped by every extent
+        iextent = np.repeat(np.arange(nextent), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                counts)
+        nbinx = nbinx[iextent]
+        bins = (iy0[iextent] + k // nbinx) * nbx + ix0[iextent] + k % nbinx
+
+        # cells in the bins with an overlapping bounding box
+        counts = bin_ptr[bins + 1] - bin_ptr[bins]
+        iextent = np.repeat(iextent, counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                counts)
+        icell = bin_cells[np.repeat(bin_ptr[bins], counts) + k]
+        keep = (bbox[0][icell] <= xmax[iextent]) & \
+            (bbox[1][icell] >= xmin[iextent]) & \
+            (bbox[2][icell] <= ymax[iextent]) & \
+            (bbox[3][icell] >= ymin[iextent])
+
+        # cells can be in more than one bin
+        pairs = np.unique(iextent[keep].astype(np.int64) * ncell +
+                          icell[keep])
+        return pairs // ncell, pairs % ncell
+
+    def _intersect_cells(self, x, y, tolerance=1e-9, chunksize=2 ** 18):
+        """
+        Vectorized location of points in the two-dimensional cells of a
+        grid defined by cell vertices.  Points on the edge of a cell, within
+        tolerance, are in the cell.  When a point is in more than one cell
+        the lowest cell number is returned.
+
+        Parameters
+        ----------
+        x : ndarray
+            x-coordinates of the points in the coordinates of the cell
+            vertices
+        y : ndarray
+            y-coordinates of the points
+        tolerance : float
+            distance from a cell edge that is considered on the edge
+        chunksize : int
+            number of points located at a time
+
+        Returns
+        -------
+        cellids : ndarray
+            cell number of each point, -1 for points outside of the grid
+
+        """
+        index = self._cell_index()
+        xring, yring, bbox = index['xring'], index['yring'], index['bbox']
+        x0, y0 = index['origin']
+        dx, dy = index['size']
+        nbx, nby = index['shape']
+        bin_ptr, bin_cells = index['bin_ptr'], index['bin_cells']
+
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        cellids = np.full(x.shape, -1, dtype=int)
+        for start in range(0, x.shape[0], chunksize):
+            px = x[start:start + chunksize]
+            py = y[start:start + chunksize]
+            with np.errstate(invalid='ignore'):
+                ix = np.floor((px - x0) / dx)
+                iy = np.floor((py - y0) / dy)
+                valid = (ix >= -1) & (ix <= nbx) & (iy >= -1) & (iy <= nby)
+            points = np.nonzero(valid)[0]
+            # points within tolerance of the extent are in the outer bins
+            ix = np.clip(ix[points], 0, nbx - 1).astype(int)
+            iy = np.clip(iy[points], 0, nby - 1).astype(int)
+            bins = iy * nbx + ix
+
+            # candidate cells of each point
+            counts = bin_ptr[bins + 1] - bin_ptr[bins]
+            pts = np.repeat(points, counts)
+            k = np.arange(counts.sum()) - np.repeat(
+                np.cumsum(counts) - counts, counts)
+            cand = bin_cells[np.repeat(bin_ptr[bins], counts) + k]
+            px, py = px[pts], py[pts]
+            keep = (px >= bbox[0][cand] - tolerance) & \
+                (px <= bbox[1][cand] + tolerance) & \
+                (py >= bbox[2][cand] - tolerance) & \
+                (py <= bbox[3][cand] + tolerance)
+            pts, cand, px, py = pts[keep], cand[keep], px[keep], py[keep]
+
+            # crossing number and point on edge tests of all edges
+            inside = np.zeros(pts.shape, dtype=bool)
+            on_edge = np.zeros(pts.shape, dtype=bool)
+            xr, yr = xring[cand], yring[cand]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for iedge in range(xr.shape[1] - 1):
+                    x1, x2 = xr[:, iedge], xr[:, iedge + 1]
+                    y1, y2 = yr[:, iedge], yr[:, iedge + 1]
+                    crosses = (y1 > py) != (y2 > py)
+                    xcross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+                    inside ^= crosses & (px < xcross)
+                    length = np.hypot(x2 - x1, y2 - y1)
+                    cross = (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+                    on_edge |= (np.abs(cross) <= tolerance * length) & \
+                        (px >= np.minimum(x1, x2) - tolerance) & \
+                        (px <= np.maximum(x1, x2) + tolerance) & \
+                        (py >= np.minimum(y1, y2) - tolerance) & \
+                        (py <= np.maximum(y1, y2) + tolerance)
+            inside |= on_edge
+
+            # candidates are sorted by point and cell number, so the first
+            # cell of a point has the lowest cell number
+            pts, cand = pts[inside], cand[inside]
+            pts, first = np.unique(pts, return_index=True)
+            cellids[start + pts] = cand[first]
+        return cellids
+
+    @staticmethod
+    def _intersect_result(x, cellids, forgive):
+        """
+        Check the cell numbers found for x and return a scalar for scalar
+        x.  Points outside of the grid are NaN when forgive is True.
+        """
+        outside = cellids < 0
+        if np.any(outside):
+            if not forgive:
+                raise Exception(
+                    'x, y point given is outside of the model area')
+            cellids = cellids.astype(float)
+            cellids[outside] = np.nan
+        if np.isscalar(x):
+            cellids = cellids[0]
+            if not np.isnan(cellids):
+                cellids = int(cellids)
+        else:
+            cellids = cellids.reshape(np.shape(x))
+        return cellids
+
     def set_coord_info(self, xoff=0.0, yoff=0.0, angrot=0.0, epsg=None,
                        proj4=None, merge_coord_info=True):
         if merge_coord_info:
@@ -540,7 +1239,12 @@ class Grid(object):
         self._xoff = d.xul
 
     def _zcoords(self):
-        if self.top is not None and self.botm is not None:
+        if self._top is not None and self._botm is not None and \
+                np.ndim(self._top) == np.ndim(self._botm):
+            # top and bottom of every cell of an unstructured grid
+            zbdryelevs = np.array([self._top, self._botm], dtype=float)
+            zcenters = (zbdryelevs[0] + zbdryelevs[1]) / 2.
+        elif self.top is not None and self.botm is not None:
             zcenters = []
             top_3d = np.expand_dims(self.top, 0)
             zbdryelevs = np.concatenate((top_3d, self.botm), axis=0)
@@ -252,10 +252,10 @@ class StructuredGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -264,41 +264,101 @@ class StructuredGrid(Grid):
 
         Returns
         -------
-        row : int
-            The row number
-        col : int
-            The column number
+        row : int or ndarray
+            The row number(s)
+        col : int or ndarray
+            The column number(s)
 
         """
+        scalar = np.isscalar(x)
+        x = np.atleast_1d(np.array(x, dtype=float))
+        y = np.atleast_1d(np.array(y, dtype=float))
+
         # transform x and y to local coordinates
         x, y = super(StructuredGrid, self).intersect(x, y, local, forgive)
 
         # get the cell edges in local coordinates
+        self._copy_cache = False
         xe, ye = self.xyedges
+        self._copy_cache = True
 
-        xcomp = x > xe
-        if np.all(xcomp) or not np.any(xcomp):
-            if forgive:
-                col = np.nan
-            else:
-                raise Exception(
-                    'x, y point given is outside of the model area')
-        else:
-            col = np.where(xcomp)[0][-1]
-
-        ycomp = y < ye
-        if np.all(ycomp) or not np.any(ycomp):
-            if forgive:
-                row = np.nan
-            else:
+        # the column is the last x edge smaller than x and the row is the
+        # last y edge larger than y
+        col = np.searchsorted(xe, x, side='left') - 1
+        row = ye.shape[0] - np.searchsorted(ye[::-1], y, side='right') - 1
+        outside = (col < 0) | (col >= self.ncol) | \
+            (row < 0) | (row >= self.nrow)
+        if np.any(outside):
+            if not forgive:
                 raise Exception(
                     'x, y point given is outside of the model area')
-        else:
-            row = np.where(ycomp)[0][-1]
-        if np.any(np.isnan([row, col])):
-            row = col = np.nan
+            row = row.astype(float)
+            col = col.astype(float)
+            row[outside] = col[outside] = np.nan
+        if scalar:
+            row, col = row.item(), col.item()
         return row, col
 
+    def _reshape_cells2d(self, data):
+        return data.reshape((self.nrow, self.ncol) + data.shape[1:])
+
+    def _cell_rings(self):
+        """
+        Closed rings of the cell vertices, in the order of
+        get_cell_vertices, for all cells in a layer in row major order.
+        Face 0 of a cell is the face to row i - 1, face 1 to column j + 1,
+        face 2 to row i + 1 and face 3 to column j - 1.
+        """
+        cache_index = 'cell_rings'
+        if cache_index in self._cache_dict and \
+                not self._cache_dict[cache_index].out_of_date:
+            return self._cache_dict[cache_index].data_nocopy
+
+        self._copy_cache = False
+        xgrid, ygrid = self.xvertices, self.yvertices
+        self._copy_cache = True
+        rings = []
+        for grid in (xgrid, ygrid):
+            ring = np.stack((grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:],
+                             grid[1:, :-1], grid[:-1, :-1]), axis=-1)
+            rings.append(ring.reshape(-1, 5))
+        self._cache_dict[cache_index] = CachedData(tuple(rings))
+        return tuple(rings)
+
+    def _connections2d(self):
+        """
+        Connections of the cells in a layer to the cell in the next column
+        and the cell in the next row.
+        """
+        cache_index = 'connections2d'
+        if cache_index in self._cache_dict and \
+                not self._cache_dict[cache_index].out_of_date:
+            return self._cache_dict[cache_index].data_nocopy
+
+        nrow, ncol = self.__nrow, self.__ncol
+        delr = np.asarray(self.__delr, dtype=float)
+        delc = np.asarray(self.__delc, dtype=float)
+        self._copy_cache = False
+        normals = self.face_normals
+        self._copy_cache = True
+        node = np.arange(nrow * ncol).reshape(nrow, ncol)
+        dr = np.broadcast_to(delr, (nrow, ncol))
+        dc = np.broadcast_to(delc[:, np.newaxis], (nrow, ncol))
+        connections = {
+            'n': np.concatenate((node[:, :-1].ravel(),
+                                 node[:-1, :].ravel())),
+            'm': np.concatenate((node[:, 1:].ravel(), node[1:, :].ravel())),
+            'width': np.concatenate((dc[:, :-1].ravel(),
+                                     dr[:-1, :].ravel())),
+            'cl1': np.concatenate((0.5 * dr[:, :-1].ravel(),
+                                   0.5 * dc[:-1, :].ravel())),
+            'cl2': np.concatenate((0.5 * dr[:, 1:].ravel(),
+                                   0.5 * dc[1:, :].ravel())),
+            'normal': np.concatenate((normals[:, :-1, 1].reshape(-1, 2),
+                                      normals[:-1, :, 2].reshape(-1, 2)))}
+        self._cache_dict[cache_index] = CachedData(connections)
+        return connections
+
     def _cell_vert_list(self, i, j):
         """Get vertices for a single cell or sequence of i, j locations."""
         self._copy_cache = False
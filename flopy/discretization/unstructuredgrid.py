@@ -86,6 +86,10 @@ class UnstructuredGrid(Grid):
     def layered(self):
         return self._layered
 
+    @property
+    def _layered_nodes(self):
+        return self.layered
+
     @property
     def nnodes(self):
         if self._nodes is not None:
@@ -175,8 +179,38 @@ class UnstructuredGrid(Grid):
             return self._cache_dict[cache_index].data_nocopy
 
     def intersect(self, x, y, local=False, forgive=False):
-        x, y = super(UnstructuredGrid, self).intersect(x, y, local, forgive)
-        raise Exception('Not implemented yet')
+        """
+        Get the cell number of a point with coordinates x and y.  For
+        layered grids the cell number in a layer is returned.
+
+        When the point is on the edge of two cells, the cell with the lowest
+        cell number is returned.
+
+        Parameters
+        ----------
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
+        local: bool (optional)
+            If True, x and y are in local coordinates (defaults to False)
+        forgive: bool (optional)
+            Forgive x,y arguments that fall outside the model grid and
+            return NaNs instead (defaults to False - will throw exception)
+
+        Returns
+        -------
+        icell : int or ndarray
+            The cell number(s)
+
+        """
+        xp = np.atleast_1d(np.array(x, dtype=float))
+        yp = np.atleast_1d(np.array(y, dtype=float))
+        if local:
+            # transform x and y to real-world coordinates
+            xp, yp = super(UnstructuredGrid, self).get_coords(xp, yp)
+        icell = self._intersect_cells(xp, yp)
+        return self._intersect_result(x, icell, forgive)
 
     def get_cell_vertices(self, cellid):
         """
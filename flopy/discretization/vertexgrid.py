@@ -1,11 +1,6 @@
 import numpy as np
-try:
-    from matplotlib.path import Path
-except ImportError:
-    Path = None
 
 from .grid import Grid, CachedData
-from ..utils.geometry import is_clockwise
 
 
 class VertexGrid(Grid):
@@ -153,10 +148,10 @@ class VertexGrid(Grid):
         
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -165,37 +160,17 @@ class VertexGrid(Grid):
     
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or ndarray
+            The CELL2D number(s)
         
         """
-        if Path is None:
-            s = 'Could not import matplotlib.  Must install matplotlib ' + \
-                ' in order to use VertexGrid.intersect() method'
-            raise ImportError(s)
-
+        xp = np.atleast_1d(np.array(x, dtype=float))
+        yp = np.atleast_1d(np.array(y, dtype=float))
         if local:
             # transform x and y to real-world coordinates
-            x, y = super(VertexGrid, self).get_coords(x,y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if np.any(x <= xa) and np.any(x >= xa) and \
-                    np.any(y <= ya) and np.any(y >= ya):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    return icell2d
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-        raise Exception('x, y point given is outside of the model area')
+            xp, yp = super(VertexGrid, self).get_coords(xp, yp)
+        icell2d = self._intersect_cells(xp, yp)
+        return self._intersect_result(x, icell2d, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -4,6 +4,7 @@ import os
 import numpy as np
 from ..utils import HeadFile, CellBudgetFile, UcnFile, FormattedHeadFile, \
     ZBNetOutput
+from ..utils.binaryfile import ensemble_map
 from ..mbase import BaseModel, ModelInterface
 from ..pakbase import PackageInterface
 from ..datbase import DataType, DataInterface, DataListInterface
@@ -28,8 +29,11 @@ def ensemble_helper(inputs_filename, outputs_filename, models, add_reals=True,
     Helper to export an ensemble of model instances.  Assumes
     all models have same dis and reference information, only difference is
     properties and boundary conditions.  Assumes model.nam.split('_')[-1] is
-    the realization suffix to use in the netcdf variable names
+    the realization suffix to use in the netcdf variable names.  The output
+    files of the models are opened one model at a time, or with a thread
+    pool of nworkers workers if nworkers is passed (default is 1).
     """
+    nworkers = kwargs.pop('nworkers', 1)
     f_in, f_out = None, None
     for m in models[1:]:
         assert m.get_nrow_ncol_nlay_nper() == models[
@@ -72,15 +76,20 @@ def ensemble_helper(inputs_filename, outputs_filename, models, add_reals=True,
         f_in.add_global_attributes({"namefile": ''})
 
     if outputs_filename is not None:
+        logger = kwargs.get('logger', None)
+        if logger is not None:
+            logger.log('loading ensemble results')
+        oudics, _ = ensemble_map(_load_results_dict, models,
+                                 nworkers=nworkers)
+        if logger is not None:
+            logger.log('loading ensemble results')
         f_out = output_helper(outputs_filename, models[0],
-                              models[0].load_results(as_dict=True), **kwargs)
+                              dict(oudics[0]), **kwargs)
         vdict = {}
-        vdicts = [output_helper(vdict, models[0], models[0]. \
-                                load_results(as_dict=True), **kwargs)]
+        vdicts = [output_helper(vdict, models[0], dict(oudics[0]), **kwargs)]
         i = 1
-        for m in models[1:]:
+        for m, oudic in zip(models[1:], oudics[1:]):
             suffix = m.name.split('.')[0].split('_')[-1]
-            oudic = m.load_results(as_dict=True)
             vdict = {}
             output_helper(vdict, m, oudic, **kwargs)
             vdicts.append(vdict)
@@ -115,6 +124,10 @@ def ensemble_helper(inputs_filename, outputs_filename, models, add_reals=True,
     return f_in, f_out
 
 
+def _load_results_dict(model):
+    return model.load_results(as_dict=True)
+
+
 def _add_output_nc_variable(f, times, shape3d, out_obj, var_name, logger=None,
                             text='', mask_vals=(), mask_array3d=None):
     if logger:
@@ -84,6 +84,7 @@ class MFTransient(object):
             if self._current_key == old_transient_key:
                 # update current key
                 self._current_key = new_transient_key
+            self._modified = True
 
     def _transient_setup(self, data_storage):
         self._data_storage = data_storage
@@ -185,6 +186,8 @@ class MFData(DataInterface):
     ----------
     _current_key : str
         current key defining specific transient dataset to be accessed
+    modified : bool
+        whether the data has changed since it was last loaded or written
 
     Methods
     -------
@@ -209,6 +212,8 @@ class MFData(DataInterface):
         # initialize
         self._current_key = None
         self._valid = True
+        self._modified = True
+        self._deferred_block = None
         self._simulation_data = sim_data
         self._model_or_sim = model_or_sim
         self.structure = structure
@@ -276,7 +281,28 @@ class MFData(DataInterface):
             'must define plotable in child '
             'class to use this base class')
 
+    @property
+    def _data_storage(self):
+        if self._deferred_block is not None:
+            # the block containing this data has not been read yet
+            self._deferred_block.load_deferred()
+        return self._storage
+
+    @_data_storage.setter
+    def _data_storage(self, data_storage):
+        self._storage = data_storage
+
+    @property
+    def modified(self):
+        return self._modified
+
+    @modified.setter
+    def modified(self, modified):
+        self._modified = modified
+
     def _resync(self):
+        # called whenever the data changes
+        self._modified = True
         model = self.model
         if model is not None:
             model._mg_resync = True
@@ -52,10 +52,11 @@ class MFArray(MFMultiDimVar):
     set_layered_data : (layered_data : bool)
         Sets whether this MFArray supports layered data
     store_as_external_file : (external_file_path : string, multiplier : float,
-        layer_num : int)
+        layer_num : int, binary : bool)
         Stores data from layer "layer_num" to an external file at
         "external_file_path" with a multiplier "multiplier".  For unlayered
-        data do not pass in "layer".
+        data do not pass in "layer".  If "binary" is True the data is
+        written to a MODFLOW 6 binary file.
     store_as_internal_array : (multiplier : float, layer_num : int)
         Stores data from layer "layer_num" internally within the MODFLOW file
         with a multiplier "multiplier". For unlayered data do not pass in
@@ -164,12 +165,16 @@ class MFArray(MFMultiDimVar):
             raise AttributeError(name)
         elif name == 'fname':
             self._get_storage_obj().layer_storage.first_item().fname = value
+            self._resync()
         elif name == 'factor':
             self._get_storage_obj().layer_storage.first_item().factor = value
+            self._resync()
         elif name == 'iprn':
             self._get_storage_obj().layer_storage.first_item().iprn = value
+            self._resync()
         elif name == 'binary':
             self._get_storage_obj().layer_storage.first_item().binary = value
+            self._resync()
         else:
             super(MFArray, self).__setattr__(name, value)
 
@@ -345,11 +350,13 @@ class MFArray(MFMultiDimVar):
                                   traceback_, comment,
                                   self._simulation_data.debug)
         self._get_storage_obj().layered = layered_data
+        self._modified = True
 
     def make_layered(self):
         if self.supports_layered():
             try:
                 self._get_storage_obj().make_layered()
+                self._modified = True
             except Exception as ex:
                 type_, value_, traceback_ = sys.exc_info()
                 raise MFDataException(self.structure.get_model(),
@@ -419,6 +426,37 @@ class MFArray(MFMultiDimVar):
         if multiplier is not None:
             self._get_storage_obj().layer_storage[ds_index[0]].multiplier = \
                     multiplier[0]
+        self._modified = True
+
+    def _set_all_data_external(self, file_base, binary=False):
+        # store each layer of data that is stored as an internal array in
+        # its own external file
+        storage = self._get_storage_obj()
+        if storage is None:
+            return
+        if binary:
+            extension = 'bin'
+        else:
+            extension = 'txt'
+        if storage.layered:
+            for layer in storage.layer_storage.indexes():
+                if self._is_internal_array(storage.layer_storage[layer]):
+                    file_path = '{}_layer{}.{}'.format(file_base, layer[0] + 1,
+                                                       extension)
+                    self.store_as_external_file(file_path, layer=layer,
+                                                binary=binary)
+        elif self._is_internal_array(storage.layer_storage.first_item()):
+            file_path = '{}.{}'.format(file_base, extension)
+            self.store_as_external_file(file_path, binary=binary)
+
+    @staticmethod
+    def _is_internal_array(layer_storage):
+        # time array series references are stored internally as strings
+        # and must stay in the package file
+        return layer_storage.data_storage_type == \
+            DataStorageType.internal_array and \
+            layer_storage.internal_data is not None and \
+            not isinstance(layer_storage.internal_data, str)
 
     def has_data(self, layer=None):
         storage = self._get_storage_obj()
@@ -1038,6 +1076,14 @@ class MFTransientArray(MFArray, MFTransient):
         return super(MFTransientArray, self).load(first_line, file_handle,
                                                   pre_data_comments)
 
+    def _set_all_data_external(self, file_base, binary=False):
+        # each stress period is stored in its own set of files
+        for key in list(self._data_storage.keys()):
+            if isinstance(key, int):
+                self.get_data_prep(key)
+                super(MFTransientArray, self)._set_all_data_external(
+                    '{}_{}'.format(file_base, key + 1), binary)
+
     def _new_storage(self, set_layers=True, base_storage=False,
                      stress_period=0):
         if base_storage:
@@ -81,6 +81,9 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
     search_data : (search_term : string, col : int)
         Searches the list data at column "col" for "search_term".  If col is
         None search_data searches the entire list.
+    store_as_external_file : (external_file_path : string, binary : bool)
+        Stores the list data in an external file at "external_file_path".
+        If "binary" is True the data is written to a MODFLOW 6 binary file.
     load : (first_line : string, file_handle : file descriptor,
             block_header : MFBlockHeader, pre_data_comments : MFComment) :
             tuple (bool, string)
@@ -334,6 +337,60 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                                                                   col),
                                    self._simulation_data.debug, ex)
 
+    def store_as_external_file(self, external_file_path, binary=False):
+        self._resync()
+        storage = self._get_storage_obj()
+        if storage is None:
+            return
+        try:
+            storage.set_data({'filename': external_file_path,
+                              'data': storage.get_data(),
+                              'binary': binary})
+        except Exception as ex:
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(self.structure.get_model(),
+                                  self.structure.get_package(),
+                                  self._path,
+                                  'storing data in external file '
+                                  '{}'.format(external_file_path),
+                                  self.structure.name,
+                                  inspect.stack()[0][3], type_,
+                                  value_, traceback_, None,
+                                  self._simulation_data.debug, ex)
+
+    def _has_internal_data(self):
+        storage = self._get_storage_obj()
+        return storage is not None and \
+            storage.layer_storage.first_item().data_storage_type == \
+            DataStorageType.internal_array and storage.has_data()
+
+    def _binary_supported(self):
+        # MODFLOW 6 binary list files contain a cellid followed by double
+        # precision values and auxiliary variables
+        package_dim = self._data_dimensions.package_dim
+        data_items = self.structure.data_item_structures
+        if self.structure.type != DatumType.recarray or \
+                not data_items or not data_items[0].is_cellid or \
+                package_dim.boundnames() or \
+                len(package_dim.get_tsnames()) > 0:
+            return False
+        for data_item in data_items[1:]:
+            if data_item.name == 'aux' or data_item.name == 'boundname':
+                continue
+            if data_item.optional or data_item.is_cellid or \
+                    data_item.type != DatumType.double_precision:
+                return False
+        return True
+
+    def _set_all_data_external(self, file_base, binary=False):
+        if self._has_internal_data():
+            binary = binary and self._binary_supported()
+            if binary:
+                file_path = '{}.bin'.format(file_base)
+            else:
+                file_path = '{}.txt'.format(file_base)
+            self.store_as_external_file(file_path, binary)
+
     def get_file_entry(self, values_only=False,
                        ext_file_action=ExtFileAction.copy_relative_paths):
         try:
@@ -701,12 +758,17 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
 
     def _new_storage(self, stress_period=0):
         return DataStorage(self._simulation_data, self._model_or_sim,
-                           self._data_dimensions, self.get_file_entry,
+                           self._data_dimensions, self._get_file_entry_current,
                            DataStorageType.internal_array,
                            DataStructureType.recarray,
                            stress_period=stress_period,
                            data_path=self._path)
 
+    def _get_file_entry_current(self):
+        # file entry of the storage currently selected, bypassing the
+        # transient key lookup of subclasses
+        return MFList.get_file_entry(self)
+
     def _get_storage_obj(self):
         return self._data_storage
 
@@ -826,6 +888,11 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         Updates a record at index "key_index" and time "key" with the contents
         of "record".  If the index does not exist update_record appends the
         contents of "record" to this list's recarray.
+    store_as_external_file : (external_file_path : string, binary : bool,
+        key : int)
+        Stores the list data at time "key" in an external file at
+        "external_file_path".  If "binary" is True the data is written to a
+        MODFLOW 6 binary file.
     See Also
     --------
 
@@ -1012,6 +1079,26 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         self._update_record_prep(key)
         super(MFTransientList, self).update_record(record, key_index)
 
+    def store_as_external_file(self, external_file_path, binary=False, key=0):
+        self.get_data_prep(key)
+        super(MFTransientList, self).store_as_external_file(external_file_path,
+                                                            binary)
+
+    def _set_all_data_external(self, file_base, binary=False):
+        # each stress period is stored in its own file
+        for key in list(self._data_storage.keys()):
+            if isinstance(key, int):
+                self.get_data_prep(key)
+                if self._has_internal_data():
+                    key_binary = binary and self._binary_supported()
+                    if key_binary:
+                        extension = 'bin'
+                    else:
+                        extension = 'txt'
+                    file_path = '{}_{}.{}'.format(file_base, key + 1,
+                                                  extension)
+                    self.store_as_external_file(file_path, key_binary, key)
+
     def _new_storage(self, stress_period=0):
         return OrderedDict()
 
@@ -185,6 +185,7 @@ class MFScalar(mfdata.MFData):
     def add_one(self):
         datum_type = self.structure.get_datum_type()
         if datum_type == int or datum_type == np.int32:
+            self._modified = True
             if self._get_storage_obj().get_data() is None:
                 try:
                     self._get_storage_obj().set_data(1)
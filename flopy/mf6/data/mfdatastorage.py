@@ -1105,12 +1105,15 @@ class DataStorage(object):
                         self.data_dimensions.structure, self.data_dimensions,
                         self._simulation_data, self._data_path,
                         self._stress_period)
-                    str_layered = self.data_dimensions.structure.layered
+                    if layer is None:
+                        ilay = None
+                    else:
+                        ilay = layer_new[0] + 1
                     file_access.write_binary_file(
                         data, fp, text, self._model_or_sim.modeldiscrit,
                         self._model_or_sim.modeltime,
                         stress_period=self._stress_period, precision='double',
-                        write_multi_layer=(layer is None and str_layered))
+                        ilay=ilay)
                 else:
                     file_access = MFFileAccessArray(
                         self.data_dimensions.structure, self.data_dimensions,
@@ -166,61 +166,68 @@ class MFFileAccessArray(MFFileAccess):
 
     def write_binary_file(self, data, fname, text, modelgrid=None,
                           modeltime=None, stress_period=0,
-                          precision='double', write_multi_layer=False):
+                          precision='double', ilay=None):
+        # MODFLOW 6 reads an external binary array as a single header
+        # followed by all of the array's values
         data = self._resolve_cellid_numbers_to_file(data)
+        numpy_type = self.datum_to_numpy_type(
+            self.structure.get_datum_type(return_enum_type=True))[0]
+        data = np.asarray(data, dtype=numpy_type)
         fd = self._open_ext_file(fname, binary=True, write=True)
-        if write_multi_layer:
-            for layer, value in enumerate(data):
-                self._write_layer(fd, value, modelgrid, modeltime,
-                                  stress_period, precision, text, fname,
-                                  layer+1)
-        else:
-            self._write_layer(fd, data, modelgrid, modeltime, stress_period,
-                              precision, text, fname)
-        data.tofile(fd)
-        fd.close()
-
-    def _write_layer(self, fd, data, modelgrid, modeltime, stress_period,
-                     precision, text, fname, ilay=None):
         header_data = self._get_header(modelgrid, modeltime, stress_period,
-                                       precision, text, fname, ilay)
+                                       precision, text, fname, ilay,
+                                       data.size)
         header_data.tofile(fd)
         data.tofile(fd)
+        fd.close()
 
     def _get_header(self, modelgrid, modeltime, stress_period, precision, text,
-                    fname, ilay=None):
-        # handle dis (row, col, lay), disv (ncpl, lay), and disu (nodes) cases
+                    fname, ilay=None, data_size=None):
+        # handle dis (row, col, lay), disv (ncpl, lay), and disu (nodes) cases.
+        # MODFLOW 6 expects the first two header dimensions to multiply to
+        # the number of values in the record, so anything other than a
+        # single layer is described as data_size x 1 x 1
         if modelgrid is not None and modeltime is not None:
             pertim = modeltime.perlen[stress_period]
             totim = modeltime.perlen.sum()
             if ilay is None:
                 ilay = modelgrid.nlay
             if modelgrid.grid_type == 'structured':
+                ncol, nrow = modelgrid.ncol, modelgrid.nrow
+                if data_size is not None and data_size != ncol * nrow:
+                    ncol, nrow, ilay = data_size, 1, 1
                 return BinaryHeader.create(
                     bintype='vardis', precision=precision, text=text,
-                    nrow=modelgrid.nrow, ncol=modelgrid.ncol,
+                    nrow=nrow, ncol=ncol,
                     ilay=ilay, pertim=pertim,
                     totim=totim, kstp=1, kper=stress_period+1)
             elif modelgrid.grid_type == 'vertex':
-                if ilay is None:
-                    ilay = modelgrid.nlay
+                ncpl = modelgrid.ncpl
+                if data_size is not None and data_size != ncpl:
+                    ncpl, ilay = data_size, 1
                 return BinaryHeader.create(
                     bintype='vardisv', precision=precision, text=text,
-                    ncpl=modelgrid.ncpl, ilay=ilay, m3=1,
+                    ncpl=ncpl, ilay=ilay, m3=1,
                     pertim=pertim, totim=totim, kstp=1,
-                    kper=stress_period)
+                    kper=stress_period+1)
             elif modelgrid.grid_type == 'unstructured':
+                nodes = modelgrid.nnodes
+                if data_size is not None:
+                    nodes = data_size
                 return BinaryHeader.create(
                     bintype='vardisu', precision=precision, text=text,
-                    nodes=modelgrid.nnodes, m2=1, m3=1,
-                    pertim=pertim, totim=totim, kstp=1, kper=stress_period)
+                    nodes=nodes, m2=1, m3=1,
+                    pertim=pertim, totim=totim, kstp=1, kper=stress_period+1)
             else:
                 if ilay is None:
                     ilay = 1
+                ncol = 1
+                if data_size is not None:
+                    ncol, ilay = data_size, 1
                 header = BinaryHeader.create(
                     bintype='vardis', precision=precision, text=text,
-                    nrow=1, ncol=1, ilay=ilay, pertim=pertim,
-                    totim=totim, kstp=1, kper=stress_period)
+                    nrow=1, ncol=ncol, ilay=ilay, pertim=pertim,
+                    totim=totim, kstp=1, kper=stress_period+1)
                 if self._simulation_data.verbosity_level.value >= \
                         VerbosityLevel.normal.value:
                     print('Model grid does not have a valid type. Using '
@@ -228,9 +235,12 @@ class MFFileAccessArray(MFFileAccess):
                           'binary file {}.'.format(fname))
         else:
             pertim = np.float64(1.0)
+            ncol = 1
+            if data_size is not None:
+                ncol = data_size
             header = BinaryHeader.create(
                 bintype='vardis', precision=precision, text=text,
-                nrow=1, ncol=1, ilay=1, pertim=pertim,
+                nrow=1, ncol=ncol, ilay=1, pertim=pertim,
                 totim=pertim, kstp=1, kper=stress_period)
             if self._simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
@@ -267,6 +277,14 @@ class MFFileAccessArray(MFFileAccess):
         header_dtype = bf.BinaryHeader.set_dtype(
             bintype=self._get_bintype(modelgrid),
             precision='double')
+        if read_multi_layer and len(data_shape) > 1:
+            # files written one record per layer have a header that only
+            # describes a single layer
+            header_data = np.fromfile(fd, dtype=header_dtype, count=1)
+            fd.seek(0)
+            if header_data.size == 1 and \
+                    header_data[0][5] * header_data[0][6] == data_size:
+                read_multi_layer = False
         if read_multi_layer and len(data_shape) > 1:
             all_data = np.empty(data_shape, numpy_type)
             headers = []
@@ -763,7 +781,7 @@ class MFFileAccessList(MFFileAccess):
     def _get_cell_header(self, modelgrid):
         if modelgrid.grid_type == 'structured':
             return [('layer', np.int32), ('row', np.int32), ('col', np.int32)]
-        elif modelgrid.grid_type == 'vertex_layered':
+        elif modelgrid.grid_type == 'vertex':
             return [('layer', np.int32), ('ncpl', np.int32)]
         else:
             return [('nodes', np.int32)]
@@ -773,6 +791,7 @@ class MFFileAccessList(MFFileAccess):
         # lock things to maximize performance
         self._data_dimensions.lock()
         self._last_line_info = []
+        self._last_line_items = []
         self._data_line = None
 
         # read in any pre data comments
@@ -787,7 +806,7 @@ class MFFileAccessList(MFFileAccess):
             return [False, arr_line]
         if len(arr_line) >= 2 and arr_line[0].upper() == 'OPEN/CLOSE':
             try:
-                storage.process_open_close_line(arr_line, 0)
+                storage.process_open_close_line(arr_line, (0,))
             except Exception as ex:
                 message = 'An error occurred while processing the following' \
                           'open/close line: {}'.format(current_line)
@@ -825,6 +844,7 @@ class MFFileAccessList(MFFileAccess):
         data_loaded = []
         self._temp_dict = {}
         self._last_line_info = []
+        self._last_line_items = []
         store_data = False
         struct = self.structure
         self.simple_line = \
@@ -905,13 +925,39 @@ class MFFileAccessList(MFFileAccess):
             recarrays = parent_block.get_all_recarrays()
         recarray_len = len(recarrays)
 
+        readline = file_handle.readline
+        if self.simple_line and recarray_len == 1 and store_data:
+            # read the rest of the block at once and try to load it using
+            # the layout of the first line
+            block_lines, end_line = self._read_block_lines(file_handle)
+            block_data = self._load_list_block(block_lines)
+            if block_data is not None:
+                data_loaded += block_data
+                if store_internal:
+                    storage.store_internal(data_loaded, None, False,
+                                           current_key)
+                    storage.data_dimensions.unlock()
+                    return [False, end_line, data_line]
+                else:
+                    data_rec = storage._build_recarray(data_loaded,
+                                                       current_key, True)
+                    storage.data_dimensions.unlock()
+                    return data_rec
+            # block can not be loaded at once, process the lines already
+            # read one at a time
+            block_lines.append(end_line)
+            block_iter = iter(block_lines)
+
+            def readline():
+                return next(block_iter, '')
+
         # loop until end of block
         line = ' '
         optional_line_info = []
         line_info_processed = False
         data_structs = struct.data_item_structures
         while line != '':
-            line = file_handle.readline()
+            line = readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (arr_line and len(arr_line[0]) >= 2 and
                     arr_line[0][:3].upper() == 'END'):
@@ -1056,6 +1102,90 @@ class MFFileAccessList(MFFileAccess):
         else:
             return [False, None, data_line]
 
+    @staticmethod
+    def _read_block_lines(file_handle):
+        # read lines up to the end of the block, returns the lines and the
+        # line that ended the block
+        block_lines = []
+        line = file_handle.readline()
+        while line:
+            if line.lstrip()[:3].upper() == 'END':
+                break
+            block_lines.append(line)
+            line = file_handle.readline()
+        return block_lines, line
+
+    def _load_list_block(self, block_lines):
+        # loads all lines of a list block at once.  this only works when
+        # every line has the same layout as the first line of the block
+        # (no comments, delimiters, quotes, or missing optional data).
+        # returns None if the lines need to be loaded one at a time.
+        if not block_lines:
+            return []
+        text = ''.join(block_lines)
+        for mark in ('#', '!', '//', ',', '"', "'"):
+            if mark in text:
+                return None
+        layout = []
+        for entry, data_item in zip(self._last_line_info,
+                                    self._last_line_items):
+            for sub_entry in entry:
+                layout.append((sub_entry[0], sub_entry[1], sub_entry[2],
+                               data_item))
+        token_indexes = [sub_entry[0] for sub_entry in layout
+                         if sub_entry[1] is not None]
+        num_tokens = len(token_indexes)
+        if num_tokens == 0 or token_indexes != list(range(num_tokens)):
+            return None
+        rows = [line.split() for line in block_lines]
+        for row in rows:
+            if len(row) != num_tokens:
+                return None
+        tokens = np.array(rows)
+        num_rows = len(rows)
+
+        # convert one column at a time
+        columns = []
+        cellid_columns = []
+        for index, datum_type, cellid_size, data_item in layout:
+            if datum_type is None:
+                columns.append([None] * num_rows)
+            elif cellid_size > 0:
+                try:
+                    cellid_column = tokens[:, index].astype(np.int64)
+                except ValueError:
+                    return None
+                if (cellid_column < 1).any():
+                    return None
+                cellid_columns.append((cellid_column - 1).tolist())
+                if len(cellid_columns) == cellid_size:
+                    columns.append(list(zip(*cellid_columns)))
+                    cellid_columns = []
+            elif datum_type == DatumType.double_precision:
+                if data_item.support_negative_index:
+                    return None
+                column = np.char.replace(tokens[:, index], 'd', 'e')
+                column = np.char.replace(column, 'D', 'e')
+                try:
+                    columns.append(column.astype(np.float64).tolist())
+                except ValueError:
+                    return None
+            elif datum_type == DatumType.integer:
+                if data_item.numeric_index:
+                    return None
+                try:
+                    columns.append(tokens[:, index].astype(np.int64).tolist())
+                except ValueError:
+                    return None
+            else:
+                columns.append([convert_data(value, self._data_dimensions,
+                                             datum_type, data_item)
+                                for value in tokens[:, index].tolist()])
+        if cellid_columns:
+            # incomplete cellid
+            return None
+        return list(zip(*columns))
+
     def _load_list_line(self, storage, arr_line, line_num, data_loaded,
                         build_type_list, current_key, data_index_start=0,
                         data_set=None, ignore_optional_vars=False,
@@ -1379,6 +1509,7 @@ class MFFileAccessList(MFFileAccess):
         struct = self.structure
         if add_to_last_line:
             self._last_line_info.append([])
+            self._last_line_items.append(data_item)
         if data_item.is_cellid or (data_item.possible_cellid and
                                    storage._validate_cellid(
                                        arr_line, data_index)):
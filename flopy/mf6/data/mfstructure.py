@@ -4,6 +4,9 @@ mfstructure module.  Contains classes related to package structure
 
 """
 import os
+import sys
+import pickle
+import tempfile
 import traceback
 import ast
 import keyword
@@ -12,6 +15,7 @@ from textwrap import TextWrapper
 from collections import OrderedDict
 import numpy as np
 from ..mfbase import PackageContainer, StructException
+from ...version import __version__
 
 
 class DfnType(Enum):
@@ -2123,8 +2127,17 @@ class MFStructure(object):
     dimension_dict : dict
         Dictionary mapping paths to dimension information to the dataitem whose
         dimension information is being described
+    cache_dir : str
+        Folder where the parsed structure is cached between sessions.  The
+        cache is rebuilt when the dfn files or the package classes generated
+        from them change.  The cache is only used when the FLOPY_CACHE_DIR
+        environment variable is set, and the default is None (no cache).
+        The cache file is only readable by its owner, and a cache file
+        that belongs to another user or that can be written by other users
+        is not loaded.
     """
     _instance = None
+    cache_dir = os.environ.get('FLOPY_CACHE_DIR') or None
 
     def __new__(cls, internal_request=False, load_from_dfn_files=False):
         if cls._instance is None:
@@ -2138,8 +2151,11 @@ class MFStructure(object):
             cls._instance.load_from_dfn_files = load_from_dfn_files
             cls._instance.flopy_dict = {}
 
-            # Read metadata from file
-            cls._instance.valid = cls._instance.__load_structure()
+            # Read metadata from the cache or from file
+            if not cls._instance.__load_cache():
+                cls._instance.valid = cls._instance.__load_structure()
+                if cls._instance.valid:
+                    cls._instance.__save_cache()
         elif not cls._instance.valid and not internal_request:
             if cls._instance.__load_structure():
                 cls._instance.valid = True
@@ -2149,6 +2165,72 @@ class MFStructure(object):
     def get_version_string(self):
         return format(str(self.mf_version))
 
+    def __cache_file(self):
+        if self.cache_dir is None:
+            return None
+        if self.load_from_dfn_files:
+            file_name = 'mf6_structure_dfn.pkl'
+        else:
+            file_name = 'mf6_structure.pkl'
+        return os.path.join(self.cache_dir, file_name)
+
+    def __cache_key(self):
+        # the structure depends on the dfn files and on the package classes
+        # generated from them
+        data_path = os.path.dirname(os.path.realpath(__file__))
+        folders = [os.path.join(data_path, 'dfn'),
+                   os.path.join(os.path.dirname(data_path), 'modflow')]
+        key = [__version__, sys.version, self.load_from_dfn_files]
+        for folder in folders:
+            for file_name in sorted(os.listdir(folder)):
+                if os.path.splitext(file_name)[1] in ('.dfn', '.py'):
+                    stat = os.stat(os.path.join(folder, file_name))
+                    key.append((file_name, stat.st_size, stat.st_mtime))
+        return key
+
+    def __load_cache(self):
+        cache_file = self.__cache_file()
+        if cache_file is None or not os.path.isfile(cache_file):
+            return False
+        try:
+            with open(cache_file, 'rb') as fd:
+                if not self.__trusted_cache(os.fstat(fd.fileno())):
+                    return False
+                cache = pickle.load(fd)
+            if cache['key'] != self.__cache_key():
+                return False
+            self.__dict__.update(cache['structure'])
+        except Exception:
+            # an unreadable cache is rebuilt from the dfn files
+            return False
+        return True
+
+    @staticmethod
+    def __trusted_cache(stat):
+        # only load a cache file written by the current user that other
+        # users cannot modify
+        if not hasattr(os, 'getuid'):
+            return True
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    def __save_cache(self):
+        cache_file = self.__cache_file()
+        if cache_file is None:
+            return
+        cache = {'key': self.__cache_key(), 'structure': self.__dict__}
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+            # write to a temporary file first so that concurrent processes
+            # never read a partially written cache, mkstemp creates the
+            # file readable by the owner only
+            fd, temp_file = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as fd_cache:
+                pickle.dump(cache, fd_cache, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except (OSError, pickle.PicklingError):
+            pass
+
     def __load_structure(self):
         # set up structure classes
         self.sim_struct = MFSimulationStructure()
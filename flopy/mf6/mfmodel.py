@@ -7,7 +7,7 @@ import numpy as np
 from .mfbase import PackageContainer, ExtFileAction, PackageContainerType, \
                     MFDataException, ReadAsArraysException, FlopyException, \
                     VerbosityLevel
-from .mfpackage import MFPackage
+from .mfpackage import MFPackage, _write_packages
 from .coordinates import modeldimensions
 from ..utils import datautil
 from ..discretization.structuredgrid import StructuredGrid
@@ -616,7 +616,8 @@ class MFModel(PackageContainer, ModelInterface):
 
         return instance
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(self, ext_file_action=ExtFileAction.copy_relative_paths,
+              only_modified=False):
         """
         write model to model files
 
@@ -626,6 +627,9 @@ class MFModel(PackageContainer, ModelInterface):
             defines what to do with external files when the simulation path has
             changed.  defaults to copy_relative_paths which copies only files
             with relative paths, leaving files defined by absolute paths fixed.
+        only_modified : bool
+            only write packages that changed since they were last loaded or
+            written, or whose files are missing or have moved
 
         Returns
         -------
@@ -633,20 +637,34 @@ class MFModel(PackageContainer, ModelInterface):
         Examples
         --------
         """
+        _write_packages(self._write_list(), ext_file_action, only_modified)
 
-        # write name file
-        if self.simulation_data.verbosity_level.value >= \
-                VerbosityLevel.normal.value:
-            print('    writing model name file...')
+    def _write_list(self):
+        # (package, message) tuples for the name file and all packages
+        write_list = [(self.name_file, '    writing model name file...')]
+        for pp in self.packagelist:
+            write_list.append((pp, '    writing package {}...'.format(
+                pp._get_pname())))
+        return write_list
 
-        self.name_file.write(ext_file_action=ext_file_action)
+    def set_all_data_external(self, binary=False):
+        """
+        stores all arrays and stress period lists of the model's packages in
+        external files
 
-        # write packages
-        for pp in self.packagelist:
-            if self.simulation_data.verbosity_level.value >= \
-                    VerbosityLevel.normal.value:
-                print('    writing package {}...'.format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+        Parameters
+        ----------
+        binary : bool
+            write MODFLOW 6 binary files instead of text files
+
+        Returns
+        -------
+
+        Examples
+        --------
+        """
+        for package in self.packagelist:
+            package.set_all_data_external(binary)
 
     def get_grid_type(self):
         """
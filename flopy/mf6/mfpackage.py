@@ -3,6 +3,7 @@ import sys
 import errno
 import inspect
 import numpy as np
+from shutil import copyfile
 from collections import OrderedDict
 
 from .mfbase import PackageContainer, ExtFileAction, PackageContainerType
@@ -12,6 +13,7 @@ from .mfbase import MFFileMgmt, MFDataException, ReadAsArraysException, \
 from .data.mfstructure import DatumType
 from .data import mfstructure, mfdata
 from ..utils import datautil
+from ..utils.binaryfile import ensemble_map
 from .data import mfdataarray, mfdatalist, mfdatascalar
 from .coordinates import modeldimensions
 from ..pakbase import PackageInterface
@@ -230,6 +232,14 @@ class MFBlock(object):
     load : (block_header : MFBlockHeader, fd : file, strict : boolean)
         loads block from file object.  file object must be advanced to
         beginning of block before calling
+    defer_load : (block_header : MFBlockHeader, fd : file, strict : boolean)
+        records the location of the block in file object and skips to the
+        end of the block.  the block is loaded when its data is first used
+    load_deferred : ()
+        loads the parts of the block recorded by defer_load
+    set_all_data_external : (base_name : string, binary : bool)
+        stores the block's arrays and stress period lists in external files
+        whose names start with base_name
     write : (fd : file)
         writes block to a file object
     is_valid : ()
@@ -272,6 +282,7 @@ class MFBlock(object):
         self.enabled = structure.number_non_optional_data() > 0
         self.loaded = False
         self.external_file_name = None
+        self._deferred = []
         self._structure_init()
 
     def __repr__(self):
@@ -604,8 +615,11 @@ class MFBlock(object):
 
         # if block not empty
         if not (len(arr_line[0]) > 2 and arr_line[0][:3].upper() == 'END'):
-            if arr_line[0].lower() == 'open/close':
-                # open block contents from external file
+            if arr_line[0].lower() == 'open/close' and \
+                    'binary' not in [item.lower().strip('()')
+                                     for item in arr_line]:
+                # open block contents from external file.  binary files are
+                # read by the data set
                 fd_block.readline()
                 fd_path = os.path.split(os.path.realpath(fd_block.name))[0]
                 try:
@@ -725,6 +739,54 @@ class MFBlock(object):
         self.loaded = True
         self.is_valid()
 
+    def is_deferred(self):
+        return len(self._deferred) > 0
+
+    def defer_load(self, block_header, fd, strict=True):
+        self._deferred.append((os.path.realpath(fd.name), fd.tell(),
+                               block_header, strict))
+        self.enabled = True
+        for dataset in self.datasets.values():
+            dataset._deferred_block = self
+
+        # skip to the end of the block, recording any external files so that
+        # they are copied with the package file
+        line = fd.readline()
+        while line != '':
+            clean_line = line.strip()
+            if len(clean_line) > 2 and clean_line[:3].upper() == 'END':
+                break
+            if clean_line[:10].lower() == 'open/close':
+                arr_line = datautil.PyListUtil.split_data_line(clean_line)
+                if len(arr_line) > 1:
+                    self._simulation_data.mfpath.add_ext_file(
+                        arr_line[1], self._container_package.model_name)
+            line = fd.readline()
+
+    def load_deferred(self):
+        deferred = self._deferred
+        self._deferred = []
+        # data may be flagged as modified by the change that triggered the
+        # load
+        modified = {}
+        for key, dataset in self.datasets.items():
+            dataset._deferred_block = None
+            modified[key] = dataset.modified
+        if self._simulation_data.verbosity_level.value >= \
+                VerbosityLevel.verbose.value:
+            print('      loading block {}...'.format(self.structure.name))
+        with open(deferred[0][0], 'r') as fd:
+            for file_path, position, block_header, strict in deferred:
+                fd.seek(position)
+                self.load(block_header, fd, strict)
+
+        # the loaded data matches the package file
+        for key, dataset in self.datasets.items():
+            dataset.modified = modified.get(key, False)
+        for block_header in self.block_headers:
+            for dataset in block_header.data_items:
+                dataset.modified = False
+
     def _find_data_by_keyword(self, line, fd, initial_comment):
         first_key = None
         nothing_found = False
@@ -867,6 +929,23 @@ class MFBlock(object):
                     comments.append('\n')
                 comments.append(arr_line)
 
+    def set_all_data_external(self, base_name, binary=False):
+        # store arrays and stress period lists in external files.  other
+        # lists are not read with OPEN/CLOSE by MODFLOW 6 and stay internal
+        if self.external_file_name is not None:
+            # block is already read from its own external file
+            return
+        for key, dataset in self.datasets.items():
+            if not dataset.enabled:
+                continue
+            if isinstance(dataset, mfdataarray.MFArray) or \
+                    (isinstance(dataset, mfdatalist.MFList) and
+                     self.structure.name.lower() == 'period' and
+                     dataset.structure.type == DatumType.recarray and
+                     dataset.structure.data_item_structures[0].is_cellid):
+                dataset._set_all_data_external(
+                    '{}_{}'.format(base_name, dataset.structure.name), binary)
+
     def write(self, fd, ext_file_action=ExtFileAction.copy_relative_paths):
         # never write an empty block
         is_empty = self.is_empty()
@@ -1089,6 +1168,10 @@ class MFPackage(PackageContainer, PackageInterface):
         describes the blocks and data contain in this package
     dimensions : PackageDimension
         resolves data dimensions for data within this package
+    modified : bool
+        whether the package or any of its data has changed since the package
+        was last loaded or written.  Setting modified to False also resets
+        the data in the package.
 
     Methods
     -------
@@ -1103,6 +1186,15 @@ class MFPackage(PackageContainer, PackageInterface):
         Returns whether or not this package is valid
     write
         Writes the package to a file
+    write_needed : bool
+        Returns whether the package has changed or its file is out of date
+    is_deferred : bool
+        Returns whether any blocks have not been read from the package file
+    load_deferred
+        Reads any blocks that have not been read from the package file
+    set_all_data_external : (binary : bool)
+        Stores the package's arrays and stress period lists in external
+        files, MODFLOW 6 binary files if binary is True
     get_file_path : string
         Returns the package file's path
     remove
@@ -1125,6 +1217,8 @@ class MFPackage(PackageContainer, PackageInterface):
         self.model_or_sim = model_or_sim
         self._data_list = []
         self._package_type = package_type
+        self._modified = True
+        self._written_path = None
         if model_or_sim.type == 'Model' and package_type.lower() != 'nam':
             self.model_name = model_or_sim.name
         else:
@@ -1275,6 +1369,43 @@ class MFPackage(PackageContainer, PackageInterface):
         # return [data_object, data_object, ...]
         return self._data_list
 
+    @property
+    def modified(self):
+        if self._modified:
+            return True
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                if dataset.modified:
+                    return True
+        return False
+
+    @modified.setter
+    def modified(self, modified):
+        self._modified = modified
+        if not modified:
+            for block in self.blocks.values():
+                for dataset in block.datasets.values():
+                    dataset.modified = False
+
+    def write_needed(self):
+        """
+        Returns whether write() would change the package file.  This is the
+        case if the package or its data changed since the package was last
+        loaded or written, or if the package file path changed or the file
+        no longer exists.  Changes made to arrays in place, for example to
+        the array returned by get_data, are not detected.
+
+        Returns
+        -------
+        write_needed : bool
+
+        """
+        if self.modified or self._written_path is None:
+            return True
+        package_file_path = self.get_file_path()
+        return package_file_path != self._written_path or \
+            not os.path.isfile(package_file_path)
+
     def check(self, f=None, verbose=True, level=1, checktype=None):
         if checktype is None:
             checktype = mf6check
@@ -1536,7 +1667,11 @@ class MFPackage(PackageContainer, PackageInterface):
         # close file
         fd_input_file.close()
 
-        if self.simulation_data.auto_set_sizes:
+        # the package file matches the loaded data
+        self._written_path = self.get_file_path()
+        self.modified = False
+
+        if self.simulation_data.auto_set_sizes and not self.is_deferred():
             self._update_size_defs()
 
         # return validity of file
@@ -1627,7 +1762,8 @@ class MFPackage(PackageContainer, PackageInterface):
                     self.post_block_comments = \
                       MFComment('', self.path, self._simulation_data)
                     skip_block = False
-                    if self.blocks[block_key].loaded:
+                    if self.blocks[block_key].loaded or \
+                            self.blocks[block_key].is_deferred():
                         # Only blocks defined as repeating are allowed to have
                         # multiple entries
                         header_name = block_header_info.name
@@ -1645,7 +1781,18 @@ class MFPackage(PackageContainer, PackageInterface):
                                 print(warning_str)
                             skip_block = True
 
-                    if not skip_block:
+                    if not skip_block and self._can_defer(block_key):
+                        self.blocks[block_key].defer_load(block_header_info,
+                                                          fd_input_file,
+                                                          strict)
+                        self._simulation_data.mfdata[self.blocks[block_key].
+                                                     blk_post_comment_path] = \
+                            self.post_block_comments
+
+                        blocks_read += 1
+                        if blocks_read >= max_blocks:
+                            break
+                    elif not skip_block:
                         if self.simulation_data.verbosity_level.value >= \
                                 VerbosityLevel.verbose.value:
                             print('      loading block {}...'.format(
@@ -1668,11 +1815,24 @@ class MFPackage(PackageContainer, PackageInterface):
                     self._store_comment(line, found_first_block)
 
     def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+        package_file_path = self.get_file_path()
+        if self._simulation_data.lazy_io and not self.modified and \
+                ext_file_action == ExtFileAction.copy_relative_paths and \
+                self._written_path is not None and \
+                os.path.isfile(self._written_path):
+            # nothing changed since the package file was loaded or written,
+            # pass the file through unchanged
+            if package_file_path != self._written_path:
+                self._copy_package_file(self._written_path,
+                                        package_file_path)
+                self._written_path = package_file_path
+            return
+        self.load_deferred()
+
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
 
         # create any folders in path
-        package_file_path = self.get_file_path()
         package_folder = os.path.split(package_file_path)[0]
         if package_folder and not os.path.isdir(package_folder):
             os.makedirs(os.path.split(package_file_path)[0])
@@ -1685,6 +1845,81 @@ class MFPackage(PackageContainer, PackageInterface):
 
         fd.close()
 
+        self._written_path = package_file_path
+        self.modified = False
+
+    def is_deferred(self):
+        """
+        Returns whether any blocks of the package have not been read from
+        the package file yet.  Blocks are only deferred if the simulation
+        was loaded with lazy_io=True.
+
+        """
+        for block in self.blocks.values():
+            if block.is_deferred():
+                return True
+        return False
+
+    def load_deferred(self):
+        """
+        Reads all blocks of the package that have not been read from the
+        package file yet.
+
+        """
+        for block in self.blocks.values():
+            if block.is_deferred():
+                block.load_deferred()
+
+    def set_all_data_external(self, binary=False):
+        """
+        Stores all arrays and stress period lists of the package and its
+        child packages in external files named after the package file.
+        Data that is constant or already external is not changed.
+
+        Parameters
+        ----------
+        binary : bool
+            write MODFLOW 6 binary files instead of text files.  lists with
+            boundnames, time series, or non-numeric data are always written
+            as text files.
+
+        """
+        base_name = os.path.split(self.filename)[1]
+        for block in self.blocks.values():
+            block.set_all_data_external(base_name, binary)
+        for package in self._packagelist:
+            package.set_all_data_external(binary)
+
+    def _can_defer(self, block_key):
+        # options, dimensions, and blocks that reference other package files
+        # are always read since they define child packages and the size of
+        # the other data
+        if not self._simulation_data.lazy_io or self.package_type == 'nam':
+            return False
+        block_structure = self.blocks[block_key].structure
+        if block_structure.name.lower() in ('options', 'dimensions'):
+            return False
+        for data_structure in block_structure.data_structures.values():
+            if data_structure.file_data:
+                return False
+        return True
+
+    def _copy_package_file(self, old_file_path, new_file_path):
+        new_folder = os.path.split(new_file_path)[0]
+        if new_folder and not os.path.isdir(new_folder):
+            os.makedirs(new_folder)
+        try:
+            copyfile(old_file_path, new_file_path)
+        except (IOError, OSError):
+            type_, value_, traceback_ = sys.exc_info()
+            message = 'Unable to copy package file "{}" to "{}"' \
+                      '.'.format(old_file_path, new_file_path)
+            raise MFDataException(self.model_name, self._get_pname(),
+                                  self.path, 'copying package file',
+                                  None, inspect.stack()[0][3],
+                                  type_, value_, traceback_, message,
+                                  self._simulation_data.debug)
+
     def create_package_dimensions(self):
         model_dims = None
         if self.container_type[0] == PackageContainerType.model:
@@ -1830,6 +2065,66 @@ class MFPackage(PackageContainer, PackageInterface):
         return axes
 
 
+def _write_packages(packages, ext_file_action, only_modified=False,
+                    nworkers=None):
+    """
+    Write packages, optionally skipping unchanged packages and writing the
+    packages of different models concurrently.
+
+    Parameters
+    ----------
+    packages : list
+        list of (package, message) tuples.  message is printed before the
+        package is written if the verbosity level is normal or higher.
+    ext_file_action : ExtFileAction
+        defines what to do with external files when the simulation path has
+        changed
+    only_modified : bool
+        only write packages for which write_needed() is True
+    nworkers : int
+        number of threads used to write the package files.  If None or 1
+        the packages are written one at a time.  The packages of a model
+        share the model dimensions and are always written one at a time,
+        only the packages of different models are written concurrently,
+        after the simulation level packages.
+
+    Returns
+    -------
+    packages_written : list
+        list of packages that were written
+
+    """
+    to_write = []
+    for package, message in packages:
+        if only_modified and not package.write_needed():
+            continue
+        if message is not None and \
+                package.simulation_data.verbosity_level.value >= \
+                VerbosityLevel.normal.value:
+            print(message)
+        to_write.append(package)
+
+    def write_package(package):
+        package.write(ext_file_action=ext_file_action)
+
+    def write_group(group):
+        for package in group:
+            write_package(package)
+
+    if nworkers is None or nworkers <= 1:
+        write_group(to_write)
+    elif to_write:
+        groups = OrderedDict()
+        for package in to_write:
+            model = package.model_or_sim
+            key = id(model) if model.type == 'Model' else None
+            groups.setdefault(key, []).append(package)
+        write_group(groups.pop(None, []))
+        if groups:
+            ensemble_map(write_group, list(groups.values()), nworkers)
+    return to_write
+
+
 class MFChildPackages(object):
     def __init__(self, model, parent, pkg_type, filerecord, package=None,
                  package_class=None):
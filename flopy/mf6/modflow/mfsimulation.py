@@ -9,7 +9,7 @@ from ...mbase import run_model
 from ..mfbase import PackageContainer, MFFileMgmt, ExtFileAction, \
     PackageContainerType, MFDataException, FlopyException, \
     VerbosityLevel
-from ..mfpackage import MFPackage
+from ..mfpackage import MFPackage, _write_packages
 from ..data.mfstructure import DatumType
 from ..data import mfstructure
 from ..utils import binaryfile_utils
@@ -221,6 +221,9 @@ class MFSimulationData(object):
         dictionary containing discretization information for each model
     mfdata : SimulationDict
         custom dictionary containing all model data for the simulation
+    lazy_io : bool
+        when loading packages, defer reading blocks other than the options
+        and dimensions blocks until their data is first used
 
     """
 
@@ -244,6 +247,7 @@ class MFSimulationData(object):
         self.comments_on = False
         self.auto_set_sizes = True
         self.verify_data = True
+        self.lazy_io = False
         self.debug = False
         self.verbose = True
         self.verbosity_level = VerbosityLevel.normal
@@ -601,7 +605,7 @@ class MFSimulation(PackageContainer):
     @classmethod
     def load(cls, sim_name='modflowsim', version='mf6', exe_name='mf6.exe',
              sim_ws='.', strict=True, verbosity_level=1, load_only=None,
-             verify_data=False):
+             verify_data=False, lazy_io=False):
         """Load an existing model.
 
         Parameters
@@ -633,6 +637,13 @@ class MFSimulation(PackageContainer):
             example list: ['ic', 'maw', 'npf', 'oc', 'ims', 'gwf6-gwf6']
         verify_data : bool
             verify data when it is loaded. this can slow down loading
+        lazy_io : bool
+            only read the options and dimensions blocks of each package when
+            the simulation is loaded.  the other blocks, including any
+            OPEN/CLOSE files they reference, are read when their data is
+            first used.  package files that did not change are copied
+            unchanged when the simulation is written, and sizes such as
+            maxbound are only updated when a package is rewritten.
 
         Returns
         -------
@@ -641,12 +652,14 @@ class MFSimulation(PackageContainer):
         Examples
         --------
         >>> s = flopy.mf6.mfsimulation.load('my simulation')
+        >>> s = flopy.mf6.mfsimulation.load('my simulation', lazy_io=True)
 
         """
         # initialize
         instance = cls(sim_name, version, exe_name, sim_ws, verbosity_level)
         verbosity_level = instance.simulation_data.verbosity_level
         instance.simulation_data.verify_data = verify_data
+        instance.simulation_data.lazy_io = lazy_io
 
         if verbosity_level.value >= VerbosityLevel.normal.value:
             print('loading simulation...')
@@ -1086,7 +1099,7 @@ class MFSimulation(PackageContainer):
 
     def write_simulation(self,
                          ext_file_action=ExtFileAction.copy_relative_paths,
-                         silent=False):
+                         silent=False, only_modified=False, nworkers=None):
         """Write the simulation to files.
 
         Parameters
@@ -1097,36 +1110,32 @@ class MFSimulation(PackageContainer):
                 paths fixed.
             silent : bool
                 writes out the simulation in silent mode (verbosity_level = 0)
+            only_modified : bool
+                only writes packages that changed since they were last loaded
+                or written, or whose files are missing or have moved.  changes
+                made in place to arrays returned by get_data are not detected.
+            nworkers : int
+                number of threads used to write the models.  the packages
+                of a model are written one at a time.  defaults to None,
+                which writes the models one at a time.
 
         """
         saved_verb_lvl = self.simulation_data.verbosity_level
         if silent:
             self.simulation_data.verbosity_level = VerbosityLevel.quiet
 
-        # write simulation name file
+        # write simulation name file, TDIS, ims, and exchange files
         if self.simulation_data.verbosity_level.value >= \
                 VerbosityLevel.normal.value:
             print('writing simulation...')
-            print('  writing simulation name file...')
-        self.name_file.write(ext_file_action=ext_file_action)
-
-        # write TDIS file
-        if self.simulation_data.verbosity_level.value >= \
-                VerbosityLevel.normal.value:
-            print('  writing simulation tdis package...')
-        self._tdis_file.write(ext_file_action=ext_file_action)
-
-        # write ims files
+        write_list = [(self.name_file, '  writing simulation name file...'),
+                      (self._tdis_file,
+                       '  writing simulation tdis package...')]
         for ims_file in self._ims_files.values():
-            if self.simulation_data.verbosity_level.value >= \
-                    VerbosityLevel.normal.value:
-                print('  writing ims package {}...'.format(
-                    ims_file._get_pname()))
-            ims_file.write(ext_file_action=ext_file_action)
-
-        # write exchange files
+            write_list.append((ims_file, '  writing ims package {}...'.format(
+                ims_file._get_pname())))
         for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+            write_list.append((exchange_file, None))
             if hasattr(exchange_file, 'gnc_filerecord') and \
                     exchange_file.gnc_filerecord.has_data():
                 try:
@@ -1139,12 +1148,10 @@ class MFSimulation(PackageContainer):
                                           package=exchange_file._get_pname(),
                                           message=message)
                 if gnc_file in self._ghost_node_files:
-                    if self.simulation_data.verbosity_level.value >= \
-                            VerbosityLevel.normal.value:
-                        print('  writing gnc package {}...'.format(
-                            self._ghost_node_files[gnc_file]._get_pname()))
-                    self._ghost_node_files[gnc_file].write(
-                        ext_file_action=ext_file_action)
+                    gnc_package = self._ghost_node_files[gnc_file]
+                    write_list.append((gnc_package,
+                                       '  writing gnc package {}...'.format(
+                                           gnc_package._get_pname())))
                 else:
                     if self.simulation_data.verbosity_level.value >= \
                             VerbosityLevel.normal.value:
@@ -1164,18 +1171,17 @@ class MFSimulation(PackageContainer):
                                           message=message)
 
                 if mvr_file in self._mover_files:
-                    if self.simulation_data.verbosity_level.value >= \
-                            VerbosityLevel.normal.value:
-                        print('  writing mvr package {}...'.format(
-                            self._mover_files[mvr_file]._get_pname()))
-                    self._mover_files[mvr_file].write(
-                        ext_file_action=ext_file_action)
+                    mvr_package = self._mover_files[mvr_file]
+                    write_list.append((mvr_package,
+                                       '  writing mvr package {}...'.format(
+                                           mvr_package._get_pname())))
                 else:
                     if self.simulation_data.verbosity_level.value >= \
                             VerbosityLevel.normal.value:
                         print('WARNING: Mover file {} not loaded prior to '
                               'writing. File will not be '
                               'written.'.format(mvr_file))
+        _write_packages(write_list, ext_file_action, only_modified, nworkers)
 
         if ext_file_action == ExtFileAction.copy_relative_paths:
             # move external files with relative paths
@@ -1191,27 +1197,41 @@ class MFSimulation(PackageContainer):
             print('INFORMATION: {} external files copied'.format(
                 num_files_copied))
 
-        # write other packages
+        # write other packages and models
+        write_list = []
         for pp in self._other_files.values():
-            if self.simulation_data.verbosity_level.value >= \
-                    VerbosityLevel.normal.value:
-                print('  writing package {}...'.format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            write_list.append((pp, '  writing package {}...'.format(
+                pp._get_pname())))
 
         # FIX: model working folder should be model name file folder
 
-        # write models
         for model in self._models.values():
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('  writing model {}...'.format(model.name))
-            model.write(ext_file_action=ext_file_action)
+            write_list.extend(model._write_list())
+        _write_packages(write_list, ext_file_action, only_modified, nworkers)
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
         if silent:
             self.simulation_data.verbosity_level = saved_verb_lvl
 
+    def set_all_data_external(self, binary=False):
+        """Store the arrays and stress period lists of all models in
+        external files.  The files are written to the simulation path when
+        this is called and are referenced by OPEN/CLOSE the next time the
+        simulation is written.
+
+        Parameters
+            binary : bool
+                write MODFLOW 6 binary files instead of text files.  binary
+                files are much faster to write and read for large grids.
+
+        """
+        for model in self._models.values():
+            model.set_all_data_external(binary)
+
     def set_sim_path(self, path):
         """Return a list of output data keys.
 
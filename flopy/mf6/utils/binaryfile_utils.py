@@ -1,5 +1,8 @@
+import functools
 import os
+import threading
 import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
 from ...utils import binaryfile as bf
 
 
@@ -17,7 +20,7 @@ class MFOutput:
 
     Returns
     -------
-    Xarray of [n,n,n,n] dimension
+    LazyBinaryArray of [n,n,n,n] dimension
 
     Usage:
     -----
@@ -101,12 +104,15 @@ class MFOutputRequester:
         bintype = key[1]
 
         bindata = self._get_binary_file_object(path, bintype, key)
+        opener = functools.partial(self._get_binary_file_object, path,
+                                   bintype, key)
 
         if bintype == 'CBC':
-            return np.array(bindata.get_data(text=key[-1], full3D=True))
+            return LazyBinaryArray.from_budget(bindata, key[-1], full3D=True,
+                                               opener=opener)
 
         else:
-            return np.array(bindata.get_alldata())
+            return LazyBinaryArray.from_layerfile(bindata, opener=opener)
 
     def _querybinarydata_vertices(self, mfdict, key):
         # Basic definition to get output data from binary output files for
@@ -115,19 +121,23 @@ class MFOutputRequester:
         bintype = key[1]
 
         bindata = self._get_binary_file_object(path, bintype, key)
+        opener = functools.partial(self._get_binary_file_object, path,
+                                   bintype, key)
 
         if bintype == 'CBC':
             if key[-1] == 'FLOW-JA-FACE':
-                data = np.array(bindata.get_data(text=key[-1]))
+                data = LazyBinaryArray.from_budget(bindata, key[-1],
+                                                   opener=opener)
                 # todo: uncomment line to remove unnecessary dimensions from
                 # data data.shape = (len(times), -1)
                 return data
 
             else:
-                data = np.array(bindata.get_data(text=key[-1], full3D=True))
+                data = LazyBinaryArray.from_budget(bindata, key[-1],
+                                                   full3D=True, opener=opener)
 
         else:
-            data = np.array(bindata.get_alldata())
+            data = LazyBinaryArray.from_layerfile(bindata, opener=opener)
 
         # todo: uncomment line to remove extra dimensions from data
         # data = _reshape_binary_data(data, 'V')
@@ -139,14 +149,15 @@ class MFOutputRequester:
         bintype = key[1]
 
         bindata = self._get_binary_file_object(path, bintype, key)
+        opener = functools.partial(self._get_binary_file_object, path,
+                                   bintype, key)
 
         if bintype == 'CBC':
-            data = np.array(bindata.get_data(text=key[-1], full3D=True))
+            data = LazyBinaryArray.from_budget(bindata, key[-1], full3D=True,
+                                               flatten=True, opener=opener)
         else:
-            data = bindata.get_alldata()
-
-        # remove un-needed dimensions
-        data = _reshape_binary_data(data, 'U')
+            data = LazyBinaryArray.from_layerfile(bindata, flatten=True,
+                                                  opener=opener)
 
         if key[-1] == "FLOW-JA-FACE":
             return data
@@ -350,6 +361,257 @@ class MFOutputRequester:
         return x
 
 
+class LazyBinaryArray(NDArrayOperatorsMixin):
+    """
+    Array-like view over the records of a binary output file.  The first
+    dimension is the record (time) dimension.  Records are only read from
+    the file when the view is indexed or converted to a numpy array, and
+    only the records selected by the first index are read, so
+    view[:, 0, 1, :] reads every record once while view[-1] reads a single
+    record.  Arithmetic, numpy functions and ndarray methods and
+    attributes, like view.max() or view.reshape(), read all of the records
+    and return the same result as for the numpy array.
+
+    The view keeps the binary file open until close() is called, or until
+    the end of a with block.  The size and modification time of the file
+    are checked before the records are read.  If the file has been
+    rewritten, for example by a new model run, it is reopened with opener
+    and the record index is rebuilt.  Without an opener an IOError is
+    raised instead.
+
+    Parameters
+    ----------
+    get_record: callable returning the numpy array for a zero-based record
+        number
+    nrecords: number of records
+    bindata: binary file object that get_record reads from, closed by
+        close() (default is None)
+    opener: callable returning a new binary file object for the same file
+        (default is None)
+    loader: callable returning get_record and nrecords for a binary file
+        object returned by opener (default is None)
+
+    Examples
+    --------
+    >>> hds = flopy.utils.HeadFile('model.hds', precision='double')
+    >>> with LazyBinaryArray.from_layerfile(hds) as heads:
+    ...     heads.shape
+    ...     heads[-1, 0]
+    ...     heads.max()
+    ...     np.asarray(heads)
+    """
+    def __init__(self, get_record, nrecords, bindata=None, opener=None,
+                 loader=None):
+        self._get_record = get_record
+        self._bindata = bindata
+        self._opener = opener
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._stat = self._file_stat()
+        self._set_shape(nrecords)
+
+    @classmethod
+    def from_layerfile(cls, bindata, nodata=-9999, flatten=False,
+                       opener=None):
+        """
+        View over the times of a HeadFile or UcnFile.  Values equal to
+        nodata are returned as nan, like LayerFile.get_alldata().
+        """
+        def loader(bindata):
+            times = bindata.get_times()
+
+            def get_record(idx):
+                data = np.array(bindata.get_data(totim=times[idx]))
+                data[data == nodata] = np.nan
+                if flatten:
+                    data = data.reshape(-1)
+                return data
+
+            return get_record, len(times)
+
+        get_record, nrecords = loader(bindata)
+        return cls(get_record, nrecords, bindata=bindata, opener=opener,
+                   loader=loader)
+
+    @classmethod
+    def from_budget(cls, bindata, text, full3D=False, flatten=False,
+                    opener=None):
+        """
+        View over the records with text in a CellBudgetFile, like
+        np.array(CellBudgetFile.get_data(text=text, full3D=full3D)).
+        """
+        def loader(bindata):
+            indices = bindata.get_indices(text=text)
+
+            def get_record(idx):
+                data = np.asarray(bindata.get_record(indices[idx],
+                                                     full3D=full3D))
+                if flatten:
+                    data = data.reshape(-1)
+                return data
+
+            return get_record, len(indices)
+
+        get_record, nrecords = loader(bindata)
+        return cls(get_record, nrecords, bindata=bindata, opener=opener,
+                   loader=loader)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Close the binary file.
+        """
+        with self._lock:
+            if self._bindata is not None:
+                self._bindata.close()
+                self._bindata = None
+
+    @property
+    def shape(self):
+        self._refresh()
+        return self._shape
+
+    def _set_shape(self, nrecords):
+        if nrecords > 0:
+            first = self._get_record(0)
+            self._shape = (nrecords,) + first.shape
+            self.dtype = first.dtype
+        else:
+            self._shape = (0,)
+            self.dtype = np.dtype(np.float64)
+
+    def _file_stat(self):
+        # size and modification time of the binary file
+        filename = getattr(self._bindata, 'filename', None)
+        if filename is None:
+            return None
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _refresh(self):
+        # reopen the file and rebuild the record index if the file changed
+        if self._bindata is None:
+            return
+        with self._lock:
+            stat = self._file_stat()
+            if stat == self._stat:
+                return
+            if self._opener is None or self._loader is None:
+                raise IOError('{} has changed since it was opened'.format(
+                    self._bindata.filename))
+            self._bindata.close()
+            self._bindata = self._opener()
+            self._get_record, nrecords = self._loader(self._bindata)
+            self._stat = self._file_stat()
+            self._set_shape(nrecords)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return 'LazyBinaryArray(shape={}, dtype={})'.format(self.shape,
+                                                            self.dtype)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self._read(idx)
+
+    def __array__(self, dtype=None):
+        data = self._read_records(np.arange(len(self)))
+        if dtype is not None:
+            data = data.astype(dtype)
+        return data
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # apply numpy ufuncs and the arithmetic operators to all records
+        inputs = tuple(np.asarray(x) if isinstance(x, LazyBinaryArray)
+                       else x for x in inputs)
+        if 'out' in kwargs:
+            kwargs['out'] = tuple(np.asarray(x)
+                                  if isinstance(x, LazyBinaryArray) else x
+                                  for x in kwargs['out'])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getattr__(self, name):
+        # ndarray methods and attributes, like max(), mean() or reshape(),
+        # are taken from the array of all records
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(np.asarray(self), name)
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            index = (index,)
+        if len(index) == 0:
+            return np.asarray(self)
+        first, rest = index[0], index[1:]
+        irecs = np.arange(len(self))
+
+        if isinstance(first, slice):
+            # read the records in the slice and keep all of them
+            return self._read_records(irecs[first])[(slice(None),) + rest]
+        elif isinstance(first, (int, np.integer)):
+            irec = irecs[first]
+            return self._read_records([irec])[(0,) + rest]
+        elif first is not None and first is not Ellipsis:
+            first = np.asarray(first)
+            if first.dtype == bool and first.ndim == 1:
+                first = np.nonzero(first)[0]
+            if first.dtype != bool:
+                # read each selected record once and index the records read
+                selected = irecs[first]
+                unique, inverse = np.unique(selected, return_inverse=True)
+                inverse = inverse.reshape(selected.shape)
+                return self._read_records(unique)[(inverse,) + rest]
+
+        # Ellipsis, newaxis and multidimensional boolean indexes
+        return np.asarray(self)[index]
+
+    def _read(self, idx):
+        with self._lock:
+            return self._get_record(idx)
+
+    def _read_records(self, irecs):
+        data = np.empty((len(irecs),) + self.shape[1:], dtype=self.dtype)
+        for i, irec in enumerate(irecs):
+            data[i] = self._read(irec)
+        return data
+
+    def to_dask(self):
+        """
+        Return the records as a dask array with one chunk per record.
+        Requires dask.
+        """
+        try:
+            import dask
+            import dask.array as da
+        except ImportError:
+            msg = 'LazyBinaryArray.to_dask(): requires dask'
+            raise ImportError(msg)
+        records = [da.from_delayed(dask.delayed(self._read)(idx),
+                                   shape=self.shape[1:], dtype=self.dtype)
+                   for idx in range(len(self))]
+        if len(records) == 0:
+            return da.from_array(np.asarray(self), chunks=self.shape)
+        return da.stack(records)
+
+
 def _reshape_binary_data(data, dtype=None):
     # removes unnecessary dimensions from data returned by
     # flopy.utils.binaryfile
@@ -5,6 +5,8 @@ mf module.  Contains the ModflowGlobal, ModflowList, and Modflow classes.
 """
 
 import os
+import time
+import threading
 import flopy
 from inspect import getfullargspec
 from ..mbase import BaseModel
@@ -13,6 +15,7 @@ from ..utils import mfreadnam
 from ..discretization.structuredgrid import StructuredGrid
 from ..discretization.grid import Grid
 from flopy.discretization.modeltime import ModelTime
+from ..utils.binaryfile import ensemble_map
 from .mfpar import ModflowPar
 
 
@@ -601,7 +604,8 @@ class Modflow(BaseModel):
 
     @staticmethod
     def load(f, version='mf2005', exe_name='mf2005.exe', verbose=False,
-             model_ws='.', load_only=None, forgive=False, check=True):
+             model_ws='.', load_only=None, forgive=False, check=True,
+             nworkers=None):
         """
         Load an existing MODFLOW model.
 
@@ -629,6 +633,14 @@ class Modflow(BaseModel):
             useful for debugging. Default False.
         check : boolean, optional
             Check model input for common errors. Default True.
+        nworkers : int, optional
+            Number of threads used to load the packages that follow the
+            basic package in the name file. Packages are read concurrently,
+            but are added to the model in name file order, and packages
+            that read from the same data file read it one at a time in name
+            file order, so the model is the same as a model loaded with one
+            thread. Load times are printed if verbose is True. Default None,
+            which loads the packages one at a time.
 
         Returns
         -------
@@ -639,6 +651,7 @@ class Modflow(BaseModel):
 
         >>> import flopy
         >>> ml = flopy.modflow.Modflow.load('model.nam')
+        >>> ml = flopy.modflow.Modflow.load('model.nam', nworkers=4)
 
         """
 
@@ -768,73 +781,32 @@ class Modflow(BaseModel):
             assert ml.pop_key_list.pop() == ext_pkg_d.get('MULT')
 
         # try loading packages in ext_unit_dict
-        for key, item in ext_unit_dict.items():
-            if item.package is not None:
-                if item.filetype in load_only:
-                    package_load_args = getfullargspec(item.package.load)[0]
-                    if forgive:
-                        try:
-                            if "check" in package_load_args:
-                                item.package.load(item.filehandle, ml,
-                                                  ext_unit_dict=ext_unit_dict,
-                                                  check=False)
-                            else:
-                                item.package.load(item.filehandle, ml,
-                                                  ext_unit_dict=ext_unit_dict)
-                            files_successfully_loaded.append(item.filename)
-                            if ml.verbose:
-                                print('   {:4s} package load...success'
-                                      .format(item.filetype))
-                        except Exception as e:
-                            ml.load_fail = True
-                            if ml.verbose:
-                                msg = 3 * ' ' + \
-                                      '{:4s} '.format(item.filetype) + \
-                                      'package load...failed\n' + \
-                                      3 * ' ' + '{!s}'.format(e)
-                                print(msg)
-                            files_not_loaded.append(item.filename)
-                    else:
-                        if "check" in package_load_args:
-                            item.package.load(item.filehandle, ml,
-                                              ext_unit_dict=ext_unit_dict,
-                                              check=False)
-                        else:
-                            item.package.load(item.filehandle, ml,
-                                              ext_unit_dict=ext_unit_dict)
-                        files_successfully_loaded.append(item.filename)
-                        if ml.verbose:
-                            msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
-                                  'package load...success'
-                            print(msg)
-                else:
-                    if ml.verbose:
-                        msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
-                              'package load...skipped'
-                        print(msg)
-                    files_not_loaded.append(item.filename)
-            elif "data" not in item.filetype.lower():
+        items = list(ext_unit_dict.items())
+        if nworkers is None or nworkers <= 1:
+            results = (_load_ext_unit(ml, key, item, load_only,
+                                      ext_unit_dict, forgive)
+                       for key, item in items)
+        else:
+            # bas6 sets the free format flag used by the other packages,
+            # load the entries up to bas6 before the others are loaded on
+            # threads
+            keys = [key for key, item in items]
+            nserial = 0
+            if bas_key in keys:
+                nserial = keys.index(bas_key) + 1
+            results = [_load_ext_unit(ml, key, item, load_only,
+                                      ext_unit_dict, forgive)
+                       for key, item in items[:nserial]]
+            results += _load_ext_units_parallel(ml, items[nserial:],
+                                                load_only, ext_unit_dict,
+                                                forgive, nworkers)
+        for (key, item), (loaded, msg) in zip(items, results):
+            if loaded:
+                files_successfully_loaded.append(item.filename)
+            elif loaded is not None:
                 files_not_loaded.append(item.filename)
-                if ml.verbose:
-                    msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
-                              'package load...skipped'
-                    print(msg)
-            elif "data" in item.filetype.lower():
-                if ml.verbose:
-                    msg = 3 * ' ' + '{:s} '.format(item.filetype) + \
-                          'file load...skipped\n' + 6 * ' ' + \
-                          '{}'.format(os.path.basename(item.filename))
-                    print(msg)
-                if key not in ml.pop_key_list:
-                    # do not add unit number (key) if it already exists
-                    if key not in ml.external_units:
-                        ml.external_fnames.append(item.filename)
-                        ml.external_units.append(key)
-                        ml.external_binflag.append("binary"
-                                                   in item.filetype.lower())
-                        ml.external_output.append(False)
-            else:
-                raise KeyError('unhandled case: {}, {}'.format(key, item))
+            if ml.verbose and msg is not None:
+                print(msg)
 
         # pop binary output keys and any external file units that are now
         # internal
@@ -871,3 +843,198 @@ class Modflow(BaseModel):
 
         # return model object
         return ml
+
+
+def _load_ext_unit(ml, key, item, load_only, ext_unit_dict, forgive):
+    """
+    Load the package for a name file entry, or add the entry to the
+    external files of the model if it is a data file.
+
+    Returns
+    -------
+    loaded : bool or None
+        True if the package was loaded, False if the entry was not loaded,
+        and None for data files.
+    msg : str or None
+        Message to print if the model is verbose.
+
+    """
+    if item.package is not None:
+        if item.filetype in load_only:
+            package_load_args = getfullargspec(item.package.load)[0]
+            t0 = time.time()
+            try:
+                if "check" in package_load_args:
+                    item.package.load(item.filehandle, ml,
+                                      ext_unit_dict=ext_unit_dict,
+                                      check=False)
+                else:
+                    item.package.load(item.filehandle, ml,
+                                      ext_unit_dict=ext_unit_dict)
+            except Exception as e:
+                if not forgive:
+                    raise
+                ml.load_fail = True
+                msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
+                      'package load...failed\n' + \
+                      3 * ' ' + '{!s}'.format(e)
+                return False, msg
+            msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
+                  'package load...success ' + \
+                  '({:.3f} s)'.format(time.time() - t0)
+            return True, msg
+        else:
+            msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
+                  'package load...skipped'
+            return False, msg
+    elif "data" not in item.filetype.lower():
+        msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
+              'package load...skipped'
+        return False, msg
+    elif "data" in item.filetype.lower():
+        msg = 3 * ' ' + '{:s} '.format(item.filetype) + \
+              'file load...skipped\n' + 6 * ' ' + \
+              '{}'.format(os.path.basename(item.filename))
+        if key not in ml.pop_key_list:
+            # do not add unit number (key) if it already exists
+            if key not in ml.external_units:
+                ml.external_fnames.append(item.filename)
+                ml.external_units.append(key)
+                ml.external_binflag.append("binary"
+                                           in item.filetype.lower())
+                ml.external_output.append(False)
+        return None, msg
+    else:
+        raise KeyError('unhandled case: {}, {}'.format(key, item))
+
+
+class _OrderedModelUpdates(object):
+    """
+    Context manager that lets packages be loaded on several threads while
+    the model is updated in name file order.
+
+    The model methods that packages call to register themselves, their
+    output files, and their units are wrapped while the context is active.
+    A thread loading entry i of the name file blocks on its first call to
+    one of these methods until entries 0 to i - 1 have finished loading,
+    so reading and parsing package files runs concurrently and the model
+    lists are built in the same order as a serial load.
+
+    """
+    methods = ('add_package', 'remove_package', 'add_output_file',
+               'add_output', 'remove_output', 'add_external',
+               'remove_external', 'add_pop_key_list', 'next_ext_unit')
+
+    def __init__(self, model):
+        self.model = model
+        self.turn = 0
+        self.condition = threading.Condition()
+        self.local = threading.local()
+
+    def __enter__(self):
+        for name in self.methods:
+            setattr(self.model, name, self._wrap(getattr(self.model, name)))
+        return self
+
+    def __exit__(self, *exc):
+        for name in self.methods:
+            delattr(self.model, name)
+
+    def _wrap(self, method):
+        def wrapper(*args, **kwargs):
+            self.wait()
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    def wait(self):
+        """
+        Block until it is the turn of the entry loaded on this thread.
+
+        """
+        idx = getattr(self.local, 'idx', None)
+        if idx is None:
+            return
+        with self.condition:
+            while self.turn < idx:
+                self.condition.wait()
+
+    def run(self, idx, ordered, func, *args):
+        """
+        Call func(*args) for name file entry idx, then pass the turn to
+        the next entry once all earlier entries have finished. If ordered
+        is True, func is not called until it is the turn of entry idx.
+
+        """
+        self.local.idx = idx
+        try:
+            if ordered:
+                self.wait()
+            return func(*args)
+        finally:
+            self.wait()
+            self.local.idx = None
+            with self.condition:
+                self.turn = idx + 1
+                self.condition.notify_all()
+
+
+class _OrderedNamData(object):
+    """
+    Name file entry of a data file while packages are loaded on threads.
+
+    Packages can read arrays and lists from the same data file (EXTERNAL
+    unit), one after the other. The file handle is only returned to the
+    thread loading entry i of the name file once entries 0 to i - 1 have
+    finished loading, so a data file is read by one package at a time and
+    in the same order as a serial load.
+
+    """
+    def __init__(self, namdata, updates):
+        self._namdata = namdata
+        self._updates = updates
+
+    @property
+    def filehandle(self):
+        self._updates.wait()
+        return self._namdata.filehandle
+
+    def __getattr__(self, name):
+        return getattr(self._namdata, name)
+
+
+def _load_ext_units_parallel(ml, items, load_only, ext_unit_dict, forgive,
+                             nworkers):
+    """
+    Load the name file entries in items on a pool of nworkers threads and
+    return the (loaded, msg) results in name file order. An exception
+    raised by a package load is re-raised once all entries have finished.
+
+    """
+    def load_entry(idx):
+        key, item = items[idx]
+        # data files are added to the model lists directly
+        ordered = item.package is None
+        try:
+            return updates.run(idx, ordered, _load_ext_unit, ml, key, item,
+                               load_only, ext_unit_dict, forgive), None
+        except Exception as e:
+            return None, e
+
+    updates = _OrderedModelUpdates(ml)
+    shared = {key: item for key, item in ext_unit_dict.items()
+              if item.package is None}
+    with updates:
+        for key, item in shared.items():
+            ext_unit_dict[key] = _OrderedNamData(item, updates)
+        try:
+            out = ensemble_map(load_entry, range(len(items)),
+                               nworkers=nworkers, pool='thread')[0]
+        finally:
+            for key, item in shared.items():
+                if key in ext_unit_dict:
+                    ext_unit_dict[key] = item
+    for result, e in out:
+        if e is not None:
+            raise e
+    return [result for result, e in out]
@@ -14,7 +14,6 @@ import webbrowser as wb
 import numpy as np
 from numpy.lib.recfunctions import stack_arrays
 
-from .modflow.mfparbc import ModflowParBc as mfparbc
 from .utils import Util2d, Util3d, Transient2d, MfList, check
 from .utils import OptionBlock
 from .utils.flopy_io import ulstrd
@@ -878,6 +877,7 @@ class Package(PackageInterface):
 
         # read parameter data
         if nppak > 0:
+            from .modflow.mfparbc import ModflowParBc as mfparbc
             dt = pak_type.get_empty(1, aux_names=aux_names,
                                     structured=model.structured).dtype
             pak_parms = mfparbc.load(f, nppak, dt, model, ext_unit_dict,
@@ -9,10 +9,17 @@ important classes that can be accessed by the user.
 
 """
 from __future__ import print_function
+import os
+import json
+import time
+import threading
 import numpy as np
 import warnings
 from collections import OrderedDict
-from ..utils.datafile import Header, LayerFile
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
+from ..utils.datafile import Header, LayerFile, DEFAULT_CHUNK_BYTES, \
+    _iter_chunks, _reduce_records
 
 
 class BinaryHeader(Header):
@@ -143,16 +150,30 @@ def binaryread_struct(file, vartype, shape=(1,), charlen=16):
     return result
 
 
-def binaryread(file, vartype, shape=(1,), charlen=16):
+def binaryread(file, vartype, shape=(1,), charlen=16, memmap=None):
     """
     Uses numpy to read from binary file.  This was found to be faster than the
         struct approach and is used as the default.
 
+        memmap : numpy.memmap
+            optional uint8 memory map of the file.  If provided, the returned
+            array is a zero-copy, read-only view of the memory map starting
+            at the current file position and the file position is advanced
+            past the data.
+
     """
 
     # read a string variable of length charlen
     if vartype == str:
         result = file.read(charlen * 1)
+    elif memmap is not None:
+        nval = int(np.prod(shape))
+        if nval == 1:
+            shape = (1,)
+        ipos = file.tell()
+        result = np.ndarray(shape, dtype=vartype, buffer=memmap,
+                            offset=ipos)
+        file.seek(result.nbytes, 1)
     else:
         # find the number of values
         nval = np.prod(shape)
@@ -249,6 +270,155 @@ def get_headfile_precision(filename):
     return result
 
 
+# version of the layout of the arrays stored in index cache files
+INDEX_CACHE_VERSION = 2
+
+
+def get_index_cache_name(filename):
+    """
+    Get the name of the index cache file for a binary output file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of binary MODFLOW output file.
+
+    Returns
+    -------
+    result : str
+        Name of the index cache file (filename with .fpidx appended).
+
+    """
+    return '{}.fpidx'.format(filename)
+
+
+def _index_cache_key(filename, **kwargs):
+    """
+    Build the key used to determine if an index cache file is current.  The
+    key is a json string containing the size and modification time of the
+    binary file and any additional reader settings in kwargs.
+
+    """
+    st = os.stat(filename)
+    key = {'version': INDEX_CACHE_VERSION, 'filesize': st.st_size,
+           'mtime': st.st_mtime_ns}
+    key.update(kwargs)
+    return json.dumps(key, sort_keys=True)
+
+
+def read_index_cache(filename, **kwargs):
+    """
+    Read the index cache file for a binary output file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of binary MODFLOW output file.
+    **kwargs : dict
+        Reader settings that must match the settings used to write the
+        index cache file.
+
+    Returns
+    -------
+    arrays : dict or None
+        Dictionary of index arrays.  None is returned if the index cache
+        file does not exist, cannot be read, or is out of date.
+
+    """
+    fname = get_index_cache_name(filename)
+    if not os.path.isfile(fname):
+        return None
+    try:
+        key = _index_cache_key(filename, **kwargs)
+        with np.load(fname, allow_pickle=False) as f:
+            if str(f['key']) != key:
+                return None
+            arrays = {name: f[name] for name in f.files if name != 'key'}
+    except Exception:
+        return None
+    return arrays
+
+
+def write_index_cache(filename, arrays, **kwargs):
+    """
+    Write the index cache file for a binary output file.  A warning is
+    issued if the index cache file cannot be written.
+
+    Parameters
+    ----------
+    filename : str
+        Name of binary MODFLOW output file.
+    arrays : dict
+        Dictionary of index arrays to store.
+    **kwargs : dict
+        Reader settings stored in the key of the index cache file.
+
+    """
+    fname = get_index_cache_name(filename)
+    try:
+        key = _index_cache_key(filename, **kwargs)
+        with open(fname, 'wb') as f:
+            np.savez(f, key=np.array(key), **arrays)
+    except (IOError, OSError) as e:
+        msg = 'could not write index cache file {}: {}'.format(fname, e)
+        warnings.warn(msg)
+    return
+
+
+def _follow(refresh, count_records, interval=1., timeout=None):
+    """
+    Generator used by the follow methods of the binary output readers to
+    wait for time steps to be written to a file.
+
+    Parameters
+    ----------
+    refresh : function
+        Function that indexes records added to the file and returns the
+        number of new records.
+    count_records : function
+        Function that returns the number of records indexed for each time
+        step in the file.
+    interval : float
+        Seconds to wait before checking the file for new records.
+    timeout : float
+        Stop waiting if no records are added to the file for timeout
+        seconds.  If None, wait indefinitely.
+
+    Yields
+    ------
+    istep : int
+        Zero-based index of each time step once it is complete.  A time
+        step is complete when a later time step has been written, when it
+        has as many records as the previous time step, or when the file
+        stops growing.
+
+    """
+    istep = 0
+    nprev = None
+    nrecords = count_records()
+    tlast = time.time()
+    while True:
+        while istep < len(nrecords):
+            if istep + 1 == len(nrecords) and \
+                    (nprev is None or nrecords[istep] < nprev):
+                break
+            nprev = nrecords[istep]
+            yield istep
+            istep += 1
+        if refresh() > 0:
+            nrecords = count_records()
+            tlast = time.time()
+        elif timeout is not None and time.time() - tlast >= timeout:
+            break
+        else:
+            time.sleep(interval)
+
+    # the file is no longer being written so the last time step is complete
+    while istep < len(nrecords):
+        yield istep
+        istep += 1
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is the super class from which specific derived
@@ -256,9 +426,15 @@ class BinaryLayerFile(LayerFile):
 
     """
 
-    def __init__(self, filename, precision, verbose, kwargs):
+    def __init__(self, filename, precision, verbose, kwargs, mmap=False,
+                 cache_index=False):
+        self.mmap = mmap
+        self.cache_index = cache_index
+        self._memmap = None
         super(BinaryLayerFile, self).__init__(filename, precision, verbose,
                                               kwargs)
+        if self.mmap:
+            self._memmap = np.memmap(self.filename, dtype=np.uint8, mode='r')
         return
 
     def __enter__(self):
@@ -267,12 +443,68 @@ class BinaryLayerFile(LayerFile):
     def __exit__(self, *exc):
         self.close()
 
+    def close(self):
+        """
+        Close the file handle and release the memory map.
+
+        """
+        self._memmap = None
+        super(BinaryLayerFile, self).close()
+        return
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the specified totim value.
+        If the file is memory mapped and the layer records for totim are
+        stored with a constant stride, a read-only view of the memory map is
+        returned instead of a copy.
+
+        """
+        if self._memmap is not None:
+            keyindices = np.where(self.recordarray['totim'] == totim)[0]
+            data = self._get_memmap_view(keyindices)
+            if data is not None:
+                return data
+        return super(BinaryLayerFile, self)._get_data_array(totim)
+
+    def _get_memmap_view(self, keyindices):
+        """
+        Build a (nlay, nrow, ncol) strided view of the memory map for the
+        records in keyindices.  None is returned if the records do not
+        contain every layer in order or are not evenly spaced in the file.
+
+        """
+        nlay = len(keyindices)
+        if nlay == 0 or nlay != self.nlay:
+            return None
+        headers = self.recordarray[keyindices]
+        if not np.array_equal(headers['ilay'], np.arange(1, nlay + 1)):
+            return None
+        nrow = headers['nrow'][0]
+        ncol = headers['ncol'][0]
+        if np.any(headers['nrow'] != nrow) or np.any(headers['ncol'] != ncol):
+            return None
+        ipos = self.iposarray[keyindices].astype(np.int64)
+        itemsize = self.realtype(1).nbytes
+        if nlay > 1:
+            stride = ipos[1] - ipos[0]
+            if np.any(np.diff(ipos) != stride):
+                return None
+        else:
+            stride = nrow * ncol * itemsize
+        return np.ndarray((nlay, nrow, ncol), dtype=self.realtype,
+                          buffer=self._memmap, offset=int(ipos[0]),
+                          strides=(int(stride), int(ncol * itemsize),
+                                   itemsize))
+
     def _build_index(self):
         """
         Build the recordarray and iposarray, which maps the header information
         to the position in the binary file.
 
         """
+        if self.cache_index and self._read_index_cache():
+            return
         header = self._get_header()
         self.nrow = header['nrow']
         self.ncol = header['ncol']
@@ -282,35 +514,188 @@ class BinaryLayerFile(LayerFile):
             s = 'Possible error. ncol ({}) * nrow ({}) > 10,000,000 '
             s = s.format(self.ncol, self.nrow)
             warnings.warn(s)
+
+        # self.recordarray contains a recordarray of all the headers.
+        self.recordarray = np.array([], dtype=self.header_dtype)
+        self.iposarray = np.array([], dtype=np.int64)
+        self._ipos_end = 0
+        self._index_records()
+        if self.cache_index:
+            self._write_index_cache()
+        return
+
+    def _index_records(self):
+        """
+        Add the records written after the last indexed record to the
+        recordarray and iposarray.  An incomplete record at the end of the
+        file, for example a record that is still being written by a running
+        model, is not indexed.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        """
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        hdrbytes = self.header_dtype.itemsize
+        recordarray = []
+        iposarray = []
+        ipos = self._ipos_end
+        while ipos + hdrbytes <= self.totalbytes:
+            self.file.seek(ipos, 0)
             header = self._get_header()
-            self.recordarray.append(header)
+            ipos_data = ipos + hdrbytes
+            databytes = self.get_databytes(header)
+            if ipos_data + databytes > self.totalbytes:
+                break
+            ipos = ipos_data + databytes
             if self.text.upper() not in header['text']:
                 continue
-            if ipos == 0:
-                self.times.append(header['totim'])
+            totim = header['totim']
+            if len(self.times) == 0 or totim != self.times[-1]:
+                self.times.append(totim)
                 kstpkper = (header['kstp'], header['kper'])
                 self.kstpkper.append(kstpkper)
-            else:
-                totim = header['totim']
-                if totim != self.times[-1]:
-                    self.times.append(totim)
-                    kstpkper = (header['kstp'], header['kper'])
-                    self.kstpkper.append(kstpkper)
-            ipos = self.file.tell()
-            self.iposarray.append(ipos)
-            databytes = self.get_databytes(header)
-            self.file.seek(databytes, 1)
-            ipos = self.file.tell()
+            recordarray.append(header)
+            iposarray.append(ipos_data)
+        self._ipos_end = ipos
+
+        if len(recordarray) > 0:
+            self.recordarray = np.concatenate(
+                (self.recordarray,
+                 np.array(recordarray, dtype=self.header_dtype)))
+            self.iposarray = np.concatenate(
+                (self.iposarray, np.array(iposarray, dtype=np.int64)))
+            self.nlay = np.max(self.recordarray['ilay'])
+        return len(recordarray)
+
+    def refresh(self):
+        """
+        Index the records that have been added to the file since it was
+        opened or last refreshed.  This can be used to read output from a
+        model that is still running.  An incomplete record at the end of the
+        file is not indexed until it has been completely written.
 
-        # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray)
-        self.nlay = np.max(self.recordarray['ilay'])
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> nrecords = hdobj.refresh()
+        >>> times = hdobj.get_times()
+
+        """
+        nrecords = self._index_records()
+        if nrecords > 0:
+            if self._memmap is not None:
+                self._memmap = np.memmap(self.filename, dtype=np.uint8,
+                                         mode='r')
+            if self.cache_index:
+                self._write_index_cache()
+        return nrecords
+
+    def follow(self, interval=1., timeout=None):
+        """
+        Generator that yields the data for each time step in the file and
+        then waits for new time steps to be written to the file.  This can
+        be used to stream output from a model that is still running.
+
+        Parameters
+        ----------
+        interval : float
+            Seconds to wait before checking the file for new records.
+            (default is 1.)
+        timeout : float
+            Stop waiting if no records are added to the file for timeout
+            seconds.  If None, wait indefinitely. (default is None)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period (kstp, kper).
+        totim : float
+            The simulation time.
+        data : numpy array
+            Array of size (nlay, nrow, ncol).
+
+        Notes
+        -----
+        A time step is yielded once a later time step has been written, once
+        it has as many layer records as the previous time step, or once the
+        file stops growing.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> for kstpkper, totim, head in hdobj.follow(timeout=60.):
+        ...     print(kstpkper, head.max())
+
+        """
+
+        def count_records():
+            itim = self._get_record_time_indices(self.times)
+            return np.bincount(itim[itim >= 0], minlength=len(self.times))
+
+        for itim in _follow(self.refresh, count_records, interval=interval,
+                            timeout=timeout):
+            totim = self.times[itim]
+            kstp, kper = self.kstpkper[itim]
+            yield (kstp - 1, kper - 1), totim, self.get_data(totim=totim)
+
+    def _index_cache_settings(self):
+        """
+        Reader settings that must match to reuse an index cache file.
+
+        """
+        return {'class': self.__class__.__name__,
+                'precision': self.precision,
+                'text': self.text.decode()}
+
+    def _read_index_cache(self):
+        """
+        Set the index from the index cache file.  Returns False if the index
+        cache file does not exist or is out of date.
+
+        """
+        arrays = read_index_cache(self.filename,
+                                  **self._index_cache_settings())
+        if arrays is None:
+            return False
+        self.recordarray = arrays['recordarray']
+        self.iposarray = arrays['iposarray']
+        self.times = list(arrays['times'])
+        self.kstpkper = [tuple(kk) for kk in arrays['kstpkper']]
+        self.nrow, self.ncol, self.nlay = arrays['shape']
+        self.totalbytes = int(arrays['totalbytes'])
+        self._ipos_end = int(arrays['ipos_end'])
+        if self.verbose:
+            print('read index from {}'.format(
+                get_index_cache_name(self.filename)))
+        return True
+
+    def _write_index_cache(self):
+        """
+        Write the index to the index cache file.
+
+        """
+        arrays = {'recordarray': self.recordarray,
+                  'iposarray': self.iposarray,
+                  'times': np.array(self.times,
+                                    dtype=self.recordarray['totim'].dtype),
+                  'kstpkper': np.array(self.kstpkper,
+                                       dtype=np.int32).reshape(-1, 2),
+                  'shape': np.array([self.nrow, self.ncol, self.nlay]),
+                  'totalbytes': np.array(self.totalbytes),
+                  'ipos_end': np.array(self._ipos_end)}
+        write_index_cache(self.filename, arrays,
+                          **self._index_cache_settings())
         return
 
     def get_databytes(self, header):
@@ -333,7 +718,7 @@ class BinaryLayerFile(LayerFile):
 
     def _read_data(self, shp):
         return binaryread(self.file, self.realtype,
-                          shape=shp)
+                          shape=shp, memmap=self._memmap)
 
     def _get_header(self):
         """
@@ -379,25 +764,72 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = header[
-                           'ilay'] - 1  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = np.long(self.iposarray[irec])
+        # time index and zero-based layer of each record
+        itim = self._get_record_time_indices(result[:, 0])
+        ilay = self.recordarray['ilay'] - 1
+
+        # read the cells in each layer from every record for that layer
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        itemsize = self.realtype(1).nbytes
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            ioffset = (kij[istat, 1] * self.ncol + kij[istat, 2]) * itemsize
+            irecs = np.where((ilay == k) & (itim >= 0))[0]
+            if irecs.shape[0] == 0:
+                continue
+            ipos = self.iposarray[irecs].astype(np.int64)
+            values = self._read_values(ipos, ioffset)
+            result[itim[irecs][:, None], istat[None, :] + 1] = values
+        return result
+
+    def _read_values(self, ipos, ioffset, chunksize=2 ** 20):
+        """
+        Read the values located ioffset bytes after the start of the data
+        for each record starting at ipos.
 
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + np.long(ioffset), 0)
+        Parameters
+        ----------
+        ipos : numpy array
+            Byte position of the data for each record.
+        ioffset : numpy array
+            Byte offset of each value from the start of the record data.
+        chunksize : int
+            Maximum number of values gathered from the memory map at once.
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header['totim'])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
-        return result
+        Returns
+        -------
+        values : numpy array
+            Array has size (len(ipos), len(ioffset)).
+
+        """
+        itemsize = self.realtype(1).nbytes
+        values = np.empty((ipos.shape[0], ioffset.shape[0]),
+                          dtype=self.realtype)
+        if self._memmap is not None:
+            # gather all of the values with fancy indexing on a view of
+            # the memory map that is aligned with the record data
+            nbytes = self._memmap.shape[0]
+            nrec = max(1, chunksize // ioffset.shape[0])
+            for ialign in np.unique(ipos % itemsize):
+                nval = (nbytes - ialign) // itemsize
+                buf = self._memmap[ialign:ialign + nval * itemsize].view(
+                    self.realtype)
+                irecs = np.where(ipos % itemsize == ialign)[0]
+                for i0 in range(0, irecs.shape[0], nrec):
+                    ir = irecs[i0:i0 + nrec]
+                    ival = (ipos[ir, None] - ialign + ioffset[None, :]) // \
+                           itemsize
+                    values[ir] = buf[ival]
+        else:
+            # read the span of the record containing the values once
+            i0 = ioffset.min()
+            nval = (ioffset.max() - i0) // itemsize + 1
+            ival = (ioffset - i0) // itemsize
+            for irec, ip in enumerate(ipos):
+                self.file.seek(ip + i0, 0)
+                values[irec] = binaryread(self.file, self.realtype,
+                                          shape=(nval,))[ival]
+        return values
 
 
 class HeadFile(BinaryLayerFile):
@@ -414,6 +846,13 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory map the file.  Data are returned as read-only views of the
+        memory map instead of being copied from the file.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename.fpidx) and reuse
+        it when the file is opened again, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -452,7 +891,7 @@ class HeadFile(BinaryLayerFile):
     """
 
     def __init__(self, filename, text='head', precision='auto',
-                 verbose=False, **kwargs):
+                 verbose=False, mmap=False, cache_index=False, **kwargs):
         self.text = text.encode()
         if precision == 'auto':
             precision = get_headfile_precision(filename)
@@ -463,7 +902,8 @@ class HeadFile(BinaryLayerFile):
                 raise Exception()
         self.header_dtype = BinaryHeader.set_dtype(bintype='Head',
                                                    precision=precision)
-        super(HeadFile, self).__init__(filename, precision, verbose, kwargs)
+        super(HeadFile, self).__init__(filename, precision, verbose, kwargs,
+                                       mmap=mmap, cache_index=cache_index)
         return
 
 
@@ -481,6 +921,13 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory map the file.  Data are returned as read-only views of the
+        memory map instead of being copied from the file.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename.fpidx) and reuse
+        it when the file is opened again, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -514,7 +961,7 @@ class UcnFile(BinaryLayerFile):
     """
 
     def __init__(self, filename, text='concentration', precision='auto',
-                 verbose=False, **kwargs):
+                 verbose=False, mmap=False, cache_index=False, **kwargs):
         self.text = text.encode()
         if precision == 'auto':
             precision = get_headfile_precision(filename)
@@ -525,7 +972,8 @@ class UcnFile(BinaryLayerFile):
             raise Exception()
         self.header_dtype = BinaryHeader.set_dtype(bintype='Ucn',
                                                    precision=precision)
-        super(UcnFile, self).__init__(filename, precision, verbose, kwargs)
+        super(UcnFile, self).__init__(filename, precision, verbose, kwargs,
+                                      mmap=mmap, cache_index=cache_index)
         return
 
 
@@ -541,6 +989,14 @@ class CellBudgetFile(object):
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory map the file.  Array and list records are returned as
+        read-only views of the memory map instead of being copied from the
+        file.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename.fpidx) and reuse
+        it when the file is opened again, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -564,10 +1020,14 @@ class CellBudgetFile(object):
 
     """
 
-    def __init__(self, filename, precision='single', verbose=False, **kwargs):
+    def __init__(self, filename, precision='single', verbose=False,
+                 mmap=False, cache_index=False, **kwargs):
         self.filename = filename
         self.precision = precision
         self.verbose = verbose
+        self.mmap = mmap
+        self.cache_index = cache_index
+        self._memmap = None
         self.file = open(self.filename, 'rb')
         # Get filesize to ensure this is not an empty file
         self.file.seek(0, 2)
@@ -630,6 +1090,9 @@ class CellBudgetFile(object):
         # read through the file and build the pointer index
         self._build_index()
 
+        if self.mmap:
+            self._memmap = np.memmap(self.filename, dtype=np.uint8, mode='r')
+
         # allocate the value array
         # self.value = np.empty((self.nlay, self.nrow, self.ncol),
         #                      dtype=self.realtype)
@@ -667,6 +1130,8 @@ class CellBudgetFile(object):
         Build the ordered dictionary, which maps the header information
         to the position in the binary file.
         """
+        if self.cache_index and self._read_index_cache():
+            return
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
@@ -676,15 +1141,68 @@ class CellBudgetFile(object):
             text = text.decode()
         if self.nrow < 0 or self.ncol < 0:
             raise Exception("negative nrow, ncol")
+        self.recorddict = OrderedDict()
+        self.recordarray = np.array([], dtype=self.header_dtype)
+        self.iposheader = np.array([], dtype=np.int64)
+        self.iposarray = np.array([], dtype=np.int64)
+        self._ipos_end = 0
+        self._index_records()
+        if self.cache_index:
+            self._write_index_cache()
+        return
+
+    def _index_records(self):
+        """
+        Add the records written after the last indexed record to the
+        recordarray, iposheader, and iposarray.  An incomplete record at the
+        end of the file, for example a record that is still being written by
+        a running model, is not indexed.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        """
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
-        self.recorddict = OrderedDict()
-        ipos = 0
-        while ipos < self.totalbytes:
-            self.iposheader.append(ipos)
-            header = self._get_header()
-            self.nrecords += 1
+        recordarray = []
+        iposheader = []
+        iposarray = []
+        ipos = self._ipos_end
+        while ipos + self.header1_dtype.itemsize <= self.totalbytes:
+            self.file.seek(ipos, 0)
+            try:
+                header = self._get_header()
+            except (IndexError, ValueError):
+                # incomplete header at the end of the file
+                break
+            ipos_data = self.file.tell()
+
+            if self.verbose:
+                for itxt in ['kstp', 'kper', 'text', 'ncol', 'nrow', 'nlay',
+                             'imeth', 'delt', 'pertim', 'totim', 'modelnam',
+                             'paknam', 'modelnam2', 'paknam2']:
+                    s = header[itxt]
+                    if isinstance(s, bytes):
+                        s = s.decode()
+                    print(itxt + ': ' + str(s))
+                print('file position: ', ipos_data)
+                if int(header['imeth']) != 5 and \
+                        int(header['imeth']) != 6 and \
+                        int(header['imeth']) != 7:
+                    print('')
+
+            # skip over the data to the next record
+            try:
+                self._skip_record(header)
+            except (IndexError, ValueError):
+                # incomplete list header at the end of the file
+                break
+            if self.file.tell() > self.totalbytes:
+                # incomplete data at the end of the file
+                break
+
             totim = header['totim']
             if totim == 0:
                 totim = self._totim_from_kstpkper(
@@ -700,38 +1218,192 @@ class CellBudgetFile(object):
                 self.imethlist.append(header['imeth'])
             if header['paknam'] not in self.paknamlist:
                 self.paknamlist.append(header['paknam'])
-            ipos = self.file.tell()
-
-            if self.verbose:
-                for itxt in ['kstp', 'kper', 'text', 'ncol', 'nrow', 'nlay',
-                             'imeth', 'delt', 'pertim', 'totim', 'modelnam',
-                             'paknam', 'modelnam2', 'paknam2']:
-                    s = header[itxt]
-                    if isinstance(s, bytes):
-                        s = s.decode()
-                    print(itxt + ': ' + str(s))
-                print('file position: ', ipos)
-                if int(header['imeth']) != 5 and \
-                        int(header['imeth']) != 6 and \
-                        int(header['imeth']) != 7:
-                    print('')
 
             # store record and byte position mapping
             self.recorddict[
-                tuple(header)] = ipos  # store the position right after header2
-            self.recordarray.append(header)
-            self.iposarray.append(
-                ipos)  # store the position right after header2
+                tuple(header)] = ipos_data  # position right after header2
+            recordarray.append(header)
+            iposheader.append(ipos)
+            iposarray.append(ipos_data)  # position right after header2
 
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
+            # set ipos to the start of the next record
             ipos = self.file.tell()
+        self._ipos_end = ipos
+
+        # append to numpy arrays
+        if len(recordarray) > 0:
+            self.recordarray = np.concatenate(
+                (self.recordarray,
+                 np.array(recordarray, dtype=self.header_dtype)))
+            self.iposheader = np.concatenate(
+                (self.iposheader, np.array(iposheader, dtype=np.int64)))
+            self.iposarray = np.concatenate(
+                (self.iposarray, np.array(iposarray, dtype=np.int64)))
+            self.nrecords += len(recordarray)
+            self.nper = self.recordarray["kper"].max()
+        return len(recordarray)
+
+    def refresh(self):
+        """
+        Index the records that have been added to the file since it was
+        opened or last refreshed.  This can be used to read output from a
+        model that is still running.  An incomplete record at the end of the
+        file is not indexed until it has been completely written.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> nrecords = cbb.refresh()
+        >>> kstpkper = cbb.get_kstpkper()
+
+        """
+        nrecords = self._index_records()
+        if nrecords > 0:
+            if self._memmap is not None:
+                self._memmap = np.memmap(self.filename, dtype=np.uint8,
+                                         mode='r')
+            if self.cache_index:
+                self._write_index_cache()
+        return nrecords
+
+    def follow(self, text=None, paknam=None, full3D=False, interval=1.,
+               timeout=None):
+        """
+        Generator that yields the records for each time step in the file and
+        then waits for new time steps to be written to the file.  This can
+        be used to stream output from a model that is still running.
 
-        # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  If None,
+            all records are returned. (default is None)
+        paknam : str
+            The package name for the records.  If None, records for all
+            packages are returned. (default is None)
+        full3D : boolean
+            If true, then return list-style records as three dimensional
+            numpy arrays. (default is False)
+        interval : float
+            Seconds to wait before checking the file for new records.
+            (default is 1.)
+        timeout : float
+            Stop waiting if no records are added to the file for timeout
+            seconds.  If None, wait indefinitely. (default is None)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period (kstp, kper).
+        totim : float
+            The simulation time.
+        data : list of records
+            The records for the time step, as returned by get_data().
+
+        Notes
+        -----
+        A time step is yielded once a later time step has been written, once
+        it has as many records as the previous time step, or once the file
+        stops growing.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> for kstpkper, totim, wel in cbb.follow(text='WEL', timeout=60.):
+        ...     print(kstpkper, wel[0]['q'].sum())
+
+        """
+
+        def count_records():
+            # map the kstp and kper of each record to a time step
+            steps = np.array(self.kstpkper, dtype=np.int64).reshape(-1, 2)
+            stepkeys = steps[:, 1] * 2 ** 31 + steps[:, 0]
+            keys = self.recordarray['kper'].astype(np.int64) * 2 ** 31 + \
+                   self.recordarray['kstp']
+            sorter = np.argsort(stepkeys)
+            istep = sorter[np.searchsorted(stepkeys, keys, sorter=sorter)]
+            return np.bincount(istep, minlength=stepkeys.shape[0])
+
+        for istep in _follow(self.refresh, count_records, interval=interval,
+                             timeout=timeout):
+            kstp, kper = self.kstpkper[istep]
+            irecs = np.where((self.recordarray['kstp'] == kstp) &
+                             (self.recordarray['kper'] == kper))[0]
+            totim = self.recordarray['totim'][irecs[0]]
+            kstpkper = (kstp - 1, kper - 1)
+            data = self.get_data(kstpkper=kstpkper, text=text, paknam=paknam,
+                                 full3D=full3D)
+            yield kstpkper, totim, data
+
+    def _index_cache_settings(self):
+        """
+        Reader settings that must match to reuse an index cache file.  Times
+        may be calculated from the discretization, so the cache is only
+        reused if a dis package was (or was not) available in both cases.
+
+        """
+        return {'class': self.__class__.__name__,
+                'precision': self.precision,
+                'dis': self.dis is not None}
+
+    def _read_index_cache(self):
+        """
+        Set the index from the index cache file.  Returns False if the index
+        cache file does not exist or is out of date.
+
+        """
+        arrays = read_index_cache(self.filename,
+                                  **self._index_cache_settings())
+        if arrays is None:
+            return False
+        self.recordarray = arrays['recordarray']
+        self.iposheader = arrays['iposheader']
+        self.iposarray = arrays['iposarray']
+        self.times = list(arrays['times'])
+        self.kstpkper = [tuple(kk) for kk in arrays['kstpkper']]
+        self.textlist = list(arrays['textlist'])
+        self.imethlist = list(arrays['imethlist'])
+        self.paknamlist = list(arrays['paknamlist'])
+        self.nrow, self.ncol, self.nlay = arrays['shape']
+        self.totalbytes = int(arrays['totalbytes'])
+        self._ipos_end = int(arrays['ipos_end'])
+        self.nrecords = self.recordarray.shape[0]
         self.nper = self.recordarray["kper"].max()
+        self.recorddict = OrderedDict()
+        for header, ipos in zip(self.recordarray, self.iposarray):
+            self.recorddict[tuple(header)] = ipos
+        if self.verbose:
+            print('read index from {}'.format(
+                get_index_cache_name(self.filename)))
+        return True
+
+    def _write_index_cache(self):
+        """
+        Write the index to the index cache file.
+
+        """
+        arrays = {'recordarray': self.recordarray,
+                  'iposheader': self.iposheader,
+                  'iposarray': self.iposarray,
+                  'times': np.array(self.times, dtype=self.realtype),
+                  'kstpkper': np.array(self.kstpkper,
+                                       dtype=np.int32).reshape(-1, 2),
+                  'textlist': np.array(self.textlist, dtype='S16'),
+                  'imethlist': np.array(self.imethlist, dtype=np.int32),
+                  'paknamlist': np.array(self.paknamlist, dtype='S16'),
+                  'shape': np.array([self.nrow, self.ncol, self.nlay]),
+                  'totalbytes': np.array(self.totalbytes),
+                  'ipos_end': np.array(self._ipos_end)}
+        write_index_cache(self.filename, arrays,
+                          **self._index_cache_settings())
         return
 
     def _skip_record(self, header):
@@ -1180,6 +1852,9 @@ class CellBudgetFile(object):
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Stations without a flow in a record, like cells that are not in a
+        list record or masked cells, are 0.0.
+
         Examples
         --------
 
@@ -1213,18 +1888,77 @@ class CellBudgetFile(object):
         for idx, t in enumerate(timesint):
             result[idx, 0] = t
 
-        for itim, k in enumerate(kk):
-            v = self.get_data(kstpkper=k, text=text, full3D=True)
-            # skip missing data - required for storage
-            if len(v) > 0:
-                v = v[0]
-                istat = 1
-                for k, i, j in kijlist:
-                    result[itim, istat] = v[k, i, j].copy()
-                    istat += 1
+        # use the first record with text for each time step, time steps
+        # without a record are skipped - required for storage
+        text16 = self._find_text(text)
+        itims = {}
+        for itim, (kstp, kper) in enumerate(kk):
+            itims[(kstp + 1, kper + 1)] = itim
+        records = OrderedDict()
+        for irec in np.where(self.recordarray['text'] == text16)[0]:
+            key = (self.recordarray['kstp'][irec],
+                   self.recordarray['kper'][irec])
+            itim = itims.get(key)
+            if itim is not None and itim not in records:
+                records[itim] = irec
+
+        # read each record once; list records are looked up by node number
+        k, i, j = np.array(kijlist, dtype=np.int64).reshape(-1, 3).T
+        lookups = {}
+        for itim, irec in records.items():
+            header = self.recordarray[irec]
+            if header['imeth'] in (2, 5, 6):
+                shape = (abs(header['nlay']), header['nrow'], header['ncol'])
+                if shape not in lookups:
+                    lookups[shape] = self._build_node_lookup(k, i, j, shape)
+                result[itim, 1:] = self._get_list_ts_values(
+                    self.get_record(irec), *lookups[shape])
+            else:
+                v = self.get_record(irec, full3D=True)[k, i, j]
+                result[itim, 1:] = np.ma.filled(
+                    v.astype(result.dtype, copy=False), 0.)
 
         return result
 
+    @staticmethod
+    def _build_node_lookup(k, i, j, shape):
+        """
+        Build the node to station lookup used by get_ts for list records.
+
+        Returns
+        -------
+        lookup : numpy array
+            Index into unodes for each one-based node number, -1 for nodes
+            that are not a station.
+        unodes : numpy array
+            Unique station node numbers.
+        inverse : numpy array
+            Index into unodes for each station.
+
+        """
+        nlay, nrow, ncol = shape
+        nodes = k * nrow * ncol + i * ncol + j + 1
+        unodes, inverse = np.unique(nodes, return_inverse=True)
+        lookup = np.full(nlay * nrow * ncol + 1, -1, dtype=np.int64)
+        lookup[unodes] = np.arange(unodes.shape[0])
+        return lookup, unodes, inverse
+
+    def _get_list_ts_values(self, data, lookup, unodes, inverse):
+        """
+        Sum the flows of a list record for each station.  Stations that are
+        not in the list are 0.0, like the masked cells of the full3D record.
+
+        """
+        nodes = data['node']
+        valid = (nodes > 0) & (nodes < lookup.shape[0])
+        istat = np.full(nodes.shape, -1, dtype=np.int64)
+        istat[valid] = lookup[nodes[valid]]
+        match = istat >= 0
+        # sum duplicate nodes in record order, like create3D
+        total = np.zeros(unodes.shape, dtype=self.realtype)
+        np.add.at(total, istat[match], data['q'][match])
+        return total[inverse]
+
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
             kijlist = idx
@@ -1265,7 +1999,7 @@ class CellBudgetFile(object):
             result[:, 0] = np.array(self.times)
         return result
 
-    def get_record(self, idx, full3D=False):
+    def get_record(self, idx, full3D=False, out=None):
         """
         Get a single data record from the budget file.
 
@@ -1277,6 +2011,12 @@ class CellBudgetFile(object):
             If true, then return the record as a three dimensional numpy
             array, even for those list-style records written as part of a
             'COMPACT BUDGET' MODFLOW budget file.  (Default is False.)
+        out : numpy masked array
+            Optional masked array of size (nlay, nrow, ncol) that is filled
+            and returned when full3D is True and the record is converted to
+            a three dimensional masked array (list-style and imeth 3
+            records).  Reusing the same array avoids allocating a new array
+            for each record.  (Default is None.)
 
         Returns
         ----------
@@ -1322,14 +2062,14 @@ class CellBudgetFile(object):
                 s += 'an array of shape ' + str((nlay, nrow, ncol))
                 print(s)
             return binaryread(self.file, self.realtype(1),
-                              shape=(nlay, nrow, ncol))
+                              shape=(nlay, nrow, ncol), memmap=self._memmap)
         # imeth 1
         elif imeth == 1:
             if self.verbose:
                 s += 'an array of shape ' + str((nlay, nrow, ncol))
                 print(s)
             return binaryread(self.file, self.realtype(1),
-                              shape=(nlay, nrow, ncol))
+                              shape=(nlay, nrow, ncol), memmap=self._memmap)
 
         # imeth 2
         elif imeth == 2:
@@ -1343,16 +2083,19 @@ class CellBudgetFile(object):
                 else:
                     s += 'a numpy recarray of size (' + str(nlist) + ', 2)'
                 print(s)
-            data = binaryread(self.file, dtype, shape=(nlist,))
+            data = binaryread(self.file, dtype, shape=(nlist,),
+                              memmap=self._memmap)
             if full3D:
-                return self.create3D(data, nlay, nrow, ncol)
+                return self.create3D(data, nlay, nrow, ncol, out=out)
             else:
                 return data.view(np.recarray)
 
         # imeth 3
         elif imeth == 3:
-            ilayer = binaryread(self.file, np.int32, shape=(nrow, ncol))
-            data = binaryread(self.file, self.realtype(1), shape=(nrow, ncol))
+            ilayer = binaryread(self.file, np.int32, shape=(nrow, ncol),
+                                memmap=self._memmap)
+            data = binaryread(self.file, self.realtype(1), shape=(nrow, ncol),
+                              memmap=self._memmap)
             if self.verbose:
                 if full3D:
                     s += 'a numpy masked array of size ({},{},{})'.format(nlay,
@@ -1366,8 +2109,7 @@ class CellBudgetFile(object):
                          str((nrow, ncol))
                 print(s)
             if full3D:
-                out = np.ma.zeros((nlay, nrow, ncol), dtype=np.float32)
-                out.mask = True
+                out = self._init_masked_array(nlay, nrow, ncol, out)
                 vertical_layer = ilayer[0] - 1  # This is always the top layer
                 out[vertical_layer, :, :] = data
                 return out
@@ -1379,7 +2121,8 @@ class CellBudgetFile(object):
             if self.verbose:
                 s += 'a 2d numpy array of size ({},{})'.format(nrow, ncol)
                 print(s)
-            return binaryread(self.file, self.realtype(1), shape=(nrow, ncol))
+            return binaryread(self.file, self.realtype(1), shape=(nrow, ncol),
+                              memmap=self._memmap)
 
         # imeth 5
         elif imeth == 5:
@@ -1393,14 +2136,15 @@ class CellBudgetFile(object):
                 l.append((auxname, self.realtype))
             dtype = np.dtype(l)
             nlist = binaryread(self.file, np.int32)[0]
-            data = binaryread(self.file, dtype, shape=(nlist,))
+            data = binaryread(self.file, dtype, shape=(nlist,),
+                              memmap=self._memmap)
             if full3D:
                 if self.verbose:
                     s += 'a list array of shape ({},{},{})'.format(nlay,
                                                                    nrow,
                                                                    ncol)
                     print(s)
-                return self.create3D(data, nlay, nrow, ncol)
+                return self.create3D(data, nlay, nrow, ncol, out=out)
             else:
                 if self.verbose:
                     s += 'a numpy recarray of size (' + \
@@ -1421,7 +2165,8 @@ class CellBudgetFile(object):
                 l.append((auxname.strip(), self.realtype))
             dtype = np.dtype(l)
             nlist = binaryread(self.file, np.int32)[0]
-            data = binaryread(self.file, dtype, shape=(nlist,))
+            data = binaryread(self.file, dtype, shape=(nlist,),
+                              memmap=self._memmap)
             if self.verbose:
                 if full3D:
                     s += 'full 3D arrays not supported for ' + \
@@ -1439,7 +2184,7 @@ class CellBudgetFile(object):
         # should not reach this point
         return
 
-    def create3D(self, data, nlay, nrow, ncol):
+    def create3D(self, data, nlay, nrow, ncol, out=None):
         """
         Convert a dictionary of {node: q, ...} into a numpy masked array.
         In most cases this should not be called directly by the user unless
@@ -1454,19 +2199,61 @@ class CellBudgetFile(object):
         nlay, nrow, ncol : int
             Number of layers, rows, and columns of the model grid.
 
+        out : numpy masked array
+            Optional masked array of size (nlay, nrow, ncol) to fill and
+            return instead of allocating a new masked array.
+
         Returns
         ----------
         out : numpy masked array
-            List contains unique simulation times (totim) in binary file.
+            Masked array of size (nlay, nrow, ncol) with the sum of the flows
+            for each node.  Nodes without flows are masked.
+
+        """
+        out = self._init_masked_array(nlay, nrow, ncol, out)
+        nnodes = nlay * nrow * ncol
+        node = np.asarray(data['node']) - 1
+        q = np.asarray(data['q'])
+        outdata = out.data.reshape(nnodes)
+        outmask = np.ma.getmaskarray(out).reshape(nnodes)
+
+        # unmask nodes with flows
+        count = np.bincount(node, minlength=nnodes)
+        np.equal(count, 0, out=outmask)
+
+        # scatter the flows, summing the flows for nodes that appear more
+        # than once in the order they are listed
+        dup = count[node] > 1
+        if np.any(dup):
+            unique = ~dup
+            outdata[node[unique]] = q[unique]
+            np.add.at(outdata, node[dup], q[dup])
+        else:
+            outdata[node] = q
+        return out
 
+    def _init_masked_array(self, nlay, nrow, ncol, out=None):
         """
-        out = np.ma.zeros((nlay * nrow * ncol), dtype=np.float32)
-        out.mask = True
-        for [node, q] in zip(data['node'], data['q']):
-            idx = node - 1
-            out.data[idx] += q
-            out.mask[idx] = False
-        return np.ma.reshape(out, (nlay, nrow, ncol))
+        Create or reset a fully masked float32 array of size
+        (nlay, nrow, ncol) that is used to return three dimensional records.
+
+        """
+        shape = (nlay, nrow, ncol)
+        if out is None:
+            out = np.ma.zeros(shape, dtype=np.float32)
+            out.mask = True
+        else:
+            if not isinstance(out, np.ma.MaskedArray) or \
+                    out.shape != shape or not out.flags.c_contiguous:
+                msg = 'out must be a contiguous numpy masked array of ' + \
+                      'shape {}'.format(shape)
+                raise ValueError(msg)
+            if out.mask is np.ma.nomask:
+                out.mask = True
+            else:
+                out.mask[...] = True
+            out.data[...] = 0.
+        return out
 
     def get_times(self):
         """
@@ -1493,11 +2280,142 @@ class CellBudgetFile(object):
         """
         return self.recordarray.shape[0]
 
+    def _get_record_nan(self, idx):
+        """
+        Return a copy of record idx as a three dimensional array with the
+        cells that are not in a list-style record assigned np.nan.
+
+        """
+        data = self.get_record(idx, full3D=True)
+        if isinstance(data, np.ma.MaskedArray):
+            return data.filled(np.nan)
+        return np.array(data, dtype=np.result_type(data, np.float32))
+
+    def _get_reduce_indices(self, text, paknam=None):
+        """
+        Return the indices of the records with text and paknam.
+
+        """
+        select = self.recordarray['text'] == self._find_text(text)
+        if paknam is not None:
+            select &= self.recordarray['paknam'] == self._find_paknam(paknam)
+        return np.where(select)[0]
+
+    def iter_records(self, text, paknam=None,
+                     chunk_bytes=DEFAULT_CHUNK_BYTES):
+        """
+        Iterate over the records for a budget term in chunks of consecutive
+        records.  Only one chunk is held in memory at a time, which allows
+        custom processing of files larger than memory.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        paknam : str
+            The package name for the records.  If None, records for all
+            packages are used. (default is None)
+        chunk_bytes : int
+            Approximate maximum size in bytes of each chunk.  A chunk always
+            contains at least one record. (default is 2**27)
+
+        Returns
+        ----------
+        iterator of (kstpkper, data)
+            kstpkper is a list with the zero-based (kstp, kper) tuple of
+            each record in the chunk and data is an array of size
+            (nrecords, nlay, nrow, ncol).  List-style records are expanded
+            to three dimensions with np.nan for cells that are not in the
+            list.
+
+        See Also
+        --------
+        reduce
+
+        Examples
+        --------
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> for kstpkper, rch in cbb.iter_records('RECHARGE'):
+        ...     print(kstpkper[-1], np.nansum(rch[-1]))
+
+        """
+        indices = self._get_reduce_indices(text, paknam)
+
+        def get_record(i):
+            return self._get_record_nan(indices[i])
+
+        for i0, chunk in _iter_chunks(get_record, indices.shape[0],
+                                      chunk_bytes):
+            rec = self.recordarray[indices[i0:i0 + chunk.shape[0]]]
+            kstpkper = [(kstp - 1, kper - 1) for kstp, kper in
+                        zip(rec['kstp'], rec['kper'])]
+            yield kstpkper, chunk
+
+    def reduce(self, text, func='max', axis='time', paknam=None, q=None,
+               chunk_bytes=DEFAULT_CHUNK_BYTES):
+        """
+        Reduce the records for a budget term over time without loading all
+        of the records into memory at once.  Cells that are not in a
+        list-style record are ignored, so the result is the same as
+        applying the corresponding numpy nan-function along the first axis
+        of the stacked records.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        func : str
+            Reduction to apply: 'max', 'min', 'sum', 'mean' or
+            'percentile'. (default is 'max')
+        axis : str
+            Axis to reduce.  Only 'time' is supported. (default is 'time')
+        paknam : str
+            The package name for the records.  If None, records for all
+            packages are used. (default is None)
+        q : float or sequence of floats
+            Percentile(s) to compute, between 0 and 100.  Required when func
+            is 'percentile'. (default is None)
+        chunk_bytes : int
+            Approximate amount of memory in bytes used for the values of
+            the percentile calculation, which processes the model cells in
+            blocks and reads the records once per block. (default is 2**27)
+
+        Returns
+        ----------
+        data : numpy array
+            Array of size (nlay, nrow, ncol).  For func='percentile' the
+            shape of q is prepended.  Cells without values are np.nan
+            (0. for 'sum').
+
+        See Also
+        --------
+        iter_records
+
+        Examples
+        --------
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> qmax = cbb.reduce('RIVER LEAKAGE', func='max')
+
+        """
+        if axis != 'time':
+            raise ValueError('only axis=\'time\' is supported, not '
+                             '{!r}'.format(axis))
+        indices = self._get_reduce_indices(text, paknam)
+
+        def get_record(i):
+            return self._get_record_nan(indices[i])
+
+        return _reduce_records(get_record, indices.shape[0], func, q=q,
+                               chunk_bytes=chunk_bytes)
+
     def get_residual(self, totim, scaled=False):
         """
         Return an array the size of the model grid containing the flow residual
         calculated from the budget terms.  Residual will not be correct unless
-        all flow terms are written to the budget file.
+        all flow terms are written to the budget file.  The flows of 2D
+        (imeth 4) records are added to layer 1.
 
         Parameters
         ----------
@@ -1507,7 +2425,10 @@ class CellBudgetFile(object):
             method.
 
         scaled : bool
-            If True, then divide the residual by the total cell inflow
+            If True, then divide the residual by the total cell inflow.  The
+            inflow of a cell is the sum of its positive boundary flows, the
+            negative flows across its right, front and lower faces and the
+            positive flows across those faces of the neighbouring cells.
 
         Returns
         -------
@@ -1516,67 +2437,183 @@ class CellBudgetFile(object):
 
         """
 
-        nlay = self.nlay
-        nrow = self.nrow
-        ncol = self.ncol
-        residual = np.zeros((nlay, nrow, ncol), dtype=np.float)
+        shape = (self.nlay, self.nrow, self.ncol)
+        residual = np.zeros(shape, dtype=np.float)
+        inflow = None
         if scaled:
-            inflow = np.zeros((nlay, nrow, ncol), dtype=np.float)
+            inflow = np.zeros(shape, dtype=np.float)
         select_indices = np.where((self.recordarray['totim'] == totim))[0]
 
         for i in select_indices:
-            text = self.recordarray[i]['text'].decode()
-            if self.verbose:
-                print('processing {}'.format(text))
-            flow = self.get_record(idx=i, full3D=True)
-            if ncol > 1 and 'RIGHT FACE' in text:
-                residual -= flow[:, :, :]
-                residual[:, :, 1:] += flow[:, :, :-1]
-                if scaled:
-                    idx = np.where(flow < 0.)
-                    inflow[idx] -= flow[idx]
-                    idx = np.where(flow > 0.)
-                    l, r, c = idx
-                    idx = (l, r, c + 1)
-                    inflow[idx] += flow[idx]
-            elif nrow > 1 and 'FRONT FACE' in text:
-                residual -= flow[:, :, :]
-                residual[:, 1:, :] += flow[:, :-1, :]
-                if scaled:
-                    idx = np.where(flow < 0.)
-                    inflow[idx] -= flow[idx]
-                    idx = np.where(flow > 0.)
-                    l, r, c = idx
-                    idx = (l, r + 1, c)
-                    inflow[idx] += flow[idx]
-            elif nlay > 1 and 'LOWER FACE' in text:
-                residual -= flow[:, :, :]
-                residual[1:, :, :] += flow[:-1, :, :]
-                if scaled:
-                    idx = np.where(flow < 0.)
-                    inflow[idx] -= flow[idx]
-                    idx = np.where(flow > 0.)
-                    l, r, c = idx
-                    idx = (l + 1, r, c)
-                    inflow[idx] += flow[idx]
-            else:
-                residual += flow
-                if scaled:
-                    idx = np.where(flow > 0.)
-                    inflow[idx] += flow[idx]
+            self._add_residual_record(i, residual, inflow)
 
         if scaled:
-            residual_scaled = np.zeros((nlay, nrow, ncol), dtype=np.float)
+            residual_scaled = np.zeros(shape, dtype=np.float)
             idx = (inflow > 0.)
             residual_scaled[idx] = residual[idx] / inflow[idx]
             return residual_scaled
 
         return residual
 
+    def get_residuals(self, scaled=False, filename=None, nworkers=1):
+        """
+        Calculate the flow residual for every time step in the budget file
+        and return summary statistics for each time step.  Each record is
+        read once and the residual arrays are reused between time steps.
+        Residuals will not be correct unless all flow terms are written to
+        the budget file.  The flows of 2D (imeth 4) records are added to
+        layer 1.
+
+        Parameters
+        ----------
+        scaled : bool
+            If True, then the residual arrays saved to filename are divided
+            by the total cell inflow, calculated like get_residual() does.
+            (default is False)
+
+        filename : str
+            If not None, the residual array of each time step is saved to
+            a numpy .npy file of shape (ntimes, nlay, nrow, ncol) that is
+            written through a memory map, so that the residuals of long
+            simulations do not have to fit in memory.  The file can be
+            opened with np.load(filename, mmap_mode='r').
+            (default is None)
+
+        nworkers : int
+            Number of threads used to calculate the residuals.  The records
+            are read by one thread at a time. (default is 1)
+
+        Returns
+        -------
+        residuals : numpy recarray
+            One row per time step in the order of get_kstpkper() with the
+            fields kstp and kper (zero based), totim, max_residual (the
+            residual with the largest magnitude), k, i and j (the zero-based
+            cell of max_residual), max_scaled (the scaled residual with the
+            largest magnitude) and k_scaled, i_scaled and j_scaled.
+
+        See Also
+        --------
+        get_residual
+
+        Examples
+        --------
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> res = cbb.get_residuals(nworkers=4)
+        >>> res[np.argmax(np.abs(res.max_residual))]
+
+        """
+        shape = (self.nlay, self.nrow, self.ncol)
+        kstpkper = [(kstp + 1, kper + 1) for kstp, kper in
+                    self.get_kstpkper()]
+        steps = OrderedDict((kk, []) for kk in kstpkper)
+        for idx, kk in enumerate(zip(self.recordarray['kstp'],
+                                     self.recordarray['kper'])):
+            steps[kk].append(idx)
+
+        dtype = np.dtype([('kstp', np.int32), ('kper', np.int32),
+                          ('totim', np.float64),
+                          ('max_residual', np.float64), ('k', np.int32),
+                          ('i', np.int32), ('j', np.int32),
+                          ('max_scaled', np.float64),
+                          ('k_scaled', np.int32), ('i_scaled', np.int32),
+                          ('j_scaled', np.int32)])
+        result = np.zeros(len(steps), dtype=dtype)
+        saved = None
+        if filename is not None:
+            saved = np.lib.format.open_memmap(filename, mode='w+',
+                                              dtype=np.float64,
+                                              shape=(len(steps),) + shape)
+
+        lock = threading.Lock()
+        buffers = threading.local()
+
+        def process(istep):
+            kk = kstpkper[istep]
+            if not hasattr(buffers, 'residual'):
+                buffers.residual = np.empty(shape, dtype=np.float64)
+                buffers.inflow = np.empty(shape, dtype=np.float64)
+                buffers.scaled = np.empty(shape, dtype=np.float64)
+            residual, inflow = buffers.residual, buffers.inflow
+            residual[:] = 0.
+            inflow[:] = 0.
+            for idx in steps[kk]:
+                with lock:
+                    flow = self.get_record(idx=idx, full3D=True)
+                self._add_residual_record(idx, residual, inflow, flow=flow)
+            residual_scaled = buffers.scaled
+            residual_scaled[:] = 0.
+            np.divide(residual, inflow, out=residual_scaled,
+                      where=inflow > 0.)
+
+            row = result[istep]
+            row['kstp'], row['kper'] = kk[0] - 1, kk[1] - 1
+            row['totim'] = self.recordarray['totim'][steps[kk][0]]
+            imax = np.argmax(np.abs(residual))
+            row['max_residual'] = residual.flat[imax]
+            row['k'], row['i'], row['j'] = np.unravel_index(imax, shape)
+            imax = np.argmax(np.abs(residual_scaled))
+            row['max_scaled'] = residual_scaled.flat[imax]
+            row['k_scaled'], row['i_scaled'], row['j_scaled'] = \
+                np.unravel_index(imax, shape)
+            if saved is not None:
+                saved[istep] = residual_scaled if scaled else residual
+
+        if len(steps) > 0:
+            ensemble_map(process, range(len(steps)), nworkers=nworkers)
+        if saved is not None:
+            saved.flush()
+            del saved
+        return result.view(np.recarray)
+
+    def _add_residual_record(self, idx, residual, inflow=None, flow=None):
+        """
+        Add the flows of record idx to the residual and, if inflow is not
+        None, the inflows of each cell to inflow.  flow can be passed if
+        the record has already been read.
+
+        """
+        nlay, nrow, ncol = residual.shape
+        text = self.recordarray[idx]['text'].decode()
+        if self.verbose:
+            print('processing {}'.format(text))
+        if flow is None:
+            flow = self.get_record(idx=idx, full3D=True)
+        # masked cells of list-style records are 0.
+        flow = np.ma.getdata(flow)
+        if ncol > 1 and 'RIGHT FACE' in text:
+            residual -= flow
+            residual[:, :, 1:] += flow[:, :, :-1]
+            if inflow is not None:
+                inflow -= np.minimum(flow, 0.)
+                inflow[:, :, 1:] += np.maximum(flow[:, :, :-1], 0.)
+        elif nrow > 1 and 'FRONT FACE' in text:
+            residual -= flow
+            residual[:, 1:, :] += flow[:, :-1, :]
+            if inflow is not None:
+                inflow -= np.minimum(flow, 0.)
+                inflow[:, 1:, :] += np.maximum(flow[:, :-1, :], 0.)
+        elif nlay > 1 and 'LOWER FACE' in text:
+            residual -= flow
+            residual[1:, :, :] += flow[:-1, :, :]
+            if inflow is not None:
+                inflow -= np.minimum(flow, 0.)
+                inflow[1:, :, :] += np.maximum(flow[:-1, :, :], 0.)
+        else:
+            if flow.ndim == 2:
+                # 2D records (imeth 4) only hold the flows of layer 1
+                residual = residual[0]
+                if inflow is not None:
+                    inflow = inflow[0]
+            residual += flow
+            if inflow is not None:
+                inflow += np.maximum(flow, 0.)
+
     def close(self):
         """
-        Close the file handle
+        Close the file handle and release the memory map
         """
+        self._memmap = None
         self.file.close()
         return
 
@@ -1595,6 +2632,13 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory map the file.  Data are returned as read-only views of the
+        memory map instead of being copied from the file.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename.fpidx) and reuse
+        it when the file is opened again, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -1637,7 +2681,7 @@ class HeadUFile(BinaryLayerFile):
     """
 
     def __init__(self, filename, text='headu', precision='auto',
-                 verbose=False, **kwargs):
+                 verbose=False, mmap=False, cache_index=False, **kwargs):
         """
         Class constructor
         """
@@ -1651,7 +2695,8 @@ class HeadUFile(BinaryLayerFile):
                 raise Exception()
         self.header_dtype = BinaryHeader.set_dtype(bintype='Head',
                                                    precision=precision)
-        super(HeadUFile, self).__init__(filename, precision, verbose, kwargs)
+        super(HeadUFile, self).__init__(filename, precision, verbose, kwargs,
+                                        mmap=mmap, cache_index=cache_index)
         return
 
     def _get_data_array(self, totim=0.):
@@ -1683,7 +2728,7 @@ class HeadUFile(BinaryLayerFile):
                 print(msg)
             self.file.seek(ipos, 0)
             data[ilay - 1] = binaryread(self.file, self.realtype,
-                                        shape=(npl,))
+                                        shape=(npl,), memmap=self._memmap)
         return data
 
     def get_databytes(self, header):
@@ -1736,3 +2781,179 @@ class HeadUFile(BinaryLayerFile):
         """
         msg = 'HeadUFile: get_ts() is not implemented'
         raise NotImplementedError(msg)
+
+
+def _timed_call(args):
+    """
+    Call func(item) and return the result with the elapsed seconds.  This
+    is a module-level function so that it can be used with a process pool.
+
+    """
+    func, item = args
+    t0 = time.time()
+    result = func(item)
+    return result, time.time() - t0
+
+
+def ensemble_map(func, items, nworkers=1, pool='thread'):
+    """
+    Apply func to each item using a pool of workers and time each call.
+
+    Parameters
+    ----------
+    func : callable
+        Function that takes a single item.  func must be a module-level
+        function if pool is 'process'.
+    items : sequence
+        Items (for example file names) to process.
+    nworkers : int
+        Number of workers.  If 1, the items are processed serially.  If
+        None, the number of processors is used (limited to the number of
+        items). (default is 1)
+    pool : str
+        'thread' to use a thread pool or 'process' to use a process pool.
+        Threads work well for binary output files, because most of the
+        time is spent reading files and in numpy. (default is 'thread')
+
+    Returns
+    -------
+    results : list
+        The result of func for each item, in the order of items.
+    timing : numpy array
+        The seconds spent processing each item.
+
+    """
+    items = list(items)
+    if nworkers is None:
+        nworkers = cpu_count()
+    nworkers = max(1, min(int(nworkers), len(items)))
+    args = [(func, item) for item in items]
+    if nworkers == 1:
+        out = [_timed_call(arg) for arg in args]
+    else:
+        if pool == 'thread':
+            workers = ThreadPool(nworkers)
+        elif pool == 'process':
+            workers = Pool(nworkers)
+        else:
+            raise ValueError("pool must be 'thread' or 'process', not "
+                             "{!r}".format(pool))
+        try:
+            out = workers.map(_timed_call, args)
+        finally:
+            workers.close()
+            workers.join()
+    results = [result for result, elapsed in out]
+    timing = np.array([elapsed for result, elapsed in out], dtype=float)
+    return results, timing
+
+
+def _read_ensemble_member(args):
+    """
+    Read the selected cells and times from one ensemble output file.
+
+    """
+    reader, filename, kijlist, kstpkper, text, kwargs = args
+    obj = reader(filename, **kwargs)
+    try:
+        if kstpkper is None:
+            if text is None:
+                data = obj.get_ts(kijlist)
+            else:
+                data = obj.get_ts(kijlist, text=text)
+            return np.array(data[:, 1:])
+
+        k, i, j = np.array(kijlist, dtype=int).T
+        data = np.zeros((len(kstpkper), len(kijlist)), dtype=float)
+        for itim, kk in enumerate(kstpkper):
+            if text is None:
+                v = obj.get_data(kstpkper=kk)
+            else:
+                # skip missing data - required for storage
+                v = obj.get_data(kstpkper=kk, text=text, full3D=True)
+                if len(v) == 0:
+                    continue
+                v = np.ma.filled(v[0], 0.)
+            data[itim] = v[k, i, j]
+        return data
+    finally:
+        obj.close()
+
+
+def read_ensemble(filenames, idx, kstpkper=None, text=None, reader=None,
+                  nworkers=None, pool='thread', verbose=False, **kwargs):
+    """
+    Read the same cells and times from the output files of an ensemble of
+    model realizations using a pool of workers.
+
+    Parameters
+    ----------
+    filenames : list of str
+        The output file for each realization.
+    idx : tuple of ints, or a list of a tuple of ints
+        idx can be (layer, row, column) or it can be a list in the form
+        [(layer, row, column), (layer, row, column), ...].  The layer,
+        row, and column values must be zero based.
+    kstpkper : list of tuples of ints
+        The zero-based (kstp, kper) of the times to read.  If None, all of
+        the times in each file are read. (default is None)
+    text : str
+        The text identifier for the records in a budget file.  Examples
+        include 'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        Required if reader is CellBudgetFile. (default is None)
+    reader : class
+        The reader for the files, for example HeadFile, UcnFile or
+        CellBudgetFile.  If None, HeadFile is used, or CellBudgetFile if
+        text is specified. (default is None)
+    nworkers : int
+        Number of workers.  If None, the number of processors is used.
+        If 1, the files are read serially. (default is None)
+    pool : str
+        'thread' or 'process'. (default is 'thread')
+    verbose : bool
+        Print the time spent reading each file. (default is False)
+    **kwargs : keyword arguments
+        Passed to the reader, for example precision='double'.
+
+    Returns
+    -------
+    data : numpy array
+        Array of size (nreal, ntimes, ncells).  Budget values for cells
+        that are not in a list-style record are 0.
+    timing : numpy array
+        The seconds spent reading each file.
+
+    Examples
+    --------
+    >>> import flopy
+    >>> fnames = ['model_{}.hds'.format(i) for i in range(500)]
+    >>> heads, timing = flopy.utils.binaryfile.read_ensemble(
+    ...     fnames, [(0, 10, 10), (1, 20, 5)], nworkers=8)
+    >>> heads.mean(axis=0)
+
+    """
+    if reader is None:
+        reader = HeadFile if text is None else CellBudgetFile
+    if issubclass(reader, CellBudgetFile) and text is None:
+        raise ValueError('text must be specified to read budget files')
+    if isinstance(idx, tuple):
+        idx = [idx]
+    kijlist = [tuple(int(v) for v in kij) for kij in idx]
+    if kstpkper is not None:
+        kstpkper = [tuple(kk) for kk in kstpkper]
+
+    args = [(reader, filename, kijlist, kstpkper, text, kwargs)
+            for filename in filenames]
+    results, timing = ensemble_map(_read_ensemble_member, args,
+                                   nworkers=nworkers, pool=pool)
+    if verbose:
+        for filename, elapsed in zip(filenames, timing):
+            print('read {} in {:.3f} seconds'.format(filename, elapsed))
+
+    for filename, data in zip(filenames, results):
+        if data.shape != results[0].shape:
+            raise ValueError('{} has {} times, {} has {} '
+                             'times'.format(filename, data.shape[0],
+                                            filenames[0],
+                                            results[0].shape[0]))
+    return np.array(results), timing
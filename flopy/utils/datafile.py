@@ -4,9 +4,96 @@ abstract classes that should not be directly accessed.
 
 """
 from __future__ import print_function
+import warnings
 import numpy as np
 import flopy.utils
-from ..discretization.structuredgrid import StructuredGrid
+
+REDUCE_FUNCS = ('max', 'min', 'sum', 'mean', 'percentile')
+DEFAULT_CHUNK_BYTES = 2 ** 27
+
+
+def _iter_chunks(get_record, nrecords, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Group the records returned by get_record(0..nrecords-1) into arrays
+    with a leading record dimension that are no larger than chunk_bytes
+    (a chunk always holds at least one record).
+
+    """
+    i0 = 0
+    while i0 < nrecords:
+        a = get_record(i0)
+        nchunk = max(1, int(chunk_bytes // max(a.nbytes, 1)))
+        nchunk = min(nchunk, nrecords - i0)
+        chunk = np.empty((nchunk,) + a.shape, dtype=a.dtype)
+        chunk[0] = a
+        for j in range(1, nchunk):
+            chunk[j] = get_record(i0 + j)
+        yield i0, chunk
+        i0 += nchunk
+
+
+def _reduce_records(get_record, nrecords, func, q=None,
+                    chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Reduce the records returned by get_record(0..nrecords-1) along the
+    record (time) axis without stacking all of them in memory.  Missing
+    values must be returned as np.nan; the results match the numpy
+    nan-functions (np.nanmax, np.nanmin, np.nansum, np.nanmean and
+    np.nanpercentile) applied to the stacked records.
+
+    """
+    if func not in REDUCE_FUNCS:
+        raise ValueError('func must be one of {}, not '
+                         '{!r}'.format(', '.join(REDUCE_FUNCS), func))
+    if nrecords < 1:
+        raise ValueError('there are no records to reduce')
+
+    if func == 'percentile':
+        if q is None:
+            raise ValueError('q must be specified when func is percentile')
+        # exact percentiles need every value of a cell at once, so process
+        # blocks of cells whose complete time series fit in chunk_bytes
+        a = get_record(0)
+        shape, ncells = a.shape, a.size
+        q = np.asarray(q, dtype=np.float64)
+        nblock = max(1, int(chunk_bytes // (nrecords * a.dtype.itemsize)))
+        result = np.empty(q.shape + (ncells,), dtype=np.float64)
+        block = None
+        for c0 in range(0, ncells, nblock):
+            c1 = min(c0 + nblock, ncells)
+            if block is None or block.shape[1] != c1 - c0:
+                block = np.empty((nrecords, c1 - c0), dtype=a.dtype)
+            for i in range(nrecords):
+                if i > 0 or c0 > 0:
+                    a = get_record(i)
+                block[i] = a.reshape(-1)[c0:c1]
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                result[..., c0:c1] = np.nanpercentile(block, q, axis=0)
+        return result.reshape(q.shape + shape)
+
+    a = get_record(0)
+    if func in ('max', 'min'):
+        fn = np.fmax if func == 'max' else np.fmin
+        result = np.array(a, copy=True)
+        for i in range(1, nrecords):
+            fn(result, get_record(i), out=result)
+        return result
+
+    total = np.zeros(a.shape, dtype=np.float64)
+    count = np.zeros(a.shape, dtype=np.int64)
+    for i in range(nrecords):
+        if i > 0:
+            a = get_record(i)
+        valid = ~np.isnan(a)
+        total[valid] += a[valid]
+        count += valid
+    if func == 'sum':
+        return total
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = total / count
+    result[count == 0] = np.nan
+    return result
 
 
 class Header(object):
@@ -158,6 +245,7 @@ class LayerFile(object):
         # now that we read the data and know nrow and ncol,
         # we can make a generic sr if needed
         if self.mg is None:
+            from ..discretization.structuredgrid import StructuredGrid
             self.mg = StructuredGrid(delc=np.ones((self.nrow,)),
                                      delr=np.ones(self.ncol, ),
                                      xoff=0.0, yoff=0.0,
@@ -501,6 +589,135 @@ class LayerFile(object):
         rv[rv == nodata] = np.nan
         return rv
 
+    def _get_record_nan(self, idx, mflay=None, nodata=-9999):
+        """
+        Return a copy of the data for the idx-th time with nodata values
+        replaced by np.nan.
+
+        """
+        data = self.get_data(totim=self.times[idx], mflay=mflay)
+        data = np.array(data, dtype=np.result_type(data, np.float32))
+        data[data == nodata] = np.nan
+        return data
+
+    def iter_records(self, mflay=None, nodata=-9999,
+                     chunk_bytes=DEFAULT_CHUNK_BYTES):
+        """
+        Iterate over the data in the file in chunks of consecutive times.
+        Unlike get_alldata(), only one chunk is held in memory at a time,
+        which allows custom processing of files larger than memory.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.
+
+        chunk_bytes : int
+            Approximate maximum size in bytes of each chunk.  A chunk always
+            contains at least one time. (Default is 2**27.)
+
+        Returns
+        ----------
+        iterator of (times, data)
+            times is a numpy array with the simulation times in the chunk
+            and data is an array of size (ntimes, nlay, nrow, ncol) if mflay
+            is None or (ntimes, nrow, ncol) if mflay is specified.
+
+        See Also
+        --------
+        reduce
+
+        Notes
+        -----
+
+        Examples
+        --------
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> for times, heads in hdobj.iter_records(chunk_bytes=2**24):
+        ...     print(times[-1], np.nanmax(heads))
+
+        """
+        times = np.array(self.times)
+
+        def get_record(idx):
+            return self._get_record_nan(idx, mflay, nodata)
+
+        for i0, chunk in _iter_chunks(get_record, len(times), chunk_bytes):
+            yield times[i0:i0 + chunk.shape[0]], chunk
+
+    def reduce(self, func='max', axis='time', mflay=None, q=None,
+               nodata=-9999, chunk_bytes=DEFAULT_CHUNK_BYTES):
+        """
+        Reduce the data in the file over time without loading all of the
+        times into memory at once.  Values equal to nodata are ignored,
+        so the result is the same as applying the corresponding numpy
+        nan-function along axis 0 of get_alldata().
+
+        Parameters
+        ----------
+        func : str
+            Reduction to apply: 'max', 'min', 'sum', 'mean' or
+            'percentile'. (Default is 'max'.)
+
+        axis : str
+            Axis to reduce.  Only 'time' is supported. (Default is 'time'.)
+
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        q : float or sequence of floats
+            Percentile(s) to compute, between 0 and 100.  Required when func
+            is 'percentile'. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  Array values equal to
+           nodata are ignored. (Default is -9999.)
+
+        chunk_bytes : int
+            Approximate amount of memory in bytes used for the values of
+            the percentile calculation, which processes the model cells in
+            blocks and reads the file once per block. The other reductions
+            only hold a few arrays of the size of one time.
+            (Default is 2**27.)
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (nlay, nrow, ncol) if mflay is None or it has size
+            (nrow, ncol) if mflay is specified.  For func='percentile' the
+            shape of q is prepended.  Cells without valid values are np.nan
+            (0. for 'sum').
+
+        See Also
+        --------
+        iter_records
+
+        Notes
+        -----
+
+        Examples
+        --------
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> hmax = hdobj.reduce('max')
+        >>> p10, p90 = hdobj.reduce('percentile', q=[10, 90], mflay=0)
+
+        """
+        if axis != 'time':
+            raise ValueError('only axis=\'time\' is supported, not '
+                             '{!r}'.format(axis))
+
+        def get_record(idx):
+            return self._get_record_nan(idx, mflay, nodata)
+
+        return _reduce_records(get_record, len(self.times), func, q=q,
+                               chunk_bytes=chunk_bytes)
+
     def _read_data(self, shp):
         """
         Read data from file
@@ -541,6 +758,25 @@ class LayerFile(object):
         elif isinstance(idx, tuple):
             return 1
 
+    def _get_record_time_indices(self, times):
+        """
+        Get the zero-based position in times of the totim value of each
+        record in the file.  Records with a totim value that is not in times
+        are assigned a position of -1.
+
+        """
+        times = np.asarray(times)
+        totim = self.recordarray['totim'].astype(times.dtype)
+        itim = np.full(totim.shape, -1, dtype=np.int64)
+        if times.shape[0] == 0:
+            return itim
+        sorter = np.argsort(times, kind='mergesort')
+        ipos = np.searchsorted(times, totim, sorter=sorter)
+        ipos = sorter[np.minimum(ipos, times.shape[0] - 1)]
+        found = times[ipos] == totim
+        itim[found] = ipos[found]
+        return itim
+
     def _init_result(self, nstation):
         # Initialize result array and put times in first column
         result = np.empty((len(self.times), nstation + 1),
@@ -3,6 +3,7 @@ Module for input/output utilities
 """
 import os
 import sys
+import warnings
 import numpy as np
 
 try:
@@ -344,6 +345,72 @@ def get_url_text(url, error_msg=None):
         return
 
 
+def _parse_list_line(line, ncol, free):
+    """
+    Parse a single list line into a tuple that can be assigned to a row
+    of a record array. Short free format lines are padded with zeros and
+    blank fixed format fields are set to zero.
+
+    """
+    if free:
+        # whitespace separated
+        t = line.strip().split()
+        if len(t) < ncol:
+            t = t + (ncol - len(t)) * [0.0]
+        else:
+            t = t[:ncol]
+    else:
+        # fixed format
+        t = read_fixed_var(line, ncol=ncol)
+    return tuple(t)
+
+
+def _fill_list_columns(ra, lines, free, length=10):
+    """
+    Fill a record array from a block of list lines.
+
+    Free format lines are parsed in a single call to np.loadtxt, which
+    raises if a line is short, blank, or has a token that does not convert
+    exactly to its column type. Fixed format lines are cut into fields
+    column by column and each column is converted with np.fromiter, which
+    applies the same conversion as assigning a row tuple. Callers should
+    fall back to parsing row by row if an exception is raised.
+
+    Parameters
+    ----------
+    ra : np.recarray
+        record array with one row per line
+    lines : list of str
+        list lines to parse
+    free : bool
+        whitespace separated (True) or fixed format (False) lines
+    length : int
+        field width for fixed format lines (default is 10)
+
+    """
+    nlist = len(lines)
+    names = ra.dtype.names
+    if free:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            d = np.loadtxt(lines, dtype=ra.dtype, comments=None,
+                           usecols=range(len(names)), ndmin=1)
+        # blank lines are skipped by loadtxt
+        if d.shape[0] != nlist:
+            raise ValueError('could not read {} list lines'.format(nlist))
+        for name in names:
+            ra[name] = d[name]
+    else:
+        lines = [line.rstrip() for line in lines]
+        for icol, name in enumerate(names):
+            istart = icol * length
+            istop = istart + length
+            col = [line[istart:istop] for line in lines]
+            col = [txt if len(txt.strip()) > 0 else 0 for txt in col]
+            ra[name] = np.fromiter(col, dtype=ra.dtype[name], count=nlist)
+    return
+
+
 def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     """
     Read a list and allow for open/close, binary, external, sfac, etc.
@@ -442,26 +509,19 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     # else, read ascii
     else:
 
-        for ii in range(nlist):
-
-            # first line was already read
-            if ii != 0:
-                line = file_handle.readline()
-
-            if model.free_format_input:
-                # whitespace separated
-                t = line.strip().split()
-                if len(t) < ncol:
-                    t = t + (ncol - len(t)) * [0.0]
-                else:
-                    t = t[:ncol]
-                t = tuple(t)
-                ra[ii] = t
-            else:
-                # fixed format
-                t = read_fixed_var(line, ncol=ncol)
-                t = tuple(t)
-                ra[ii] = t
+        # first line was already read, read the rest of the block at once
+        lines = [line]
+        for ii in range(1, nlist):
+            lines.append(file_handle.readline())
+
+        try:
+            _fill_list_columns(ra, lines[:nlist], model.free_format_input)
+        except Exception:
+            # short or blank rows, or a bad value: parse row by row so rows
+            # are padded and errors are raised for the offending row
+            for ii in range(nlist):
+                ra[ii] = _parse_list_line(lines[ii], ncol,
+                                          model.free_format_input)
 
     # scale the data and check
     for column_name in sfac_columns:
@@ -266,24 +266,36 @@ class FormattedLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset_col = (i * self._col_data_size)
-            for irec, header in enumerate(self.recordarray):
-                # change ilay from header to zero-based
-                ilay = header['ilay'] - 1
-                if ilay != k:
-                    continue
-                ipos = self.iposarray[irec]
-
-                # Calculate offset necessary to reach intended column
-                self.file.seek(ipos + ioffset_col, 0)
-
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header['totim'])[0]
-                result[itim, istat] = self._read_val(j)
-            istat += 1
+        # time index and zero-based layer of each record
+        itim = self._get_record_time_indices(result[:, 0])
+        ilay = self.recordarray['ilay'] - 1
+
+        # read the rows containing the cells in each layer once from every
+        # record for that layer
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            rows = kij[istat, 1]
+            cols = kij[istat, 2]
+            i0 = rows.min()
+            nrows = rows.max() - i0 + 1
+            irecs = np.where((ilay == k) & (itim >= 0))[0]
+            for irec in irecs:
+                self.file.seek(self.iposarray[irec] + i0 * self._col_data_size,
+                               0)
+                block = self.file.read(nrows * self._col_data_size)
+                try:
+                    values = np.array(block.split()[:nrows * self.ncol],
+                                      dtype=np.float64)
+                except ValueError:
+                    raise Exception(
+                        'Invalid data encountered while reading data file.' +
+                        ' Unable to convert data to float.')
+                if values.shape[0] < nrows * self.ncol:
+                    raise Exception(
+                        'Unexpected end of file while reading data.')
+                values = values.reshape(nrows, self.ncol)
+                result[itim[irec], istat + 1] = values[rows - i0, cols]
         return result
 
     def close(self):
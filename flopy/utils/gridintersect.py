@@ -23,8 +23,9 @@ class GridIntersect:
        intersect routines (for individual shapes) should be pretty fast.
      - The optimized routines for structured grids will generally outperform
        the shapely routines because of the reduced overhead of building and
-       parsing the queried STR-tree. For Polygons, shapely is sometimes faster
-       than the optimized structured routines.
+       parsing the queried STR-tree. Polygons are rasterized on structured
+       grids, only the cells on the boundary of a polygon are intersected
+       with shapely. Use rasterize_polygon() to get only the areas.
      - The STR-tree query is based on the bounding box of the shape, if the
        bounding box of the shape covers nearly the entire grid, the query
        won't be able to limit the search space much resulting in slower
@@ -79,6 +80,218 @@ class GridIntersect:
             raise NotImplementedError(
                 "Method 'structured' only works for structured grids.")
 
+    def intersect_shapes(self, shapes, keepzerolengths=False,
+                         chunksize=1000, processes=None):
+        """
+        Intersect a collection of shapes with the grid in one call
+
+        Parameters
+        ----------
+        shapes : list, GeoDataFrame or str
+            sequence of shapely shapes (all Points, all LineStrings or all
+            Polygons, or their Multi variants), a geopandas GeoDataFrame or
+            the name of a shapefile.  The shape_id of a shape is its
+            position in the sequence or the shapefile, or its index in the
+            GeoDataFrame.
+        keepzerolengths : bool, optional
+            if True keep the cells that linestrings touch but do not cross,
+            by default False
+        chunksize : int, optional
+            number of shapes that are intersected together, by default 1000
+        processes : int, optional
+            number of processes that intersect chunks of shapes in
+            parallel, by default None (intersect all shapes in this process)
+
+        Returns
+        -------
+        numpy.recarray
+            a record array with the shape_id, the cellids, the vertices,
+            the areas (polygons) or lengths (linestrings) and the ixshapes
+            of every intersection, sorted by shape and cell
+
+        """
+        shape_ids, shapes = self._parse_shapes(shapes)
+        geom_types = set([shp.geom_type.replace("Multi", "")
+                          for shp in shapes])
+        if len(geom_types) > 1:
+            raise ValueError("intersect_shapes(): all shapes must be "
+                             "Points, LineStrings or Polygons, not "
+                             "{}".format(", ".join(sorted(geom_types))))
+        geom_type = geom_types.pop() if geom_types else "Polygon"
+        if geom_type == "Point":
+            return self._intersect_points_bulk(shape_ids, shapes)
+        elif geom_type == "LineString":
+            measure = "lengths"
+        elif geom_type == "Polygon":
+            measure = "areas"
+        else:
+            raise NotImplementedError(
+                "intersect_shapes(): {} shapes".format(geom_type))
+
+        # candidate cells of all shapes from their bounding boxes
+        bounds = np.array([shp.bounds for shp in shapes],
+                          dtype=float).reshape(-1, 4)
+        ishape, icell = self.mfgrid._query_extents(bounds[:, [0, 2, 1, 3]])
+        xring, yring = self.mfgrid._cell_rings()
+        cellareas = np.ravel(self.mfgrid.areas)
+
+        # intersect the shapes with their candidate cells in chunks
+        chunks = []
+        offsets = []
+        splits = np.searchsorted(ishape, np.arange(0, len(shapes) + chunksize,
+                                                   chunksize))
+        for istart, iend in zip(splits[:-1], splits[1:]):
+            if istart == iend:
+                continue
+            offsets.append(ishape[istart])
+            cells = icell[istart:iend]
+            chunks.append((geom_type, [shapes[i] for i in
+                                       range(ishape[istart],
+                                             ishape[iend - 1] + 1)],
+                           ishape[istart:iend] - ishape[istart], cells,
+                           xring[cells], yring[cells], cellareas[cells],
+                           keepzerolengths))
+        if processes is not None and len(chunks) > 1:
+            from multiprocessing import Pool
+            pool = Pool(processes)
+            try:
+                results = pool.map(_intersect_shapes_chunk, chunks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_intersect_shapes_chunk(chunk) for chunk in chunks]
+
+        ishp, cellids, vertices, measures, ixshapes = [], [], [], [], []
+        for offset, result in zip(offsets, results):
+            ishp.append(result[0] + offset)
+            cellids.append(result[1])
+            vertices += result[2]
+            measures.append(result[3])
+            ixshapes += result[4]
+        ishp = np.concatenate(ishp) if ishp else np.zeros(0, dtype=int)
+        cellids = np.concatenate(cellids) if cellids else \
+            np.zeros(0, dtype=int)
+
+        rec = np.recarray(len(ishp),
+                          names=["shape_id", "cellids", "vertices", measure,
+                                 "ixshapes"],
+                          formats=["O", "O", "O", "f8", "O"])
+        rec.shape_id = [shape_ids[i] for i in ishp]
+        rec.cellids = self._cellids_from_nodes(cellids)
+        rec.vertices = vertices
+        if measures:
+            rec[measure] = np.concatenate(measures)
+        rec.ixshapes = ixshapes
+        return rec
+
+    @staticmethod
+    def _parse_shapes(shapes):
+        """
+        internal method, get the ids and shapely shapes from a sequence of
+        shapes, a GeoDataFrame or a shapefile
+
+        Returns
+        -------
+        shape_ids, shapes : list
+            list of the shape ids and list of the shapely shapes
+
+        """
+        from shapely.geometry import shape
+
+        if isinstance(shapes, str):
+            from ..export.shapefile_utils import import_shapefile
+            sf = import_shapefile()
+            reader = sf.Reader(shapes)
+            shapes = [shape(s.__geo_interface__)
+                      for s in reader.iterShapes()]
+            return list(range(len(shapes))), shapes
+        elif hasattr(shapes, "geometry") and hasattr(shapes, "index"):
+            # geopandas GeoDataFrame or GeoSeries
+            return list(shapes.index), list(shapes.geometry)
+        shapes = [shp if hasattr(shp, "geom_type") else shape(shp)
+                  for shp in shapes]
+        return list(range(len(shapes))), shapes
+
+    def _cellids_from_nodes(self, nodes):
+        """
+        internal method, convert cell numbers in a layer to cellids,
+        (row, column) tuples for structured grids
+
+        Returns
+        -------
+        list
+            list of cellids
+
+        """
+        if self.mfgrid.grid_type == "structured":
+            ncol = self.mfgrid.ncol
+            return [(int(n) // ncol, int(n) % ncol) for n in nodes]
+        return [int(n) for n in nodes]
+
+    def _intersect_points_bulk(self, shape_ids, shapes):
+        """
+        internal method, intersect a sequence of Points or MultiPoints with
+        the grid using the vectorized grid intersect method
+
+        Returns
+        -------
+        numpy.recarray
+            a record array containing information about the intersection
+
+        """
+        if shapely is None:
+            msg = 'GridIntersect()._intersect_points_bulk(): error ' + \
+                  'importing shapely - try "pip install shapely"'
+            raise ImportError(msg)
+        else:
+            from shapely.geometry import Point, MultiPoint
+
+        ishape, x, y = [], [], []
+        for i, shp in enumerate(shapes):
+            points = shp.geoms if shp.geom_type == "MultiPoint" else [shp]
+            for p in points:
+                ishape.append(i)
+                x.append(p.x)
+                y.append(p.y)
+        ishape = np.array(ishape, dtype=int)
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        icell = self.mfgrid._intersect_cells(x, y)
+
+        # points in a cell of the same shape are combined
+        inside = icell >= 0
+        ishape, icell = ishape[inside], icell[inside]
+        x, y = x[inside], y[inside]
+        order = np.lexsort((icell, ishape))
+        ishape, icell, x, y = ishape[order], icell[order], x[order], \
+            y[order]
+        first = np.ones(ishape.shape[0], dtype=bool)
+        first[1:] = (ishape[1:] != ishape[:-1]) | (icell[1:] != icell[:-1])
+        starts = np.nonzero(first)[0]
+        ends = np.append(starts[1:], ishape.shape[0])
+
+        vertices = []
+        ixshapes = []
+        for istart, iend in zip(starts, ends):
+            pts = list(zip(x[istart:iend], y[istart:iend]))
+            if len(pts) == 1:
+                vertices.append(pts[0])
+                ixshapes.append(Point(pts[0]))
+            else:
+                vertices.append(tuple(pts))
+                ixshapes.append(MultiPoint(pts))
+
+        rec = np.recarray(len(starts),
+                          names=["shape_id", "cellids", "vertices",
+                                 "ixshapes"],
+                          formats=["O", "O", "O", "O"])
+        rec.shape_id = [shape_ids[i] for i in ishape[starts]]
+        rec.cellids = self._cellids_from_nodes(icell[starts])
+        rec.vertices = vertices
+        rec.ixshapes = ixshapes
+        return rec
+
     def _rect_grid_to_shape_list(self):
         """
         internal method, convert structured grid to list of shapely polygons
@@ -912,6 +1125,112 @@ class GridIntersect:
 
         return node, length, verts, ixshape
 
+    def rasterize_polygon(self, shp, fractions=False):
+        """
+        Compute the exact area of a polygon in every cell of a structured
+        grid.  The polygon is rasterized with a scanline algorithm in numpy
+        and does not need shapely intersections with the individual cells.
+
+        Parameters
+        ----------
+        shp : shapely.geometry.Polygon or MultiPolygon
+            polygon to rasterize, any object with a __geo_interface__ of
+            a Polygon or MultiPolygon is accepted
+        fractions : bool, optional
+            if True return the fraction of the cell area that is covered
+            by the polygon instead of the area, by default False
+
+        Returns
+        -------
+        numpy.ndarray
+            array of shape (nrow, ncol) with the area (or fraction) of
+            each cell covered by the polygon
+
+        """
+        if self.mfgrid.grid_type != "structured":
+            raise NotImplementedError(
+                "rasterize_polygon() only works for structured grids.")
+        nrow, ncol = self.mfgrid.nrow, self.mfgrid.ncol
+        result = np.zeros((nrow, ncol), dtype=float)
+        window = self._rasterize_polygon_window(shp)
+        if window is not None:
+            i0, j0, areas = window
+            result[i0:i0 + areas.shape[0], j0:j0 + areas.shape[1]] = areas
+        if fractions:
+            result /= np.outer(self.mfgrid.delc, self.mfgrid.delr)
+        return result
+
+    def _rasterize_polygon_window(self, shp):
+        """
+        Rasterize a polygon on the part of a structured grid that is
+        covered by the bounding box of the polygon.
+
+        Parameters
+        ----------
+        shp : shapely.geometry.Polygon or MultiPolygon
+            polygon to rasterize
+
+        Returns
+        -------
+        tuple or None
+            row and column of the upper left cell of the window and the
+            area of the polygon in every cell of the window, None if the
+            polygon does not overlap the grid
+
+        """
+        rings = _polygon_rings(shp)
+        if len(rings) == 0:
+            return None
+        # transform the rings to local grid coordinates
+        if (self.mfgrid.angrot != 0. or self.mfgrid.xoffset != 0.
+                or self.mfgrid.yoffset != 0.):
+            rings = [(np.column_stack(
+                transform(ring[:, 0], ring[:, 1], self.mfgrid.xoffset,
+                          self.mfgrid.yoffset, self.mfgrid.angrot_radians,
+                          inverse=True)), exterior)
+                     for ring, exterior in rings]
+        xy = np.concatenate([ring for ring, _ in rings])
+        rectangle = (xy.min(axis=0), xy.max(axis=0))
+        irange = self._rectangle_index_range(rectangle)
+        if irange is None:
+            return None
+        imin, imax, jmin, jmax = irange
+        Xe, Ye = self.mfgrid.xyedges
+        areas = _rasterize_rings(rings, Xe[jmin:jmax + 2],
+                                 Ye[imin:imax + 2])
+        return imin, jmin, areas
+
+    def _rectangle_index_range(self, rectangle):
+        """
+        Get the range of rows and columns of a structured grid covered by
+        a rectangle in local coordinates.
+
+        Parameters
+        ----------
+        rectangle : list of tuples
+            list of lower-left coordinate and upper-right
+            coordinate: [(xmin, ymin), (xmax, ymax)]
+
+        Returns
+        -------
+        tuple or None
+            first and last row and first and last column, None if the
+            rectangle does not overlap the grid
+
+        """
+        Xe, Ye = self.mfgrid.xyedges
+        (rxmin, rymin), (rxmax, rymax) = rectangle
+        if rxmax <= Xe[0] or rxmin >= Xe[-1] or rymax <= Ye[-1] or \
+                rymin >= Ye[0]:
+            return None
+        ncol, nrow = len(Xe) - 1, len(Ye) - 1
+        jmin = max(np.searchsorted(Xe, rxmin, side="right") - 1, 0)
+        jmax = min(np.searchsorted(Xe, rxmax, side="left"), ncol) - 1
+        # the y edges decrease with the row number
+        imin = max(np.searchsorted(-Ye, -rymax, side="right") - 1, 0)
+        imax = min(np.searchsorted(-Ye, -rymin, side="left"), nrow) - 1
+        return imin, imax, jmin, jmax
+
     def _intersect_rectangle_structured(self, rectangle):
         """
         intersect a rectangle with a structured grid to retrieve
@@ -933,65 +1252,13 @@ class GridIntersect:
             the rectangle intersects
 
         """
-        if shapely is None:
-            msg = 'GridIntersect()._intersect_rectangle_structured(): ' + \
-                  'error importing shapely - try "pip install shapely"'
-            raise ImportError(msg)
-        else:
-            from shapely.geometry import box
-
-        nodelist = []
-
-        # return if rectangle does not contain any cells
-        if (self.mfgrid.angrot != 0. or self.mfgrid.xoffset != 0.
-                or self.mfgrid.yoffset != 0.):
-            minx = np.min(self.mfgrid.xyedges[0])
-            maxx = np.max(self.mfgrid.xyedges[0])
-            miny = np.min(self.mfgrid.xyedges[1])
-            maxy = np.max(self.mfgrid.xyedges[1])
-            local_extent = [minx, maxx, miny, maxy]
-        else:
-            local_extent = self.mfgrid.extent
-
-        xmin, xmax, ymin, ymax = local_extent
-        bgrid = box(xmin, ymin, xmax, ymax)
-        (rxmin, rymin), (rxmax, rymax) = rectangle
-        b = box(rxmin, rymin, rxmax, rymax)
-
-        if not b.intersects(bgrid):
+        irange = self._rectangle_index_range(rectangle)
+        if irange is None:
             # return with nodelist as an empty list
             return []
+        imin, imax, jmin, jmax = irange
 
-        Xe, Ye = self.mfgrid.xyedges
-
-        jmin = ModflowGridIndices.find_position_in_array(Xe, xmin)
-        if jmin is None:
-            if xmin <= Xe[0]:
-                jmin = 0
-            elif xmin >= Xe[-1]:
-                jmin = self.mfgrid.ncol - 1
-
-        jmax = ModflowGridIndices.find_position_in_array(Xe, xmax)
-        if jmax is None:
-            if xmax <= Xe[0]:
-                jmax = 0
-            elif xmax >= Xe[-1]:
-                jmax = self.mfgrid.ncol - 1
-
-        imin = ModflowGridIndices.find_position_in_array(Ye, ymax)
-        if imin is None:
-            if ymax >= Ye[0]:
-                imin = 0
-            elif ymax <= Ye[-1]:
-                imin = self.mfgrid.nrow - 1
-
-        imax = ModflowGridIndices.find_position_in_array(Ye, ymin)
-        if imax is None:
-            if ymin >= Ye[0]:
-                imax = 0
-            elif ymin <= Ye[-1]:
-                imax = self.mfgrid.nrow - 1
-
+        nodelist = []
         for i in range(imin, imax + 1):
             for j in range(jmin, jmax + 1):
                 nodelist.append((i, j))
@@ -1000,8 +1267,10 @@ class GridIntersect:
 
     def _intersect_polygon_structured(self, shp):
         """
-        intersect polygon with a structured grid. Uses
-        bounding box of the Polygon to limit search space.
+        intersect polygon with a structured grid. The areas are computed
+        by rasterizing the polygon on the grid, only the cells on the
+        boundary of the polygon are intersected with shapely to get the
+        shape of the intersection.
 
         Parameters
         ----------
@@ -1020,7 +1289,6 @@ class GridIntersect:
             raise ImportError(msg)
         else:
             from shapely.geometry import Polygon
-            from shapely.affinity import translate, rotate
 
         # initialize the result lists
         nodelist = []
@@ -1028,62 +1296,34 @@ class GridIntersect:
         vertices = []
         ixshapes = []
 
-        # transform polygon to local grid coordinates
-        if (self.mfgrid.xoffset != 0. or self.mfgrid.yoffset != 0.):
-            shp = translate(shp, xoff=-self.mfgrid.xoffset,
-                            yoff=-self.mfgrid.yoffset)
-        if self.mfgrid.angrot != 0.:
-            shp = rotate(shp, -self.mfgrid.angrot, origin=(0., 0.))
-
-        # use the bounds of the polygon to restrict the cell search
-        minx, miny, maxx, maxy = shp.bounds
-        rectangle = ((minx, miny), (maxx, maxy))
-        nodes = self._intersect_rectangle_structured(rectangle)
-
-        for (i, j) in nodes:
-            if (self.mfgrid.angrot != 0. or self.mfgrid.xoffset != 0.
-                    or self.mfgrid.yoffset != 0.):
-                cell_coords = [(self.mfgrid.xyedges[0][j],
-                                self.mfgrid.xyedges[1][i]),
-                               (self.mfgrid.xyedges[0][j + 1],
-                                self.mfgrid.xyedges[1][i]),
-                               (self.mfgrid.xyedges[0][j + 1],
-                                self.mfgrid.xyedges[1][i + 1]),
-                               (self.mfgrid.xyedges[0][j],
-                                self.mfgrid.xyedges[1][i + 1])]
-            else:
-                cell_coords = self.mfgrid.get_cell_vertices(i, j)
-            node_polygon = Polygon(cell_coords)
-            if shp.intersects(node_polygon):
-                intersect = shp.intersection(node_polygon)
-                if intersect.area > 0.:
-                    nodelist.append((i, j))
-                    areas.append(intersect.area)
-
-                    # if necessary, transform coordinates back to real
-                    # world coordinates
-                    if (self.mfgrid.angrot != 0. or self.mfgrid.xoffset != 0.
-                            or self.mfgrid.yoffset != 0.):
-                        v_realworld = []
-                        for pt in intersect.__geo_interface__["coordinates"]:
-                            rx, ry = transform([pt[0]], [pt[1]],
-                                               self.mfgrid.xoffset,
-                                               self.mfgrid.yoffset,
-                                               self.mfgrid.angrot_radians,
-                                               inverse=False)
-                            v_realworld.append([rx, ry])
-                        intersect_realworld = rotate(intersect,
-                                                     self.mfgrid.angrot,
-                                                     origin=(0., 0.))
-                        intersect_realworld = translate(intersect_realworld,
-                                                        self.mfgrid.xoffset,
-                                                        self.mfgrid.yoffset)
-                    else:
-                        v_realworld = intersect.__geo_interface__[
-                            "coordinates"]
-                        intersect_realworld = intersect
-                    ixshapes.append(intersect_realworld)
-                    vertices.append(v_realworld)
+        window = self._rasterize_polygon_window(shp)
+        if window is not None:
+            i0, j0, cellareas = window
+            nrow, ncol = cellareas.shape
+            Xe, Ye = self.mfgrid.xyedges
+            fullareas = np.outer(Ye[i0:i0 + nrow] - Ye[i0 + 1:i0 + nrow + 1],
+                                 Xe[j0 + 1:j0 + ncol + 1] - Xe[j0:j0 + ncol])
+            # drop the round off of the accumulation along the columns
+            tol = 1e-10 * fullareas
+            xring, yring = self.mfgrid._cell_rings()
+            for ii, jj in zip(*np.nonzero(cellareas > tol)):
+                i, j = i0 + ii, j0 + jj
+                node = i * self.mfgrid.ncol + j
+                ring = tuple(zip(xring[node].tolist(), yring[node].tolist()))
+                if cellareas[ii, jj] >= fullareas[ii, jj] - tol[ii, jj]:
+                    # cells inside of the polygon do not need an
+                    # intersection
+                    intersect = Polygon(ring)
+                    area = fullareas[ii, jj]
+                    v_realworld = (ring,)
+                else:
+                    intersect = shp.intersection(Polygon(ring))
+                    area = cellareas[ii, jj]
+                    v_realworld = intersect.__geo_interface__["coordinates"]
+                nodelist.append((i, j))
+                areas.append(area)
+                ixshapes.append(intersect)
+                vertices.append(v_realworld)
 
         rec = np.recarray(len(nodelist),
                           names=["cellids", "vertices", "areas", "ixshapes"],
@@ -1219,6 +1459,227 @@ class GridIntersect:
         return ax
 
 
+def _intersect_shapes_chunk(args):
+    """
+    Intersect a chunk of shapes with their candidate cells.  A module level
+    function so that chunks can be intersected by a pool of processes.
+
+    Parameters
+    ----------
+    args : tuple
+        geometry type ("LineString" or "Polygon"), list of shapes, number
+        of the shape and of the cell of every candidate, cell vertex rings
+        and cell areas of the candidates and keepzerolengths
+
+    Returns
+    -------
+    tuple
+        number of the shape, cell number, vertices, area or length and
+        the intersection shape of every intersection
+
+    """
+    from shapely.geometry import Polygon
+    from shapely.ops import unary_union
+    from shapely.prepared import prep
+
+    geom_type, shapes, ishape, icell, xring, yring, cellareas, \
+        keepzerolengths = args
+    ishp, cellids, vertices, measures, ixshapes = [], [], [], [], []
+    istart = 0
+    for i, shp in enumerate(shapes):
+        iend = istart
+        while iend < ishape.shape[0] and ishape[iend] == i:
+            iend += 1
+        prepared = prep(shp)
+        shapevertices = set()
+        for icand in range(istart, iend):
+            # remove the padding of the cell ring
+            xr, yr = xring[icand], yring[icand]
+            nvert = xr.shape[0]
+            while nvert > 1 and xr[nvert - 1] == xr[0] and \
+                    yr[nvert - 1] == yr[0]:
+                nvert -= 1
+            cell = Polygon(list(zip(xr[:nvert], yr[:nvert])))
+            if not prepared.intersects(cell):
+                continue
+            if geom_type == "Polygon":
+                if prepared.contains(cell):
+                    # cells inside of the polygon do not need an
+                    # intersection
+                    intersect = cell
+                    measure = cellareas[icand]
+                else:
+                    intersect = shp.intersection(cell)
+                    if intersect.geom_type == "GeometryCollection":
+                        intersect = unary_union(
+                            [geom for geom in intersect.geoms
+                             if "Polygon" in geom.geom_type])
+                    measure = intersect.area
+                    if measure == 0.:
+                        continue
+            else:
+                intersect = shp.intersection(cell)
+                if intersect.geom_type == "GeometryCollection":
+                    lines = [geom for geom in intersect.geoms
+                             if "LineString" in geom.geom_type]
+                    if lines or not keepzerolengths:
+                        intersect = unary_union(lines)
+                measure = intersect.length
+                if intersect.is_empty or (measure == 0. and
+                                          not keepzerolengths):
+                    continue
+            verts = intersect.__geo_interface__.get("coordinates")
+            if geom_type == "LineString":
+                # a line on the shared face of two cells is in the cell
+                # with the lowest cell number
+                key = repr(verts)
+                if key in shapevertices:
+                    continue
+                shapevertices.add(key)
+            ishp.append(i)
+            cellids.append(icell[icand])
+            vertices.append(verts)
+            measures.append(measure)
+            ixshapes.append(intersect)
+        istart = iend
+    return np.array(ishp, dtype=int), np.array(cellids, dtype=int), \
+        vertices, np.array(measures, dtype=float), ixshapes
+
+
+def _polygon_rings(shp):
+    """
+    Get the rings of a polygon or multipolygon.
+
+    Parameters
+    ----------
+    shp : shapely.geometry.Polygon or MultiPolygon
+        polygon, or any object with a __geo_interface__ of a (Multi)Polygon
+        or a GeometryCollection of polygons
+
+    Returns
+    -------
+    list of tuples
+        (n, 2) array of the coordinates and True for an exterior ring or
+        False for a hole, for every ring
+
+    """
+    geo = shp if isinstance(shp, dict) else shp.__geo_interface__
+    if geo["type"] == "GeometryCollection":
+        return [ring for geom in geo["geometries"]
+                for ring in _polygon_rings(geom)]
+    elif geo["type"] == "Polygon":
+        polygons = [geo["coordinates"]]
+    elif geo["type"] == "MultiPolygon":
+        polygons = geo["coordinates"]
+    else:
+        return []
+    rings = []
+    for polygon in polygons:
+        for iring, ring in enumerate(polygon):
+            ring = np.array(ring, dtype=float)[:, :2]
+            if ring.shape[0] > 2:
+                rings.append((ring, iring == 0))
+    return rings
+
+
+def _rasterize_rings(rings, xedges, yedges):
+    """
+    Compute the exact area of a polygon in every cell of a rectilinear
+    grid.  The area below every polygon edge (the integral of y over x)
+    is split over the columns and rows the edge crosses.  An edge piece
+    adds its partial area to the cell that contains it and its full
+    width to all cells below it, which is accumulated along the columns
+    of the grid.
+
+    Parameters
+    ----------
+    rings : list of tuples
+        (n, 2) array of the coordinates and True for an exterior ring or
+        False for a hole, for every ring of the polygon
+    xedges : numpy.ndarray
+        increasing x coordinates of the column edges
+    yedges : numpy.ndarray
+        decreasing y coordinates of the row edges
+
+    Returns
+    -------
+    numpy.ndarray
+        array of shape (nrow, ncol) with the area of the polygon in each
+        cell
+
+    """
+    nrow, ncol = len(yedges) - 1, len(xedges) - 1
+    x0, y0, x1, y1, sign = [], [], [], [], []
+    for ring, exterior in rings:
+        if ring[0, 0] != ring[-1, 0] or ring[0, 1] != ring[-1, 1]:
+            ring = np.vstack((ring, ring[:1]))
+        x, y = ring[:, 0], ring[:, 1]
+        # orient exterior rings counterclockwise and holes clockwise
+        ringarea = np.sum(x[:-1] * y[1:] - x[1:] * y[:-1])
+        if ringarea == 0.:
+            continue
+        x0.append(x[:-1])
+        y0.append(y[:-1])
+        x1.append(x[1:])
+        y1.append(y[1:])
+        orientation = 1. if ringarea > 0. else -1.
+        sign.append(np.full(x.shape[0] - 1,
+                            orientation if exterior else -orientation))
+    if not sign:
+        return np.zeros((nrow, ncol), dtype=float)
+    x0, y0, x1, y1, sign = [np.concatenate(a) for a in
+                            (x0, y0, x1, y1, sign)]
+    # vertical edges do not add area
+    idx = x0 != x1
+    x0, y0, x1, y1, sign = x0[idx], y0[idx], x1[idx], y1[idx], sign[idx]
+    nedge = x0.shape[0]
+
+    # split the edges where they cross column and row edges
+    edges = [np.arange(nedge), np.arange(nedge)]
+    params = [np.zeros(nedge), np.ones(nedge)]
+    for a0, a1, lines in ((x0, x1, xedges), (y0, y1, yedges[::-1])):
+        lo = np.searchsorted(lines, np.minimum(a0, a1), side="right")
+        hi = np.searchsorted(lines, np.maximum(a0, a1), side="left")
+        counts = np.maximum(hi - lo, 0)
+        iedge = np.repeat(np.arange(nedge), counts)
+        iline = np.arange(counts.sum()) - \
+            np.repeat(np.cumsum(counts) - counts - lo, counts)
+        edges.append(iedge)
+        params.append((lines[iline] - a0[iedge]) / (a1[iedge] - a0[iedge]))
+    edges = np.concatenate(edges)
+    params = np.concatenate(params)
+    order = np.lexsort((params, edges))
+    edges, params = edges[order], params[order]
+
+    # pieces of the edges between successive crossings
+    idx = edges[:-1] == edges[1:]
+    iedge = edges[:-1][idx]
+    t0, t1 = params[:-1][idx], params[1:][idx]
+    dx = x1[iedge] - x0[iedge]
+    dy = y1[iedge] - y0[iedge]
+    tm = 0.5 * (t0 + t1)
+    xm = x0[iedge] + tm * dx
+    ym = y0[iedge] + tm * dy
+    width = -sign[iedge] * (t1 - t0) * dx
+
+    # locate the pieces in the grid, pieces above the grid cover the
+    # whole column and pieces left, right or below the grid are dropped
+    j = np.searchsorted(xedges, xm, side="right") - 1
+    i = np.searchsorted(-yedges, -ym, side="left") - 1
+    idx = (j >= 0) & (j < ncol) & (i < nrow) & (width != 0.)
+    i, j, ym, width = i[idx], j[idx], ym[idx], width[idx]
+    inside = i >= 0
+
+    partial = np.bincount(
+        i[inside] * ncol + j[inside],
+        weights=width[inside] * (ym[inside] - yedges[i[inside] + 1]),
+        minlength=nrow * ncol).reshape(nrow, ncol)
+    below = np.bincount((i + 1) * ncol + j, weights=width,
+                        minlength=(nrow + 1) * ncol).reshape(nrow + 1, ncol)
+    full = np.cumsum(below, axis=0)[:nrow]
+    return partial + full * (yedges[:-1] - yedges[1:])[:, np.newaxis]
+
+
 class ModflowGridIndices:
     """
     Collection of methods that can be used to find cell indices for a
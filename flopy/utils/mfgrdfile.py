@@ -9,9 +9,6 @@ import numpy as np
 import collections
 
 from flopy.utils.utils_def import FlopyBinaryData
-from flopy.discretization.structuredgrid import StructuredGrid
-from flopy.discretization.vertexgrid import VertexGrid
-from flopy.discretization.unstructuredgrid import UnstructuredGrid
 from flopy.utils.reference import SpatialReferenceUnstructured
 from flopy.utils.reference import SpatialReference
 import warnings
@@ -188,6 +185,10 @@ class MfGrdFile(FlopyBinaryData):
         -------
         mg : ModelGrid
         """
+        from ..discretization.structuredgrid import StructuredGrid
+        from ..discretization.vertexgrid import VertexGrid
+        from ..discretization.unstructuredgrid import UnstructuredGrid
+
         mg = None
         idomain = None
         xorigin = None
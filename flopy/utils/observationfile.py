@@ -1,3 +1,4 @@
+import time
 import numpy as np
 
 from ..utils.utils_def import FlopyBinaryData
@@ -272,6 +273,7 @@ class Mf6Obs(ObsFiles):
         super(Mf6Obs, self).__init__()
         # initialize class information
         self.verbose = verbose
+        self.isBinary = isBinary
         if isBinary:
             # --open binary head file
             self.file = open(filename, 'rb')
@@ -304,8 +306,10 @@ class Mf6Obs(ObsFiles):
             # build index
             self._build_index()
 
-            self.data = None
-            self._read_data()
+            # read the complete records after the header
+            self.data = np.array([], dtype=self.dtype)
+            self._ipos_end = self.file.tell()
+            self.refresh()
         else:
             # --open binary head file
             self.file = open(filename, 'r')
@@ -331,9 +335,92 @@ class Mf6Obs(ObsFiles):
             self._build_index()
 
             # read ascii data
-            self.data = np.loadtxt(self.file, dtype=self.dtype, delimiter=',')
+            self.data = np.array([], dtype=self.dtype)
+            self._partial_line = ''
+            self.refresh()
         return
 
+    def refresh(self):
+        """
+        Read the observations that have been added to the file since it was
+        opened or last refreshed.  This can be used to read output from a
+        model that is still running.  An incomplete record at the end of the
+        file (a partially written binary record or a line that has not been
+        terminated) is not read until it has been completely written.
+
+        Returns
+        -------
+        ntimes : int
+            Number of times added to the data.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> obs = flopy.utils.Mf6Obs('model.obs.csv', isBinary=False)
+        >>> ntimes = obs.refresh()
+
+        """
+        if self.isBinary:
+            self.file.seek(0, 2)
+            nrec = (self.file.tell() - self._ipos_end) // self.dtype.itemsize
+            if nrec < 1:
+                return 0
+            self.file.seek(self._ipos_end, 0)
+            r = self.read_record(count=nrec)
+            self._ipos_end += nrec * self.dtype.itemsize
+        else:
+            lines = (self._partial_line + self.file.read()).split('\n')
+            self._partial_line = lines.pop()
+            lines = [line for line in lines if line.strip()]
+            if len(lines) < 1:
+                return 0
+            r = np.loadtxt(lines, dtype=self.dtype, delimiter=',', ndmin=1)
+        self.data = np.concatenate((self.data, r))
+        return r.shape[0]
+
+    def follow(self, interval=1., timeout=None):
+        """
+        Generator that yields the observations for each time in the file and
+        then waits for new times to be written to the file.  This can be
+        used to stream output from a model that is still running.
+
+        Parameters
+        ----------
+        interval : float
+            Seconds to wait before checking the file for new times.
+            (default is 1.)
+        timeout : float
+            Stop waiting if no times are added to the file for timeout
+            seconds.  If None, wait indefinitely. (default is None)
+
+        Yields
+        ------
+        totim : float
+            The simulation time.
+        data : numpy record
+            The observations at totim.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> obs = flopy.utils.Mf6Obs('model.obs.csv', isBinary=False)
+        >>> for totim, r in obs.follow(timeout=60.):
+        ...     print(totim, r)
+
+        """
+        itim = 0
+        tlast = time.time()
+        while True:
+            while itim < self.data.shape[0]:
+                yield self.data['totim'][itim], self.data[itim]
+                itim += 1
+            if self.refresh() > 0:
+                tlast = time.time()
+            elif timeout is not None and time.time() - tlast >= timeout:
+                break
+            else:
+                time.sleep(interval)
+
     def _build_dtype(self):
 
         # create dtype
@@ -12,6 +12,7 @@ import os
 import shutil
 import copy
 import numpy as np
+import warnings
 from warnings import warn
 from ..utils.binaryfile import BinaryHeader
 from ..utils.flopy_io import line_parse
@@ -432,6 +433,137 @@ def new_u2d(old_util2d, value):
     return new_util2d
 
 
+# ascii characters removed by str.strip()
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def _parse_int_text(text, nitems, num_items, dtype):
+    """
+    Parse the nitems integers in text, each followed by a comma, with
+    numpy's C parser and return the first num_items as dtype.  The parser
+    stops at the first item that is not an integer followed by a comma,
+    so the sentinel value added to the end of text is only reached if every
+    item is valid.  None is returned if an item is not valid or a value
+    does not fit in dtype.
+
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            data = np.fromstring(text + '0', dtype=np.int64, sep=',')
+        except ValueError:
+            return None
+    if data.size != nitems + 1:
+        return None
+    data = data[:num_items]
+    info = np.iinfo(dtype)
+    if data.size > 0 and (data.min() < info.min or data.max() > info.max):
+        return None
+    return data.astype(dtype)
+
+
+def _load_txt_free(file_in, num_items, dtype):
+    """
+    Read free format items until num_items have been found.
+
+    """
+    items = []
+    while len(items) < num_items:
+        line = file_in.readline()
+        if len(line) == 0:
+            raise ValueError('Util2d.load_txt(): no data found')
+        if ',' in line:
+            line = line.replace(',', ' ')
+        if '*' in line:  # use slower method for these types of lines
+            for item in line.split():
+                if '*' in item:
+                    num, val = item.split('*')
+                    # repeat val num times
+                    items += int(num) * [val]
+                else:
+                    items.append(item)
+        else:
+            items += line.split()
+    data = None
+    if np.dtype(dtype).kind in 'iu':
+        data = _parse_int_text(','.join(items) + ',', len(items), num_items,
+                               dtype)
+    if data is None:
+        data = np.fromiter(items, dtype=dtype, count=num_items)
+    return data
+
+
+def _load_txt_fixed(file_in, num_items, dtype, npl, width):
+    """
+    Read fixed width items until num_items non-blank fields have been
+    found.  The fields are cut from all of the lines at once.
+
+    """
+    linewidth = npl * width
+    lines = []
+    fields = []
+    nitems = 0
+    while nitems < num_items:
+        # read lines until the number of fields up to the last non-blank
+        # character, which is at least the number of non-blank fields,
+        # reaches num_items
+        new_lines = []
+        nmax = nitems
+        while nmax < num_items:
+            line = file_in.readline()
+            if len(line) == 0:
+                raise ValueError('Util2d.load_txt(): no data found')
+            new_lines.append(line)
+            nmax += min(npl, -(-len(line.rstrip()) // width))
+        lines += new_lines
+        if fields is not None:
+            text = ''.join(line.rstrip('\n')[:linewidth].ljust(linewidth)
+                           for line in new_lines)
+            try:
+                buf = text.encode('ascii')
+            except UnicodeEncodeError:
+                fields = None
+        if fields is None:
+            nitems += sum(len(Util2d._fixed_width_items(line, npl, width))
+                          for line in new_lines)
+        else:
+            new_fields = np.frombuffer(buf, dtype=np.uint8).reshape(-1,
+                                                                    width)
+            new_fields = new_fields[
+                ~_ASCII_WHITESPACE[new_fields].all(axis=1)]
+            fields.append(new_fields)
+            nitems += new_fields.shape[0]
+
+    def get_items():
+        items = []
+        for line in lines:
+            items += Util2d._fixed_width_items(line, npl, width)
+        return items
+
+    data = None
+    if fields is not None:
+        fields = np.concatenate(fields) if fields else \
+            np.empty((0, width), dtype=np.uint8)
+        if np.dtype(dtype).kind in 'iu':
+            # follow each field with a comma for the parser
+            text = np.empty((fields.shape[0], width + 1), dtype=np.uint8)
+            text[:, :width] = fields
+            text[:, width] = ord(',')
+            data = _parse_int_text(text.tobytes().decode('ascii'), nitems,
+                                   num_items, dtype)
+        else:
+            try:
+                items = fields.view('S{}'.format(width)).ravel().tolist()
+                data = np.fromiter(items, dtype=dtype, count=num_items)
+            except ValueError:
+                data = None
+    if data is None:
+        # repeat with the str items to raise the same errors
+        data = np.fromiter(get_items(), dtype=dtype, count=num_items)
+    return data
+
+
 class Util3d(DataInterface):
     """
     Util3d class for handling 3-D model arrays.  just a thin wrapper around
@@ -2384,43 +2516,30 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, 'r')
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
-                raise ValueError('Util2d.load_txt(): no data found')
-            if npl == 'free':
-                if ',' in line:
-                    line = line.replace(',', ' ')
-                if '*' in line:  # use slower method for these types of lines
-                    for item in line.split():
-                        if '*' in item:
-                            num, val = item.split('*')
-                            # repeat val num times
-                            items += int(num) * [val]
-                        else:
-                            items.append(item)
-                else:
-                    items += line.split()
-            else:  # fixed width
-                pos = 0
-                for i in range(npl):
-                    try:
-                        item = line[pos:pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
+        if npl == 'free':
+            data = _load_txt_free(file_in, num_items, dtype)
+        else:  # fixed width
+            data = _load_txt_fixed(file_in, num_items, dtype, npl, width)
         if openfile:
             file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
         if data.size != num_items:
             raise ValueError('Util2d.load_txt(): expected array size {0},'
                              ' but found size {1}'.format(num_items,
                                                           data.size))
         return data.reshape(shape)
 
+    @staticmethod
+    def _fixed_width_items(line, npl, width):
+        """Return the non-blank fixed width fields of a line"""
+        items = []
+        pos = 0
+        for i in range(npl):
+            item = line[pos:pos + width].strip()
+            pos += width
+            if item:
+                items.append(item)
+        return items
+
     @staticmethod
     def write_txt(shape, file_out, data, fortran_format="(FREE)",
                   python_format=None):
@@ -2429,11 +2548,15 @@ class Util2d(DataInterface):
                        ArrayFormat.get_default_numpy_fmt(data.dtype),
                        delimiter='')
             return
-        if not hasattr(file_out, "write"):
+        openfile = not hasattr(file_out, "write")
+        if openfile:
             file_out = open(file_out, 'w')
-        file_out.write(
-            Util2d.array2string(shape, data, fortran_format=fortran_format,
+        # write one row at a time instead of building the whole string
+        file_out.writelines(
+            Util2d._array2lines(shape, data, fortran_format=fortran_format,
                                 python_format=python_format))
+        if openfile:
+            file_out.close()
 
     @staticmethod
     def array2string(shape, data, fortran_format="(FREE)",
@@ -2446,6 +2569,19 @@ class Util2d(DataInterface):
         this routine now supports fixed format arrays where the numbers
         may touch.
         """
+        return ''.join(Util2d._array2lines(shape, data,
+                                           fortran_format=fortran_format,
+                                           python_format=python_format))
+
+    @staticmethod
+    def _array2lines(shape, data, fortran_format="(FREE)",
+                     python_format=None):
+        """
+        Generator that yields the string representation of each row of the
+        array written by array2string, wrapped at column_length values per
+        line.  Each row is formatted with a single pass over its values, so
+        the time is linear in the size of the array.
+        """
         if len(shape) == 2:
             nrow, ncol = shape
         else:
@@ -2475,22 +2611,32 @@ class Util2d(DataInterface):
             linereturnflag = False
         else:
             linereturnflag = True
-        # write the array to a string
-        s = ""
+        # a line ends after every column_length values, except after the
+        # first value of a row when column_length is 1
+        ends = list(range(column_length, ncol + 1, column_length))
+        if column_length == 1 and ncol > 1:
+            ends = ends[1:]
+        starts = [0] + ends
+        if linereturnflag or not ends or ends[-1] != ncol:
+            ends = ends + [ncol]
+        newlines = ['\n'] * (len(starts) - 1) + \
+                   ['\n' if linereturnflag else '']
+        # write the array one row at a time
         for i in range(nrow):
-            icol = 0
-            for j in range(ncol):
-                try:
-                    s = s + output_fmt.format(data[i, j])
-                except Exception as e:
-                    raise Exception("error writing array value" + \
-                                    "{0} at r,c [{1},{2}]\n{3}".format(
-                                        data[i, j], i, j, str(e)))
-                if (j + 1) % column_length == 0.0 and (j != 0 or ncol == 1):
-                    s += '\n'
-            if linereturnflag:
-                s += '\n'
-        return s
+            row = data[i, :ncol]
+            try:
+                values = list(map(output_fmt.format, row.tolist()))
+            except Exception:
+                for j in range(ncol):
+                    try:
+                        output_fmt.format(data[i, j])
+                    except Exception as e:
+                        raise Exception("error writing array value" + \
+                                        "{0} at r,c [{1},{2}]\n{3}".format(
+                                            data[i, j], i, j, str(e)))
+                raise
+            yield ''.join([''.join(values[j0:j1]) + newline for j0, j1, newline
+                           in zip(starts, ends, newlines)])
 
     @staticmethod
     def load_bin(shape, file_in, dtype, bintype=None):
@@ -10,6 +10,8 @@ util_list module.  Contains the mflist class.
 from __future__ import division, print_function
 
 import os
+import re
+import hashlib
 import warnings
 import numpy as np
 from ..datbase import DataInterface, DataListInterface, DataType
@@ -20,6 +22,9 @@ try:
 except ImportError:
     numpy114 = False
 
+# number of records formatted at a time when writing list data
+DEFAULT_CHUNK_ROWS = 2 ** 16
+
 
 class MfList(DataInterface, DataListInterface):
     """
@@ -43,7 +48,9 @@ class MfList(DataInterface, DataListInterface):
     add_record(kper,index,value) : None
         add a record to stress period kper at index location
     write_transient(f) : None
-        write the transient sequence to the model input file f
+        write the transient sequence to the model input file f.  stress
+        periods that are identical to the previous stress period are
+        written as a reuse flag (itmp = -1)
     check_kij() : None
         checks for boundaries outside of model domain - issues warnings only
 
@@ -52,6 +59,12 @@ class MfList(DataInterface, DataListInterface):
 
     Notes
     -----
+    write_transient() writes a stress period that is identical to the
+    previous stress period as a reuse flag (itmp = -1) instead of writing
+    the list again, so package files written by flopy are shorter than
+    the package files written by earlier versions, but define the same
+    boundary conditions.  Stress periods are compared with an md5 hash of
+    the data and, if the hashes match, element by element.
 
     Examples
     --------
@@ -643,6 +656,7 @@ class MfList(DataInterface, DataListInterface):
                 single_per = [single_per]
             loop_over_kpers = single_per
 
+        prev_hash, prev_data = None, None
         for kper in loop_over_kpers:
             # Fill missing early kpers with 0
             if kper < first:
@@ -665,6 +679,20 @@ class MfList(DataInterface, DataListInterface):
                 itmp = -1
                 kper_vtype = int
 
+            # reuse the previous stress period if the data are identical.
+            # not done for single stress periods since the caller controls
+            # the file layout
+            kper_hash = None
+            if single_per is None and kper_vtype == np.recarray:
+                kper_hash = self.__hash_data(kper_data)
+                if kper_hash is not None and kper_hash == prev_hash and \
+                        np.array_equal(kper_data, prev_data):
+                    itmp = -1
+                    kper_vtype = int
+            if kper_vtype != int or itmp >= 0:
+                prev_hash = kper_hash
+                prev_data = kper_data if kper_hash is not None else None
+
             f.write(" {0:9d} {1:9d} # stress period {2:d}\n"
                     .format(itmp, 0, kper + 1))
 
@@ -696,7 +724,7 @@ class MfList(DataInterface, DataListInterface):
 
             if kper_vtype == np.recarray:
                 name = f.name
-                if self.__binary or not numpy114:
+                if self.__binary:
                     f.close()
                     # switch file append mode to binary
                     with open(name, 'ab+') as f:
@@ -711,27 +739,61 @@ class MfList(DataInterface, DataListInterface):
                     f.write(' (BINARY)')
                 f.write('\n')
 
+    @staticmethod
+    def __hash_data(data):
+        # hash of the stress period data used to find repeated stress
+        # periods.  object fields and empty stress periods are not hashed
+        if data.shape[0] == 0 or data.dtype.hasobject:
+            return None
+        return data.shape, hashlib.md5(data.tobytes()).hexdigest()
+
     def __tofile(self, f, data):
         # Write the recarray (data) to the file (or file handle) f
         assert isinstance(data, np.recarray), "MfList.__tofile() data arg " + \
                                               "not a recarray"
+        if not hasattr(f, 'write'):
+            mode = 'wb' if self.__binary else 'w'
+            with open(f, mode) as fd:
+                self.__tofile(fd, data)
+            return
 
-        # Add one to the kij indices
+        # one is added to the kij indices of each chunk of records so
+        # that the data never has to be copied
         lnames = [name.lower() for name in self.dtype.names]
-        # --make copy of data for multiple calls
-        d = data.copy()
-        for idx in ['k', 'i', 'j', 'node']:
-            if idx in lnames:
-                d[idx] += 1
+        index_names = [idx for idx in ['k', 'i', 'j', 'node']
+                       if idx in lnames]
+        nrec = data.shape[0]
         if self.__binary:
             dtype2 = []
             for name in self.dtype.names:
                 dtype2.append((name, np.float32))
             dtype2 = np.dtype(dtype2)
-            d = np.array(d, dtype=dtype2)
-            d.tofile(f)
+            for start in range(0, nrec, DEFAULT_CHUNK_ROWS):
+                d = np.array(data[start:start + DEFAULT_CHUNK_ROWS],
+                             dtype=dtype2)
+                for idx in index_names:
+                    d[idx] += 1
+                d.tofile(f)
         else:
-            np.savetxt(f, d, fmt=self.fmt_string, delimiter='')
+            fmt_string = self.fmt_string
+            # floats written with %s must use the numpy representation of
+            # their own precision, python floats are always double
+            fmts = re.findall(r'%[^a-zA-Z%]*[a-zA-Z]', fmt_string)
+            as_str = [fmt[-1] == 's' and data.dtype[name].kind == 'f' and
+                      data.dtype[name] != np.float64
+                      for name, fmt in zip(data.dtype.names, fmts)]
+            fmt_string += '\n'
+            for start in range(0, nrec, DEFAULT_CHUNK_ROWS):
+                columns = []
+                for name, col_as_str in zip(data.dtype.names, as_str):
+                    column = data[name][start:start + DEFAULT_CHUNK_ROWS]
+                    if name in index_names:
+                        column = column + 1
+                    elif col_as_str:
+                        column = column.astype(str)
+                    columns.append(column.tolist())
+                f.write(''.join([fmt_string % rec
+                                 for rec in zip(*columns)]))
 
     def check_kij(self):
         names = self.dtype.names